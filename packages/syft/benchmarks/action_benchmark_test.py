@@ -0,0 +1,24 @@
+# third party
+import numpy as np
+
+# syft absolute
+from syft.service.action.action_object import ActionObject
+from syft.service.action.action_object import ActionType
+from syft.service.context import AuthedServiceContext
+
+
+def test_action_execute(benchmark, worker) -> None:
+    benchmark.group = "action.execute"
+    service = worker.get_service("actionservice")
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.root_client.credentials.verify_key
+    )
+
+    obj = ActionObject.from_obj(np.random.rand(100, 100))
+    assert service.set(context, obj).is_ok()
+    action = obj.syft_make_action_with_self(
+        op="__add__", args=[obj.syft_lineage_id], action_type=ActionType.METHOD
+    )
+
+    result = benchmark(service.execute, context, action)
+    assert result.is_ok()
@@ -0,0 +1,104 @@
+# stdlib
+from pathlib import Path
+import tempfile
+from typing import Generator
+from uuid import uuid4
+
+# third party
+from pymongo import MongoClient
+import pytest
+from pytest_mock_resources import create_mongo_fixture
+
+# syft absolute
+import syft as sy
+from syft.node.credentials import SyftSigningKey
+from syft.node.credentials import SyftVerifyKey
+from syft.store.dict_document_store import DictStoreConfig
+from syft.store.dict_document_store import DictStorePartition
+from syft.store.document_store import PartitionSettings
+from syft.store.document_store import StorePartition
+from syft.store.locks import ThreadingLockingConfig
+from syft.store.mongo_client import MongoStoreClientConfig
+from syft.store.mongo_document_store import MongoStoreConfig
+from syft.store.mongo_document_store import MongoStorePartition
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
+from syft.store.sqlite_document_store import SQLiteStorePartition
+
+# relative
+from .objects import BenchmarkObject
+
+# mongomock can't take the bson type registry of the mongo store, the mongo
+# backend runs against the same dockerized server as the store tests
+mongo_server_mock = create_mongo_fixture(scope="session")
+
+STORE_BACKENDS = ["dict", "sqlite", "mongo"]
+
+
+@pytest.fixture(scope="session")
+def root_verify_key() -> SyftVerifyKey:
+    return SyftSigningKey.generate().verify_key
+
+
+@pytest.fixture
+def worker() -> Generator:
+    worker = sy.Worker.named(name=f"benchmark-{uuid4()}")
+    yield worker
+    worker.document_store.reset()
+
+
+@pytest.fixture
+def root_client(worker):
+    return worker.root_client
+
+
+def partition_settings() -> PartitionSettings:
+    return PartitionSettings(name="BenchmarkObject", object_type=BenchmarkObject)
+
+
+@pytest.fixture(params=STORE_BACKENDS)
+def store_partition(root_verify_key, request) -> Generator:
+    """An initialized KeyValueStorePartition, or the MongoStorePartition, of
+    `BenchmarkObject` with threading locks like a node uses."""
+    locking_config = ThreadingLockingConfig()
+
+    if request.param == "dict":
+        store_config = DictStoreConfig(locking_config=locking_config)
+        partition: StorePartition = DictStorePartition(
+            root_verify_key, settings=partition_settings(), store_config=store_config
+        )
+        assert partition.init_store().is_ok()
+        yield partition
+
+    elif request.param == "sqlite":
+        with tempfile.TemporaryDirectory() as workspace:
+            client_config = SQLiteStoreClientConfig(
+                filename="benchmark.sqlite", path=Path(workspace)
+            )
+            store_config = SQLiteStoreConfig(
+                client_config=client_config, locking_config=locking_config
+            )
+            partition = SQLiteStorePartition(
+                root_verify_key,
+                settings=partition_settings(),
+                store_config=store_config,
+            )
+            assert partition.init_store().is_ok()
+            yield partition
+
+    else:
+        mongo_server = request.getfixturevalue("mongo_server_mock")
+        mongo_kwargs = mongo_server.pmr_credentials.as_mongo_kwargs()
+        db_name = f"benchmark_{uuid4().hex}"
+        client_config = MongoStoreClientConfig(client=MongoClient(**mongo_kwargs))
+        store_config = MongoStoreConfig(
+            client_config=client_config,
+            db_name=db_name,
+            locking_config=locking_config,
+        )
+        partition = MongoStorePartition(
+            root_verify_key, settings=partition_settings(), store_config=store_config
+        )
+        assert partition.init_store().is_ok()
+        yield partition
+        MongoClient(**mongo_kwargs).drop_database(db_name)
@@ -0,0 +1,38 @@
+# third party
+import numpy as np
+
+# syft absolute
+from syft.service.action.action_object import ActionObject
+from syft.service.user.user import UserCreate
+
+
+def test_api_call_metadata(benchmark, root_client) -> None:
+    benchmark.group = "api"
+    benchmark(root_client.api.services.settings.get)
+
+
+def test_api_call_get_all(benchmark, root_client) -> None:
+    benchmark.group = "api"
+    for i in range(20):
+        user_create = UserCreate(
+            email=f"user{i}@openmined.org",
+            name=f"user{i}",
+            password="password",
+            password_verify="password",
+        )
+        root_client.api.services.user.create(user_create=user_create)
+
+    result = benchmark(root_client.api.services.user.get_all)
+    assert len(result) > 20
+
+
+def test_api_call_action_roundtrip(benchmark, root_client) -> None:
+    benchmark.group = "api"
+    obj = ActionObject.from_obj(np.random.rand(1000, 100))
+
+    def roundtrip():
+        pointer = root_client.api.services.action.set(obj)
+        return root_client.api.services.action.get(pointer.id)
+
+    result = benchmark(roundtrip)
+    assert (result.syft_action_data == obj.syft_action_data).all()
@@ -0,0 +1,70 @@
+# stdlib
+from typing import List
+
+# third party
+import numpy as np
+import pandas as pd
+
+# syft absolute
+from syft.serde.serializable import serializable
+from syft.service.action.action_object import ActionObject
+from syft.service.dataset.dataset import Asset
+from syft.service.dataset.dataset import Dataset
+from syft.service.response import SyftError
+from syft.service.user.user import User
+from syft.store.document_store import PartitionKey
+from syft.types.datetime import DateTime
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
+
+
+@serializable()
+class BenchmarkObject(SyftObject):
+    __canonical_name__ = "BenchmarkObject"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    name: str
+    value: int
+    payload: List[float]
+
+    __attr_searchable__ = ["name"]
+
+
+NamePartitionKey = PartitionKey(key="name", type_=str)
+
+
+def make_benchmark_objects(n: int) -> List[BenchmarkObject]:
+    return [
+        BenchmarkObject(name=f"object_{i % 10}", value=i, payload=[0.5] * 16)
+        for i in range(n)
+    ]
+
+
+def make_dataset() -> Dataset:
+    asset = Asset(
+        name="asset",
+        description="",
+        contributors=[],
+        mock_is_real=False,
+        shape=(100, 10),
+        action_id=UID(),
+        node_uid=UID(),
+    )
+    return Dataset(name="dataset", asset_list=[asset] * 4)
+
+
+# representative payloads of the API, keyed by the benchmark id
+SERDE_OBJECTS = {
+    "uid": UID(),
+    "datetime": DateTime.now(),
+    "user": User(email="info@openmined.org", name="name"),
+    "syft_error": SyftError(message="error"),
+    "dataset": make_dataset(),
+    "uid_list": [UID() for _ in range(1000)],
+    "object_list": make_benchmark_objects(1000),
+    "float_array": np.random.rand(1_000_000),
+    "string_array": np.array([f"word{i}" for i in range(100_000)]),
+    "dataframe": pd.DataFrame(np.random.rand(10_000, 10)),
+    "action_object": ActionObject.from_obj(np.random.rand(1000, 100)),
+}
@@ -0,0 +1,22 @@
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+
+# relative
+from .objects import SERDE_OBJECTS
+
+
+@pytest.mark.parametrize("name", SERDE_OBJECTS.keys())
+def test_serialize(benchmark, name: str) -> None:
+    benchmark.group = "serialize"
+    benchmark(sy.serialize, SERDE_OBJECTS[name], to_bytes=True)
+
+
+@pytest.mark.parametrize("name", SERDE_OBJECTS.keys())
+def test_deserialize(benchmark, name: str) -> None:
+    benchmark.group = "deserialize"
+    blob = sy.serialize(SERDE_OBJECTS[name], to_bytes=True)
+    benchmark.extra_info["size"] = len(blob)
+    benchmark(sy.deserialize, blob, from_bytes=True)
@@ -0,0 +1,84 @@
+# third party
+import pytest
+
+# syft absolute
+from syft.store.document_store import QueryKeys
+from syft.store.document_store import StorePartition
+
+# relative
+from .objects import NamePartitionKey
+from .objects import make_benchmark_objects
+
+# objects in the partition for the read benchmarks
+PARTITION_SIZE = 100
+
+
+@pytest.fixture
+def filled_partition(root_verify_key, store_partition: StorePartition):
+    objects = make_benchmark_objects(PARTITION_SIZE)
+    for obj in objects:
+        assert store_partition.set(root_verify_key, obj).is_ok()
+    return store_partition, objects
+
+
+def test_set(benchmark, root_verify_key, store_partition: StorePartition) -> None:
+    benchmark.group = "store.set"
+    objects = iter(make_benchmark_objects(PARTITION_SIZE * 10))
+
+    def setup():
+        return (root_verify_key, next(objects)), {}
+
+    benchmark.pedantic(store_partition.set, setup=setup, rounds=PARTITION_SIZE)
+
+
+def test_set_many(benchmark, root_verify_key, store_partition: StorePartition) -> None:
+    benchmark.group = "store.set_many"
+    batches = iter(
+        [make_benchmark_objects(PARTITION_SIZE) for _ in range(5)],
+    )
+
+    def setup():
+        return (root_verify_key, next(batches)), {}
+
+    benchmark.extra_info["batch_size"] = PARTITION_SIZE
+    benchmark.pedantic(store_partition.set_many, setup=setup, rounds=5)
+
+
+def test_get(benchmark, root_verify_key, filled_partition) -> None:
+    benchmark.group = "store.get"
+    partition, objects = filled_partition
+
+    result = benchmark(partition.get, root_verify_key, objects[-1].id)
+    assert result.is_ok()
+
+
+def test_all(benchmark, root_verify_key, filled_partition) -> None:
+    benchmark.group = "store.all"
+    partition, _ = filled_partition
+
+    result = benchmark(partition.all, root_verify_key)
+    assert len(result.ok()) == PARTITION_SIZE
+
+
+def test_query(benchmark, root_verify_key, filled_partition) -> None:
+    benchmark.group = "store.query"
+    partition, _ = filled_partition
+    search_qks = QueryKeys(qks=[NamePartitionKey.with_obj("object_1")])
+
+    result = benchmark(
+        partition.find_index_or_search_keys,
+        root_verify_key,
+        index_qks=QueryKeys(qks=[]),
+        search_qks=search_qks,
+    )
+    assert len(result.ok()) == PARTITION_SIZE // 10
+
+
+def test_update(benchmark, root_verify_key, filled_partition) -> None:
+    benchmark.group = "store.update"
+    partition, objects = filled_partition
+    obj = objects[0]
+    qk = partition.settings.store_key.with_obj(obj.id)
+
+    result = benchmark(partition.update, root_verify_key, qk, obj)
+    assert result.is_ok()
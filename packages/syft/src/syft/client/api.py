@@ -26,6 +26,7 @@ from typeguard import check_type
 from ..abstract_node import AbstractNode
 from ..node.credentials import SyftSigningKey
 from ..node.credentials import SyftVerifyKey
+from ..serde.compression import compression_transport
 from ..serde.deserialize import _deserialize
 from ..serde.recursive import index_syft_by_module_name
 from ..serde.serializable import serializable
@@ -439,7 +440,8 @@ class SyftAPI(SyftObject):
         )
 
     def make_call(self, api_call: SyftAPICall) -> Result:
-        signed_call = api_call.sign(credentials=self.signing_key)
+        with compression_transport(self.connection.compression_transport):
+            signed_call = api_call.sign(credentials=self.signing_key)
         signed_result = self.connection.make_call(signed_call)
 
         if not isinstance(signed_result, SignedSyftAPICall):
@@ -6,6 +6,7 @@ from enum import Enum
 import hashlib
 import json
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import Optional
 from typing import TYPE_CHECKING
@@ -30,9 +31,13 @@ from ..img.base64 import base64read
 from ..node.credentials import SyftSigningKey
 from ..node.credentials import SyftVerifyKey
 from ..node.credentials import UserLoginCredentials
+from ..serde.compression import CompressionTransport
+from ..serde.compression import compression_transport
 from ..serde.deserialize import _deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..serde.stream import STREAM_MEDIA_TYPE
+from ..serde.stream import iter_serialized
 from ..service.context import NodeServiceContext
 from ..service.dataset.dataset import CreateDataset
 from ..service.metadata.node_metadata import NodeMetadata
@@ -102,6 +107,10 @@ class HTTPConnection(NodeConnection):
     url: GridURL
     routes: Type[Routes] = Routes
     session_cache: Optional[Session]
+    # whether the node reads streamed calls, None until it answered one
+    stream_calls: Optional[bool] = None
+
+    compression_transport: ClassVar[CompressionTransport] = CompressionTransport.HTTP
 
     @pydantic.validator("url", pre=True, always=True)
     def make_url(cls, v: Union[GridURL, str]) -> GridURL:
@@ -207,10 +216,21 @@ class HTTPConnection(NodeConnection):
         return response
 
     def make_call(self, signed_call: SignedSyftAPICall) -> Union[Any, SyftError]:
-        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+        if self.stream_calls:
+            # both directions are streamed, large buffers are sent straight from
+            # the memory of the objects and read back one at a time
+            data: Any = iter_serialized(signed_call)
+            content_type = STREAM_MEDIA_TYPE
+        else:
+            # nodes which don't read streamed calls only take their bytes, the
+            # nodes which do answer with a stream when it is accepted
+            data = _serialize(signed_call, to_bytes=True)
+            content_type = "application/octet-stream"
         response = requests.post(  # nosec
             url=str(self.api_url),
-            data=msg_bytes,
+            data=data,
+            headers={"Content-Type": content_type, "Accept": STREAM_MEDIA_TYPE},
+            stream=True,
         )
 
         if response.status_code != 200:
@@ -218,7 +238,15 @@ class HTTPConnection(NodeConnection):
                 f"Failed to fetch metadata. Response returned with code {response.status_code}"
             )
 
-        result = _deserialize(response.content, from_bytes=True)
+        streamed = response.headers.get("content-type", "").startswith(
+            STREAM_MEDIA_TYPE
+        )
+        self.stream_calls = streamed
+        if streamed:
+            response.raw.decode_content = True
+            result = _deserialize(response.raw, from_stream=True)
+        else:
+            result = _deserialize(response.content, from_bytes=True)
         return result
 
     def __repr__(self) -> str:
@@ -239,6 +267,8 @@ class PythonConnection(NodeConnection):
     node: AbstractNode
     proxy_target_uid: Optional[UID]
 
+    compression_transport: ClassVar[CompressionTransport] = CompressionTransport.PYTHON
+
     def with_proxy(self, proxy_target_uid: UID) -> Self:
         return PythonConnection(node=self.node, proxy_target_uid=proxy_target_uid)
 
@@ -296,7 +326,8 @@ class PythonConnection(NodeConnection):
         return response
 
     def make_call(self, signed_call: SignedSyftAPICall) -> Union[Any, SyftError]:
-        return self.node.handle_api_call(signed_call)
+        with compression_transport(CompressionTransport.PYTHON):
+            return self.node.handle_api_call(signed_call)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}"
@@ -387,6 +418,7 @@ class SyftClient:
 
     def upload_dataset(self, dataset: CreateDataset) -> Union[SyftSuccess, SyftError]:
         # relative
+        from ..service.action.action_upload import upload_action_object
         from ..types.twin_object import TwinObject
 
         dataset._check_asset_must_contain_mock()
@@ -398,11 +430,14 @@ class SyftClient:
                 twin = TwinObject(private_obj=asset.data, mock_obj=asset.mock)
             except Exception as e:
                 return SyftError(message=f"Failed to create twin. {e}")
-            response = self.api.services.action.set(twin)
+            if asset.action_id is not None and asset.node_uid is None:
+                # the upload of the asset was interrupted, it is resumed
+                twin.id = asset.action_id
+            asset.action_id = twin.id
+            response = upload_action_object(self.api.services.action, twin)
             if isinstance(response, SyftError):
                 print(f"Failed to upload asset\n: {asset}")
                 return response
-            asset.action_id = twin.id
             asset.node_uid = self.id
             dataset_size += get_mb_size(asset.data)
         dataset.mb_size = dataset_size
@@ -1,7 +1,9 @@
 # stdlib
 from typing import Any
+from typing import ClassVar
 
 # relative
+from ..serde.compression import CompressionTransport
 from ..types.syft_object import SYFT_OBJECT_VERSION_1
 from ..types.syft_object import SyftObject
 
@@ -10,6 +12,9 @@ class NodeConnection(SyftObject):
     __canonical_name__ = "NodeConnection"
     __version__ = SYFT_OBJECT_VERSION_1
 
+    # picks the compression policy for the calls made through this connection
+    compression_transport: ClassVar[CompressionTransport] = CompressionTransport.DEFAULT
+
     def get_cache_key() -> str:
         raise NotImplementedError
 
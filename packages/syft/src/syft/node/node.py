@@ -50,6 +50,7 @@ from ..service.context import UserLoginCredentials
 from ..service.data_subject.data_subject_member_service import DataSubjectMemberService
 from ..service.data_subject.data_subject_service import DataSubjectService
 from ..service.dataset.dataset_service import DatasetService
+from ..service.diagnostics.diagnostics_service import DiagnosticsService
 from ..service.message.message_service import MessageService
 from ..service.metadata.node_metadata import NodeMetadata
 from ..service.network.network_service import NetworkService
@@ -76,6 +77,7 @@ from ..service.user.user_service import UserService
 from ..service.user.user_stash import UserStash
 from ..store.dict_document_store import DictStoreConfig
 from ..store.document_store import StoreConfig
+from ..store.locks import LOCK_WATCHDOG
 from ..store.sqlite_document_store import SQLiteStoreClientConfig
 from ..store.sqlite_document_store import SQLiteStoreConfig
 from ..types.syft_object import HIGHEST_SYFT_OBJECT_VERSION
@@ -209,6 +211,7 @@ class Node(AbstractNode):
                 MessageService,
                 DataSubjectMemberService,
                 ProjectService,
+                DiagnosticsService,
             ]
             if services is None
             else services
@@ -232,6 +235,13 @@ class Node(AbstractNode):
         self.services = services
         self._construct_services()
 
+        if UserService in self.services:
+            # the permissions granted to a role apply to the users with that role
+            user_service = self.get_service(UserService)
+            role_resolver = user_service.get_role_for_credentials
+            self.document_store.set_role_resolver(role_resolver)
+            self.action_store.set_role_resolver(role_resolver)
+
         create_admin_new(  # nosec B106
             name="Jane Doe",
             email=root_email,
@@ -421,6 +431,9 @@ class Node(AbstractNode):
         self.action_store_config = action_store_config
         self.queue_stash = QueueStash(store=self.document_store)
 
+        # logs the stacks of the threads holding a store lock for too long
+        LOCK_WATCHDOG.start()
+
     def _construct_services(self):
         self.service_path_map = {}
 
@@ -1,5 +1,6 @@
 # stdlib
 from typing import Dict
+from typing import Union
 
 # third party
 from fastapi import APIRouter
@@ -8,14 +9,22 @@ from fastapi import Depends
 from fastapi import Request
 from fastapi import Response
 from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import ValidationError
 from typing_extensions import Annotated
 
 # relative
 from ..abstract_node import AbstractNode
+from ..serde.compression import CompressionTransport
+from ..serde.compression import compression_transport
 from ..serde.deserialize import _deserialize as deserialize
 from ..serde.serialize import _serialize as serialize
+from ..serde.stream import Frames
+from ..serde.stream import STREAM_MEDIA_TYPE
+from ..serde.stream import async_read_frames
+from ..serde.stream import deserialize_frames
+from ..serde.stream import iter_serialized
 from ..service.context import NodeServiceContext
 from ..service.context import UnauthedServiceContext
 from ..service.metadata.node_metadata import NodeMetadataJSON
@@ -40,6 +49,13 @@ def make_routes(worker: Worker) -> APIRouter:
     async def get_body(request: Request) -> bytes:
         return await request.body()
 
+    async def get_body_frames(request: Request) -> Union[bytes, Frames]:
+        # streamed bodies are read frame by frame, so large out-of-band buffers
+        # are never concatenated into a single request body
+        if request.headers.get("content-type", "").startswith(STREAM_MEDIA_TYPE):
+            return await async_read_frames(request.stream())
+        return await request.body()
+
     @router.get(
         "/",
         name="healthcheck",
@@ -88,9 +104,18 @@ def make_routes(worker: Worker) -> APIRouter:
         else:
             return handle_syft_new_api(user_verify_key)
 
-    def handle_new_api_call(data: bytes) -> Response:
-        obj_msg = deserialize(blob=data, from_bytes=True)
-        result = worker.handle_api_call(api_call=obj_msg)
+    def handle_new_api_call(data: Union[bytes, Frames], stream: bool) -> Response:
+        if isinstance(data, bytes):
+            obj_msg = deserialize(blob=data, from_bytes=True)
+        else:
+            obj_msg = deserialize_frames(data)
+        with compression_transport(CompressionTransport.HTTP):
+            result = worker.handle_api_call(api_call=obj_msg)
+        if stream:
+            return StreamingResponse(
+                (bytes(chunk) for chunk in iter_serialized(result)),
+                media_type=STREAM_MEDIA_TYPE,
+            )
         return Response(
             serialize(result, to_bytes=True),
             media_type="application/octet-stream",
@@ -99,17 +124,19 @@ def make_routes(worker: Worker) -> APIRouter:
     # make a request to the SyftAPI
     @router.post("/api_call")
     def syft_new_api_call(
-        request: Request, data: Annotated[bytes, Depends(get_body)]
+        request: Request,
+        data: Annotated[Union[bytes, Frames], Depends(get_body_frames)],
     ) -> Response:
+        stream = STREAM_MEDIA_TYPE in request.headers.get("accept", "")
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api_call.__module__).start_as_current_span(
                 syft_new_api_call.__qualname__,
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_new_api_call(data)
+                return handle_new_api_call(data, stream)
         else:
-            return handle_new_api_call(data)
+            return handle_new_api_call(data, stream)
 
     def handle_login(email: str, password: str, node: AbstractNode) -> Response:
         try:
@@ -151,5 +151,28 @@ recursive_serde_register(
 # )
 
 
+def serialize_numpy_temporal(x: np.generic) -> bytes:
+    # the int64 count of the unit followed by the dtype which has the unit
+    return x.view(np.int64).tobytes() + x.dtype.str.encode()
+
+
+def deserialize_numpy_temporal(buffer: bytes) -> np.generic:
+    dtype = np.dtype(buffer[8:].decode())
+    return frombuffer(buffer[:8], dtype=np.int64).view(dtype)[0]
+
+
+recursive_serde_register(
+    np.datetime64,
+    serialize=serialize_numpy_temporal,
+    deserialize=deserialize_numpy_temporal,
+)
+
+recursive_serde_register(
+    np.timedelta64,
+    serialize=serialize_numpy_temporal,
+    deserialize=deserialize_numpy_temporal,
+)
+
+
 # how else do you import a relative file to execute it?
 NOTHING = None
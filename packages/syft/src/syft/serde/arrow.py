@@ -1,5 +1,5 @@
 # stdlib
-from typing import Union
+from typing import Optional
 from typing import cast
 
 # third party
@@ -9,50 +9,172 @@ import pyarrow as pa
 # relative
 from ..util.experimental_flags import ApacheArrowCompression
 from ..util.experimental_flags import flags
+from .compression import compress
+from .compression import decompress
 from .deserialize import _deserialize
 from .serialize import _serialize
 
 
+def _decompress(
+    numpy_bytes: bytes, decompressed_size: int, codec: Optional[str]
+) -> pa.Buffer:
+    if codec is None:
+        # payloads written before the codec was recorded use the global flag
+        compression = flags.APACHE_ARROW_COMPRESSION
+    else:
+        compression = ApacheArrowCompression[codec]
+    return decompress(numpy_bytes, decompressed_size, compression)
+
+
 def arrow_serialize(obj: np.ndarray) -> bytes:
     original_dtype = obj.dtype
+    if original_dtype.kind in TEMPORAL_KINDS:
+        # arrow tensors have no temporal types, the int64 counts are the data
+        obj = obj.view(np.int64)
     apache_arrow = pa.Tensor.from_numpy(obj=obj)
     sink = pa.BufferOutputStream()
     pa.ipc.write_tensor(apache_arrow, sink)
     buffer = sink.getvalue()
-    if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
-        numpy_bytes = buffer.to_pybytes()
-    else:
-        numpy_bytes = pa.compress(
-            buffer, asbytes=True, codec=flags.APACHE_ARROW_COMPRESSION.value
-        )
+    numpy_bytes, codec = compress(buffer, original_dtype)
     dtype = original_dtype.name
 
-    return cast(bytes, _serialize((numpy_bytes, buffer.size, dtype), to_bytes=True))
+    return cast(
+        bytes,
+        _serialize((numpy_bytes, buffer.size, dtype, codec.name), to_bytes=True),
+    )
 
 
 def arrow_deserialize(
-    numpy_bytes: bytes, decompressed_size: int, dtype: str
+    numpy_bytes: bytes,
+    decompressed_size: int,
+    dtype: str,
+    codec: Optional[str] = None,
 ) -> np.ndarray:
     original_dtype = np.dtype(dtype)
-    if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
-        reader = pa.BufferReader(numpy_bytes)
-        numpy_bytes = reader.read_buffer()
-    else:
-        numpy_bytes = pa.decompress(
-            numpy_bytes,
-            decompressed_size=decompressed_size,
-            codec=flags.APACHE_ARROW_COMPRESSION.value,
-        )
+    buffer = _decompress(numpy_bytes, decompressed_size, codec)
+    if original_dtype.kind in STRING_KINDS:
+        return arrow_string_deserialize(buffer, original_dtype)
 
-    result = pa.ipc.read_tensor(numpy_bytes)
+    result = pa.ipc.read_tensor(buffer)
     np_array = result.to_numpy()
     np_array.setflags(write=True)
+    if original_dtype.kind in TEMPORAL_KINDS:
+        return np_array.view(original_dtype)
     return np_array.astype(original_dtype)
 
 
+# numpy datetime64 and timedelta64 dtype kinds, stored as int64 counts of their unit
+TEMPORAL_KINDS = ("M", "m")
+
+
+# numpy dtype kinds stored as an arrow string / binary array
+STRING_KINDS = ("U", "S", "O")
+
+# arrays with more data than this need 64 bit offsets
+MAX_STRING_ARRAY_SIZE = 2**31 - 1
+
+
+def arrow_string_serialize(obj: np.ndarray) -> bytes:
+    """Serialize a numpy `U`, `S` or object array of strings as an arrow
+    (Large)StringArray or (Large)BinaryArray: an offsets and a data buffer
+    holding the encoded strings at their real size."""
+    large = obj.dtype.kind == "O" or obj.nbytes > MAX_STRING_ARRAY_SIZE
+    if obj.dtype.kind == "S":
+        arrow_type = pa.large_binary() if large else pa.binary()
+    else:
+        arrow_type = pa.large_string() if large else pa.string()
+
+    if obj.dtype.kind == "S":
+        array = _binary_array(obj.ravel(), arrow_type)
+    else:
+        array = pa.array(obj.ravel(), type=arrow_type)
+    shape = ",".join(str(dim) for dim in obj.shape)
+    schema = pa.schema([("values", arrow_type)], metadata={"shape": shape})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(pa.record_batch([array], schema=schema))
+    buffer = sink.getvalue()
+    numpy_bytes, codec = compress(buffer, obj.dtype)
+
+    # the dtype string keeps the width of fixed size string dtypes
+    dtype = obj.dtype.str
+    return cast(
+        bytes,
+        _serialize((numpy_bytes, buffer.size, dtype, codec.name), to_bytes=True),
+    )
+
+
+def _binary_array(obj: np.ndarray, arrow_type: pa.DataType) -> pa.Array:
+    """Builds the arrow buffers of a numpy `S` array directly, `pa.array` would
+    cut the strings at their first null byte."""
+    padded = np.ascontiguousarray(obj).view(np.uint8)
+    padded = padded.reshape(len(obj), obj.dtype.itemsize)
+    # numpy drops trailing null bytes of `S` items, the rest is data
+    nonzero = padded != 0
+    width = padded.shape[1]
+    lengths = np.where(
+        nonzero.any(axis=1), width - np.argmax(nonzero[:, ::-1], axis=1), 0
+    )
+    data = padded[np.arange(width) < lengths[:, None]]
+    offset_type = np.int64 if arrow_type == pa.large_binary() else np.int32
+    offsets = np.zeros(len(obj) + 1, dtype=offset_type)
+    np.cumsum(lengths, out=offsets[1:])
+    return pa.Array.from_buffers(
+        arrow_type, len(obj), [None, pa.py_buffer(offsets), pa.py_buffer(data)]
+    )
+
+
+def _pad_strings(data: np.ndarray, offsets: np.ndarray, width: int) -> np.ndarray:
+    """Scatters the variable length strings of an arrow array into a zero padded
+    (n, width) uint8 matrix, the memory layout of a numpy `S` array."""
+    lengths = np.diff(offsets)
+    # row major order of the mask is the order of the strings in the data buffer
+    mask = np.arange(width) < lengths[:, None]
+    padded = np.zeros((len(lengths), width), dtype=np.uint8)
+    padded[mask] = data[int(offsets[0]) : int(offsets[-1])]  # noqa: E203
+    return padded
+
+
+def arrow_string_deserialize(buffer: pa.Buffer, dtype: np.dtype) -> np.ndarray:
+    table = pa.ipc.open_stream(buffer).read_all()
+    shape_str = table.schema.metadata[b"shape"].decode()
+    shape = tuple(int(dim) for dim in shape_str.split(",")) if shape_str else ()
+    array = table.column(0).combine_chunks()
+
+    if dtype.kind != "O" and array.null_count == 0:
+        _, offsets_buffer, data_buffer = array.buffers()
+        offset_type = (
+            np.int64
+            if array.type in (pa.large_string(), pa.large_binary())
+            else np.int32
+        )
+        offsets = np.frombuffer(offsets_buffer, dtype=offset_type)
+        offsets = offsets[array.offset : array.offset + len(array) + 1]  # noqa: E203
+        data = (
+            np.frombuffer(data_buffer, dtype=np.uint8)
+            if data_buffer is not None
+            else np.zeros(0, dtype=np.uint8)
+        )
+        if dtype.kind == "S":
+            padded = _pad_strings(data, offsets.astype(np.int64), dtype.itemsize)
+            return padded.view(dtype).reshape(shape)
+        if data[offsets[0] : offsets[-1]].max(initial=0) < 128:  # noqa: E203
+            # ascii code points are their own utf-8 encoding, widen them to UCS4
+            padded = _pad_strings(data, offsets.astype(np.int64), dtype.itemsize // 4)
+            return padded.astype(np.uint32).view(dtype).reshape(shape)
+
+    np_array = array.to_numpy(zero_copy_only=False)
+    if dtype.kind != "O":
+        np_array = np_array.astype(dtype)
+    return np_array.reshape(shape)
+
+
 def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     """Decodes utf-8 encoded numpy array to string numpy array.
 
+    String arrays are serialized with `arrow_string_serialize` now, this decodes
+    blobs written by earlier versions.
+
     Args:
         input_index (np.ndarray): utf-8 encoded array
 
@@ -76,45 +198,11 @@ def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     return np.array(output_list).reshape(shape)
 
 
-def arraytonumpyutf8(string_list: Union[str, np.ndarray]) -> bytes:
-    """Encodes string Numpyarray  to utf-8 encoded numpy array.
-
-    Args:
-        string_list (np.ndarray): NumpyArray to be encoded
-
-    Returns:
-        bytes: serialized utf-8 encoded int Numpy array
-    """
-    array_shape = np.array(string_list).shape
-    string_list = np.array(string_list).flatten()
-    bytes_list = []
-    indexes = []
-    offset = 0
-
-    for item in string_list:
-        name_bytes = item.encode("utf-8")
-        offset += len(name_bytes)
-        indexes.append(offset)
-        bytes_list.append(name_bytes)
-
-    np_bytes = np.frombuffer(b"".join(bytes_list), dtype=np.uint8)
-    np_bytes = np_bytes.astype(np.uint64)
-    np_indexes = np.array(indexes, dtype=np.uint64)
-    index_length = np.array([len(np_indexes)], dtype=np.uint64)
-    shape = np.array(array_shape, dtype=np.uint64)
-    shape_length = np.array([len(shape)], dtype=np.uint64)
-    output_array = np.concatenate(
-        [np_bytes, np_indexes, index_length, shape, shape_length]
-    )
-
-    return cast(bytes, _serialize(output_array, to_bytes=True))
-
-
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
+    if obj.dtype.kind in STRING_KINDS:
+        return arrow_string_serialize(obj)
     else:
-        return arraytonumpyutf8(obj)
+        return arrow_serialize(obj)
 
 
 def numpy_deserialize(buf: bytes) -> np.ndarray:
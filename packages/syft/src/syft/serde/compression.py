@@ -0,0 +1,162 @@
+# stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# third party
+import numpy as np
+import pyarrow as pa
+
+# relative
+from ..util.experimental_flags import ApacheArrowCompression
+from ..util.experimental_flags import flags
+
+
+class CompressionTransport(Enum):
+    """Where a serialized payload is going, each has its own `CompressionPolicy`."""
+
+    DEFAULT = "default"
+    # in-process calls through a PythonConnection
+    PYTHON = "python"
+    # HTTPConnection requests and node responses
+    HTTP = "http"
+    # blobs at rest in a SQLiteBackingStore
+    SQLITE = "sqlite"
+    # serialization for hashing, which must not depend on the transport
+    HASHING = "hashing"
+
+
+class CompressionPolicy:
+    """Decides per payload whether and how an Arrow buffer is compressed.
+
+    Parameters:
+        `codec`: Optional[ApacheArrowCompression]
+            The codec, defaults to `flags.APACHE_ARROW_COMPRESSION`.
+        `level`: Optional[int]
+            The compression level, if the codec supports one.
+        `min_size`: int
+            Payloads smaller than this are never compressed.
+        `sample_size`: int
+            Size of each of the `sample_count` samples compressed to estimate
+            the compressibility of a large payload.
+        `max_ratio`: float
+            Payloads which don't compress below this ratio are stored raw.
+        `sampled_kinds`: Tuple[str, ...]
+            numpy dtype kinds whose compressibility is estimated first, like
+            floats which are often noise. Other dtypes are just compressed.
+        `dtype_codecs`: Dict[str, ApacheArrowCompression]
+            Codecs overriding `codec` for a numpy dtype kind.
+    """
+
+    def __init__(
+        self,
+        codec: Optional[ApacheArrowCompression] = None,
+        level: Optional[int] = None,
+        min_size: int = 2**12,
+        sample_size: int = 2**14,
+        sample_count: int = 4,
+        max_ratio: float = 0.9,
+        sampled_kinds: Tuple[str, ...] = ("f", "c"),
+        dtype_codecs: Optional[Dict[str, ApacheArrowCompression]] = None,
+    ) -> None:
+        self.codec = codec
+        self.level = level
+        self.min_size = min_size
+        self.sample_size = sample_size
+        self.sample_count = sample_count
+        self.max_ratio = max_ratio
+        self.sampled_kinds = sampled_kinds
+        self.dtype_codecs = {} if dtype_codecs is None else dtype_codecs
+
+    def get_codec(self, dtype: np.dtype) -> ApacheArrowCompression:
+        if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
+            # the global flag switches compression off everywhere
+            return ApacheArrowCompression.NONE
+        codec = self.dtype_codecs.get(dtype.kind, self.codec)
+        return flags.APACHE_ARROW_COMPRESSION if codec is None else codec
+
+    def sample(self, data: memoryview) -> bytes:
+        stride = len(data) // self.sample_count
+        return b"".join(
+            data[start : start + self.sample_size]  # noqa: E203
+            for start in range(0, stride * self.sample_count, stride)
+        )
+
+    def compress(
+        self, buffer: Union[pa.Buffer, bytes], dtype: np.dtype
+    ) -> Tuple[bytes, ApacheArrowCompression]:
+        """Returns the payload and the codec it was compressed with."""
+        data = memoryview(buffer)
+        codec = self.get_codec(dtype)
+        if codec is ApacheArrowCompression.NONE or len(data) < self.min_size:
+            return bytes(data), ApacheArrowCompression.NONE
+
+        compressor = get_compressor(codec, self.level)
+        if (
+            dtype.kind in self.sampled_kinds
+            and len(data) > self.sample_size * self.sample_count * 2
+        ):
+            sample = self.sample(data)
+            if len(compressor.compress(sample)) > len(sample) * self.max_ratio:
+                return bytes(data), ApacheArrowCompression.NONE
+
+        compressed = compressor.compress(buffer, asbytes=True)
+        if len(compressed) > len(data) * self.max_ratio:
+            return bytes(data), ApacheArrowCompression.NONE
+        return compressed, codec
+
+
+def get_compressor(codec: ApacheArrowCompression, level: Optional[int]) -> pa.Codec:
+    if level is not None and pa.Codec.supports_compression_level(codec.value):
+        return pa.Codec(codec.value, compression_level=level)
+    return pa.Codec(codec.value)
+
+
+TRANSPORT_POLICIES: Dict[CompressionTransport, CompressionPolicy] = {
+    CompressionTransport.DEFAULT: CompressionPolicy(),
+    # nothing is gained by compressing data which never leaves the process
+    CompressionTransport.PYTHON: CompressionPolicy(codec=ApacheArrowCompression.NONE),
+    # cheap compression for data on the wire
+    CompressionTransport.HTTP: CompressionPolicy(level=1),
+    # data at rest is written once and read many times
+    CompressionTransport.SQLITE: CompressionPolicy(level=6),
+    # the same object always hashes the same, whichever transport it came from
+    CompressionTransport.HASHING: CompressionPolicy(codec=ApacheArrowCompression.NONE),
+}
+
+_transport: ContextVar[CompressionTransport] = ContextVar(
+    "compression_transport", default=CompressionTransport.DEFAULT
+)
+
+
+@contextmanager
+def compression_transport(transport: CompressionTransport) -> Iterator[None]:
+    """Serialize everything inside the block with the policy of `transport`."""
+    token = _transport.set(transport)
+    try:
+        yield
+    finally:
+        _transport.reset(token)
+
+
+def get_compression_policy() -> CompressionPolicy:
+    return TRANSPORT_POLICIES[_transport.get()]
+
+
+def compress(
+    buffer: Union[pa.Buffer, bytes], dtype: np.dtype
+) -> Tuple[bytes, ApacheArrowCompression]:
+    return get_compression_policy().compress(buffer, dtype)
+
+
+def decompress(
+    data: bytes, decompressed_size: int, codec: ApacheArrowCompression
+) -> pa.Buffer:
+    if codec is ApacheArrowCompression.NONE:
+        return pa.py_buffer(data)
+    return pa.decompress(data, decompressed_size=decompressed_size, codec=codec.value)
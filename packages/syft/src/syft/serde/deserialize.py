@@ -1,5 +1,8 @@
 # stdlib
+from pathlib import Path
 from typing import Any
+from typing import Optional
+from typing import Sequence
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
@@ -9,10 +12,20 @@ def _deserialize(
     blob: Any,
     from_proto: bool = True,
     from_bytes: bool = False,
+    buffers: Optional[Sequence] = None,
+    from_stream: bool = False,
 ) -> Any:
     # relative
+    from .recursive import oob_buffers
     from .recursive import rs_bytes2object
     from .recursive import rs_proto2object
+    from .stream import deserialize_from_file
+    from .stream import deserialize_from_stream
+
+    if from_stream:
+        if isinstance(blob, (str, Path)):
+            return deserialize_from_file(blob)
+        return deserialize_from_stream(blob)
 
     if (
         (from_bytes and not isinstance(blob, bytes))
@@ -25,6 +38,10 @@ def _deserialize(
     ):
         raise TypeError("Wrong deserialization format.")
 
+    if buffers is not None:
+        with oob_buffers(list(buffers)):
+            return _deserialize(blob, from_proto=from_proto, from_bytes=from_bytes)
+
     if from_bytes:
         return rs_bytes2object(blob)
 
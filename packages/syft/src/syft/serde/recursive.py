@@ -1,13 +1,19 @@
 # stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 from enum import EnumMeta
 import sys
 import types
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -15,9 +21,6 @@ from typing import Union
 from capnp.lib.capnp import _DynamicStructBuilder
 from pydantic import BaseModel
 
-# syft absolute
-import syft as sy
-
 # relative
 from ..util.util import get_fully_qualified_name
 from ..util.util import index_syft_by_module_name
@@ -27,6 +30,60 @@ TYPE_BANK = {}
 
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde  # type: ignore
 
+# nonrecursive blobs of at least this many bytes are emitted out-of-band, in the
+# style of pickle protocol 5, when the caller of serialize provides a buffer list
+OOB_BUFFER_MIN_SIZE = 2**16
+
+_oob_buffers: ContextVar[Optional[List]] = ContextVar("oob_buffers", default=None)
+
+
+@contextmanager
+def oob_buffers(buffers: Optional[List]) -> Iterator[None]:
+    """Make `buffers` the out-of-band buffer list for every nested (de)serialize
+    call made inside the block. Passing None keeps all payloads inline."""
+    token = _oob_buffers.set(buffers)
+    try:
+        yield
+    finally:
+        _oob_buffers.reset(token)
+
+
+# in lazy mode the fields of SyftObjects with at least this many encoded bytes, or
+# which can reference out-of-band buffers, are decoded on their first access
+LAZY_FIELD_MIN_SIZE = 2**12
+
+_lazy: ContextVar[bool] = ContextVar("lazy_deserialization", default=False)
+
+
+@contextmanager
+def lazy_deserialization(lazy: bool = True) -> Iterator[None]:
+    """Deserialize the large fields of SyftObjects inside the block lazily, the
+    serialized field is kept and only decoded when the attribute is accessed."""
+    token = _lazy.set(lazy)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+class LazyField:
+    """A serialized field of a SyftObject waiting for its first access."""
+
+    __slots__ = ("blob", "buffers", "transform")
+
+    def __init__(
+        self, blob: bytes, buffers: Optional[List], transform: Optional[Callable]
+    ) -> None:
+        self.blob = blob
+        # the out-of-band buffers the field was deserialized with
+        self.buffers = buffers
+        self.transform = transform
+
+    def load(self) -> Any:
+        with oob_buffers(self.buffers), lazy_deserialization(False):
+            value = rs_bytes2object(self.blob)
+        return value if self.transform is None else self.transform(value)
+
 
 def get_types(cls: Type, keys: Optional[List[str]] = None) -> Optional[List[Type]]:
     if keys is None:
@@ -150,10 +207,157 @@ def recursive_serde_register(
     )
 
     TYPE_BANK[fqn] = serde_attributes
+    codec = SerdeCodec(fqn, *serde_attributes[:-1])
+    CODEC_BANK[fqn] = codec
 
     if isinstance(alias_fqn, tuple):
         for alias in alias_fqn:
             TYPE_BANK[alias] = serde_attributes
+            CODEC_BANK[alias] = codec
+
+    # a class can be registered again, e.g. when user code is reloaded
+    _CODEC_BY_CLASS.clear()
+    _CLASS_BY_FQN.clear()
+
+
+class SerdeCodec:
+    """Serde codec for a registered class, compiled once in
+    `recursive_serde_register` so `rs_object2proto` and `rs_proto2object`
+    don't have to re-derive the field order and overrides on every call."""
+
+    def __init__(
+        self,
+        fqn: str,
+        nonrecursive: bool,
+        serialize: Optional[Callable],
+        deserialize: Optional[Callable],
+        attributes: Optional[Set[str]],
+        exclude_attrs: List[str],
+        serde_overrides: Dict[str, Tuple[Callable, Callable]],
+        hash_exclude_attrs: List[str],
+        cls: Type,
+    ) -> None:
+        self.fqn = fqn
+        self.nonrecursive = nonrecursive
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.exclude_attrs = set(exclude_attrs)
+        self.serde_overrides = serde_overrides
+        self.hash_exclude_attrs = set(hash_exclude_attrs)
+        self.cls = cls
+        self.deserialize_transforms = {
+            name: transforms[1] for name, transforms in serde_overrides.items()
+        }
+        # None means the fields are taken from the __dict__ of each object
+        self.fields = (
+            self.compile_fields(attributes - self.exclude_attrs)
+            if attributes is not None
+            else None
+        )
+        self._hash_fields: Optional[Tuple] = None
+        self._lazy: Optional[bool] = None
+
+    def compile_fields(self, names: Iterable[str]) -> Tuple:
+        # (name, serialize transform or None) in the order they are written
+        fields = []
+        for name in sorted(names):
+            transforms = self.serde_overrides.get(name, None)
+            fields.append((name, transforms[0] if transforms is not None else None))
+        return tuple(fields)
+
+    def fields_for(self, obj: Any, for_hashing: bool) -> Tuple:
+        if self.fields is None:
+            names = set(obj.__dict__.keys()) - self.exclude_attrs
+            if for_hashing:
+                names -= self.hash_excluded
+            return self.compile_fields(names)
+
+        if not for_hashing:
+            return self.fields
+
+        if self._hash_fields is None:
+            self._hash_fields = tuple(
+                field for field in self.fields if field[0] not in self.hash_excluded
+            )
+        return self._hash_fields
+
+    def supports_lazy_fields(self, class_type: type) -> bool:
+        if self._lazy is None:
+            # user code can be reloaded and is constructed differently
+            self._lazy = (
+                "syft.user" not in self.fqn
+                and getattr(class_type, "_syft_supports_lazy_fields", lambda: False)()
+            )
+        return self._lazy
+
+    @property
+    def hash_excluded(self) -> Set[str]:
+        # relative
+        from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+
+        return self.hash_exclude_attrs.union(DYNAMIC_SYFT_ATTRIBUTES)
+
+
+CODEC_BANK: Dict[str, SerdeCodec] = {}
+
+# caches for the class lookups done on every (de)serialization
+_CODEC_BY_CLASS: Dict[type, SerdeCodec] = {}
+_CLASS_BY_FQN: Dict[str, type] = {}
+
+
+def get_codec(obj: Any) -> SerdeCodec:
+    klass = obj.__class__
+    codec = _CODEC_BY_CLASS.get(klass, None)
+    if codec is None:
+        fqn = get_fully_qualified_name(obj)
+        if fqn not in CODEC_BANK:
+            raise Exception(f"{fqn} not in TYPE_BANK")
+        codec = CODEC_BANK[fqn]
+        _CODEC_BY_CLASS[klass] = codec
+    return codec
+
+
+def resolve_class(fqn: str) -> type:
+    cached = _CLASS_BY_FQN.get(fqn, None)
+    if cached is not None:
+        return cached
+
+    # clean this mess, Tudor
+    module_parts = fqn.split(".")
+    klass = module_parts.pop()
+    class_type: type = type(None)
+
+    if klass != "NoneType":
+        try:
+            class_type = index_syft_by_module_name(fqn)  # type: ignore
+        except Exception:  # nosec
+            try:
+                class_type = getattr(sys.modules[".".join(module_parts)], klass)
+            except Exception:  # nosec
+                if "syft.user" in fqn:
+                    # relative
+                    from ..node.node import CODE_RELOADER
+
+                    for _, load_user_code in CODE_RELOADER.items():
+                        load_user_code()
+                try:
+                    class_type = getattr(sys.modules[".".join(module_parts)], klass)
+                except Exception:  # nosec
+                    pass
+
+    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
+    # module name space in sub-processes or threads even though they are loaded on start
+    # its possible that the uvicorn awsgi server is preloading a bunch of threads
+    # however simply getting the class from the TYPE_BANK doesn't always work and
+    # causes some errors so it seems like we want to get the local one where possible
+    if class_type == type(None) and fqn in CODEC_BANK:
+        # yes this looks stupid but it works and the opposite breaks
+        class_type = CODEC_BANK[fqn].cls
+
+    # user code can be reloaded, so those classes are always looked up again
+    if "syft.user" not in fqn:
+        _CLASS_BY_FQN[fqn] = class_type
+    return class_type
 
 
 def chunk_bytes(
@@ -170,84 +374,113 @@ def chunk_bytes(
 
 
 def combine_bytes(capnp_list: List[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    # a single allocation instead of repeated concatenation, which was quadratic
+    if len(capnp_list) == 1:
+        return bytes(capnp_list[0])
+    return b"".join(capnp_list)
+
+
+def get_oob_buffer(index: int) -> bytes:
+    buffers = _oob_buffers.get()
+    if buffers is None or index >= len(buffers):
+        raise Exception(
+            f"Out-of-band buffer {index} is missing, pass the buffers returned "
+            "by serialize to deserialize."
+        )
+    buffer = buffers[index]
+    # a single copy at the leaf, nested messages only carry the index
+    return buffer if isinstance(buffer, bytes) else bytes(buffer)
+
+
+def is_oob_blob(blob: bytes) -> bool:
+    return _oob_buffers.get() is not None and len(blob) >= OOB_BUFFER_MIN_SIZE
+
+
+def set_nonrecursive_blob(msg: _DynamicStructBuilder, blob: bytes) -> None:
+    buffers = _oob_buffers.get()
+    if buffers is not None and is_oob_blob(blob):
+        # the skeleton only keeps the index, the payload travels alongside it
+        msg.oobBufferIndex = len(buffers)
+        buffers.append(memoryview(blob))
+    else:
+        chunk_bytes(blob, "nonrecursiveBlob", msg)
 
 
 def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
-
-    is_type = False
-    if isinstance(self, type):
-        is_type = True
+    codec = get_codec(self)
 
     msg = recursive_scheme.new_message()
-    fqn = get_fully_qualified_name(self)
-    if fqn not in TYPE_BANK:
-        # third party
-        raise Exception(f"{fqn} not in TYPE_BANK")
-
-    msg.fullyQualifiedName = fqn
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-    ) = TYPE_BANK[fqn]
+    msg.fullyQualifiedName = codec.fqn
 
-    if nonrecursive or is_type:
-        if serialize is None:
+    if codec.nonrecursive or isinstance(self, type):
+        if codec.serialize is None:
             raise Exception(
                 f"Cant serialize {type(self)} nonrecursive without serialize."
             )
-        chunk_bytes(serialize(self), "nonrecursiveBlob", msg)
+        set_nonrecursive_blob(msg, codec.serialize(self))
         return msg
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+    fields = codec.fields_for(self, for_hashing)
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
+    msg.init("fieldsName", len(fields))
+    fields_data = msg.init("fieldsData", len(fields))
+    fields_name = msg.fieldsName
 
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
-
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
-            raise ValueError(
-                f"{attr_name} on {type(self)} does not exist, serialization aborted!"
-            )
+    for idx, (attr_name, value) in enumerate(
+        iter_field_values(self, fields, for_hashing)
+    ):
+        serialized = serialize_field_value(value, for_hashing)
+        if serialized is None:
+            continue
+        fields_name[idx] = attr_name
+        chunk_bytes(serialized, idx, fields_data)
 
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
+    return msg
 
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
 
-        if isinstance(field_obj, types.FunctionType):
+def get_field_value(obj: Any, attr_name: str, transform: Optional[Callable]) -> Any:
+    try:
+        field_obj = getattr(obj, attr_name)
+    except AttributeError:
+        raise ValueError(
+            f"{attr_name} on {type(obj)} does not exist, serialization aborted!"
+        )
+
+    if transform is not None:
+        field_obj = transform(field_obj)
+    return field_obj
+
+
+def iter_field_values(
+    obj: Any, fields: Tuple, for_hashing: bool
+) -> Iterator[Tuple[str, Any]]:
+    """Yields the fields of `obj` to serialize. Lazily deserialized fields which
+    were never accessed are yielded as their LazyField."""
+    lazy_fields = None if for_hashing else getattr(obj, "_syft_lazy_fields", None)
+
+    for attr_name, transform in fields:
+        lazy_field = lazy_fields.get(attr_name, None) if lazy_fields else None
+        if (
+            lazy_field is not None
+            and lazy_field.buffers is None
+            and attr_name not in obj.__dict__
+        ):
+            yield attr_name, lazy_field
             continue
+        yield attr_name, get_field_value(obj, attr_name, transform)
 
-        serialized = sy.serialize(field_obj, to_bytes=True, for_hashing=for_hashing)
-        msg.fieldsName[idx] = attr_name
-        chunk_bytes(serialized, idx, msg.fieldsData)
 
-    return msg
+def serialize_field_value(value: Any, for_hashing: bool) -> Optional[bytes]:
+    """Serializes a value from `iter_field_values`, None for skipped fields."""
+    # relative
+    from .serialize import _serialize
+
+    if isinstance(value, LazyField):
+        # a field which was never accessed is written back as it was read
+        return value.blob
+    if isinstance(value, types.FunctionType):
+        return None
+    return _serialize(value, to_bytes=True, for_hashing=for_hashing)
 
 
 def rs_bytes2object(blob: bytes) -> Any:
@@ -259,77 +492,73 @@ def rs_bytes2object(blob: bytes) -> Any:
         return rs_proto2object(msg)
 
 
-def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
-
-    # clean this mess, Tudor
-    module_parts = proto.fullyQualifiedName.split(".")
-    klass = module_parts.pop()
-    class_type: Type = type(None)
-
-    if klass != "NoneType":
-        try:
-            class_type = index_syft_by_module_name(proto.fullyQualifiedName)  # type: ignore
-        except Exception:  # nosec
-            try:
-                class_type = getattr(sys.modules[".".join(module_parts)], klass)
-            except Exception:  # nosec
-                if "syft.user" in proto.fullyQualifiedName:
-                    # relative
-                    from ..node.node import CODE_RELOADER
-
-                    for _, load_user_code in CODE_RELOADER.items():
-                        load_user_code()
-                try:
-                    class_type = getattr(sys.modules[".".join(module_parts)], klass)
-                except Exception:  # nosec
-                    pass
-
-    if proto.fullyQualifiedName not in TYPE_BANK:
-        raise Exception(f"{proto.fullyQualifiedName} not in TYPE_BANK")
+def get_codec_by_fqn(fqn: str) -> SerdeCodec:
+    codec = CODEC_BANK.get(fqn, None)
+    if codec is None and "syft.user" in fqn:
+        # reloading the user code registers its classes
+        resolve_class(fqn)
+        codec = CODEC_BANK.get(fqn, None)
+    if codec is None:
+        raise Exception(f"{fqn} not in TYPE_BANK")
+    return codec
 
-    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
-    # module name space in sub-processes or threads even though they are loaded on start
-    # its possible that the uvicorn awsgi server is preloading a bunch of threads
-    # however simply getting the class from the TYPE_BANK doesn't always work and
-    # causes some errors so it seems like we want to get the local one where possible
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-    ) = TYPE_BANK[proto.fullyQualifiedName]
 
-    if class_type == type(None):
-        # yes this looks stupid but it works and the opposite breaks
-        class_type = cls
+def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
+    fqn = proto.fullyQualifiedName
+    codec = get_codec_by_fqn(fqn)
 
-    if nonrecursive:
-        if deserialize is None:
+    # classes which were serialized field by field before they got a
+    # nonrecursive codec can still be read from their fields
+    if codec.nonrecursive and len(proto.fieldsName) == 0:
+        if codec.deserialize is None:
             raise Exception(
                 f"Cant serialize {type(proto)} nonrecursive without serialize."
             )
 
-        return deserialize(combine_bytes(proto.nonrecursiveBlob))
-
-    kwargs = {}
+        if proto.oobBufferIndex >= 0:
+            return codec.deserialize(get_oob_buffer(proto.oobBufferIndex))
+        return codec.deserialize(combine_bytes(proto.nonrecursiveBlob))
 
-    for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
+    class_type = resolve_class(fqn)
+    fields = (
+        (attr_name, combine_bytes(attr_bytes_list))
+        for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData)
+    )
+    return rs_fields2object(codec, class_type, fields)
+
+
+def rs_fields2object(
+    codec: SerdeCodec,
+    class_type: type,
+    fields: Iterable[Tuple[str, bytes]],
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Builds an object of a recursive class from its serialized fields, `kwargs`
+    holds the fields which were already deserialized."""
+    deserialize_transforms = codec.deserialize_transforms
+    kwargs = {} if kwargs is None else kwargs
+
+    lazy = _lazy.get() and codec.supports_lazy_fields(class_type)
+    lazy_fields = {}
+    # an empty buffer list can't be referenced
+    buffers = _oob_buffers.get() or None
+
+    for attr_name, attr_bytes in fields:
         if attr_name != "":
-            attr_bytes = combine_bytes(attr_bytes_list)
-            attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
+            transform = deserialize_transforms.get(attr_name, None)
+
+            if lazy and (buffers is not None or len(attr_bytes) >= LAZY_FIELD_MIN_SIZE):
+                lazy_fields[attr_name] = LazyField(attr_bytes, buffers, transform)
+                continue
 
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
+            attr_value = rs_bytes2object(attr_bytes)
+            if transform is not None:
+                attr_value = transform(attr_value)
             kwargs[attr_name] = attr_value
 
+    if lazy_fields:
+        return class_type._syft_lazy_construct(kwargs, lazy_fields)
+
     if hasattr(class_type, "serde_constructor"):
         return class_type.serde_constructor(kwargs)
 
@@ -339,7 +568,7 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         # if we skip the __new__ flow of BaseModel we get the error
         # AttributeError: object has no attribute '__fields_set__'
 
-        if "syft.user" in proto.fullyQualifiedName:
+        if "syft.user" in codec.fqn:
             # weird issues with pydantic and ForwardRef on user classes being inited
             # with custom state args / kwargs
             obj = class_type()
@@ -5,6 +5,7 @@ from enum import Enum
 from enum import EnumMeta
 import functools
 import sys
+from types import FunctionType
 from types import MappingProxyType
 from typing import Any
 from typing import Collection
@@ -19,11 +20,25 @@ from typing import _SpecialForm
 from typing import cast
 import weakref
 
+# third party
+from capnp.lib.capnp import _DynamicStructBuilder
+
 # relative
 from .capnp import get_capnp_schema
+from .recursive import LazyField
+from .recursive import SerdeCodec
 from .recursive import chunk_bytes
 from .recursive import combine_bytes
+from .recursive import get_codec
+from .recursive import get_codec_by_fqn
+from .recursive import is_oob_blob
+from .recursive import iter_field_values
+from .recursive import recursive_scheme
 from .recursive import recursive_serde_register
+from .recursive import resolve_class
+from .recursive import rs_fields2object
+from .recursive import serialize_field_value
+from .recursive import set_nonrecursive_blob
 
 # import types unsupported on python 3.8
 if sys.version_info >= (3, 9):
@@ -36,12 +51,23 @@ iterable_schema = get_capnp_schema("iterable.capnp").Iterable  # type: ignore
 kv_iterable_schema = get_capnp_schema("kv_iterable.capnp").KVIterable  # type: ignore
 
 
+# collections of at least this many elements of a single registered class are
+# written column-wise, the class and its field names are only written once
+BATCH_MIN_SIZE = 2
+
+
 def serialize_iterable(iterable: Collection) -> bytes:
     # relative
     from .serialize import _serialize
 
     message = iterable_schema.new_message()
 
+    if len(iterable) >= BATCH_MIN_SIZE:
+        elements = list(iterable)
+        codec = get_batch_codec(elements)
+        if codec is not None and serialize_batch(codec, elements, message):
+            return message.to_bytes()
+
     message.init("values", len(iterable))
 
     for idx, it in enumerate(iterable):
@@ -51,6 +77,76 @@ def serialize_iterable(iterable: Collection) -> bytes:
     return message.to_bytes()
 
 
+def get_batch_codec(elements: List) -> Optional[SerdeCodec]:
+    """Returns the codec of the elements if they can be batched."""
+    klass = type(elements[0])
+    if isinstance(elements[0], type) or any(type(x) is not klass for x in elements):
+        return None
+
+    codec = get_codec(elements[0])
+    if codec.nonrecursive:
+        return codec if codec.serialize is not None else None
+    # the fields of each object have to be the same
+    return codec if codec.fields is not None else None
+
+
+def serialize_batch(
+    codec: SerdeCodec, elements: List, message: _DynamicStructBuilder
+) -> bool:
+    # relative
+    from .serialize import _serialize
+
+    if codec.nonrecursive:
+        if codec.serialize is None:
+            raise Exception(
+                f"Cant serialize {codec.fqn} nonrecursive without serialize."
+            )
+        serialize = codec.serialize
+        blobs = [serialize(x) for x in elements]
+        if any(is_oob_blob(blob) for blob in blobs):
+            # large payloads have to travel out-of-band in their own messages
+            message.init("values", len(blobs))
+            for idx, blob in enumerate(blobs):
+                proto = recursive_scheme.new_message()
+                proto.fullyQualifiedName = codec.fqn
+                set_nonrecursive_blob(proto, blob)
+                chunk_bytes(proto.to_bytes(), idx, message.values)
+            return True
+
+        message.fullyQualifiedName = codec.fqn
+        message.size = len(blobs)
+        message.init("values", len(blobs))
+        for idx, blob in enumerate(blobs):
+            chunk_bytes(blob, idx, message.values)
+        return True
+
+    rows = [
+        [value for _, value in iter_field_values(x, codec.fields, False)]
+        for x in elements
+    ]
+    if any(isinstance(value, FunctionType) for row in rows for value in row):
+        return False
+
+    message.fullyQualifiedName = codec.fqn
+    message.size = len(elements)
+    fields_name = message.init("fieldsName", len(codec.fields))
+    columns = message.init("columns", len(codec.fields))
+
+    for idx, (attr_name, _) in enumerate(codec.fields):
+        fields_name[idx] = attr_name
+        values = [row[idx] for row in rows]
+        if any(isinstance(value, LazyField) for value in values):
+            # fields which were never accessed are written back as they were read
+            column_elements = columns[idx].init("elements", len(values))
+            for element_idx, value in enumerate(values):
+                serialized = serialize_field_value(value, False)
+                chunk_bytes(serialized, element_idx, column_elements)
+        else:
+            chunk_bytes(_serialize(values, to_bytes=True), "serialized", columns[idx])
+
+    return True
+
+
 def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
     # relative
     from .deserialize import _deserialize
@@ -61,12 +157,56 @@ def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
     with iterable_schema.from_bytes(  # type: ignore
         blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
     ) as msg:
-        for element in msg.values:
-            values.append(_deserialize(combine_bytes(element), from_bytes=True))
+        if msg.fullyQualifiedName != "":
+            values = deserialize_batch(msg)
+        else:
+            for element in msg.values:
+                values.append(_deserialize(combine_bytes(element), from_bytes=True))
 
     return iterable_type(values)
 
 
+def deserialize_batch(msg: _DynamicStructBuilder) -> List:
+    # relative
+    from .deserialize import _deserialize
+
+    codec = get_codec_by_fqn(msg.fullyQualifiedName)
+    if codec.nonrecursive:
+        if codec.deserialize is None:
+            raise Exception(
+                f"Cant deserialize {codec.fqn} nonrecursive without deserialize."
+            )
+        deserialize = codec.deserialize
+        return [deserialize(combine_bytes(blob)) for blob in msg.values]
+
+    class_type = resolve_class(codec.fqn)
+    deserialized_columns = {}
+    serialized_columns = {}
+
+    for attr_name, column in zip(msg.fieldsName, msg.columns):
+        if column.which() == "elements":
+            serialized_columns[attr_name] = [
+                combine_bytes(element) for element in column.elements
+            ]
+            continue
+
+        values = _deserialize(combine_bytes(column.serialized), from_bytes=True)
+        transform = codec.deserialize_transforms.get(attr_name, None)
+        if transform is not None:
+            values = [transform(value) for value in values]
+        deserialized_columns[attr_name] = values
+
+    return [
+        rs_fields2object(
+            codec,
+            class_type,
+            ((name, column[idx]) for name, column in serialized_columns.items()),
+            {name: column[idx] for name, column in deserialized_columns.items()},
+        )
+        for idx in range(msg.size)
+    ]
+
+
 def serialize_kv(map: Mapping) -> bytes:
     # relative
     from .serialize import _serialize
@@ -1,5 +1,8 @@
 # stdlib
 from typing import Any
+from typing import BinaryIO
+from typing import List
+from typing import Optional
 
 
 def _serialize(
@@ -7,11 +10,40 @@ def _serialize(
     to_proto: bool = True,
     to_bytes: bool = False,
     for_hashing: bool = False,
+    buffers: Optional[List[memoryview]] = None,
+    to_stream: Optional[BinaryIO] = None,
 ) -> Any:
+    """Serialize `obj` with the recursive serde.
+
+    If a `buffers` list is provided, large payloads (numpy / arrow buffers,
+    bytes fields etc.) are appended to it as memoryviews instead of being
+    copied into the capnp message at every nesting level. The same list has to
+    be passed to `deserialize` to get the object back.
+
+    If `to_stream` is provided, the object and its out-of-band buffers are
+    written incrementally to that file-like object and the number of bytes
+    written is returned. Use `deserialize(stream, from_stream=True)` to read it.
+    """
     # relative
+    from .compression import CompressionTransport
+    from .compression import compression_transport
+    from .recursive import oob_buffers
     from .recursive import rs_object2proto
+    from .stream import serialize_to_stream
+
+    if to_stream is not None:
+        return serialize_to_stream(obj, to_stream)
 
-    proto = rs_object2proto(obj, for_hashing=for_hashing)
+    if for_hashing:
+        # hashes need to cover the payloads, so those always stay inline, and
+        # must not depend on the transport, so those are never compressed
+        with oob_buffers(None), compression_transport(CompressionTransport.HASHING):
+            proto = rs_object2proto(obj, for_hashing=True)
+    elif buffers is not None:
+        with oob_buffers(buffers):
+            proto = rs_object2proto(obj)
+    else:
+        proto = rs_object2proto(obj)
 
     if to_bytes:
         return proto.to_bytes()
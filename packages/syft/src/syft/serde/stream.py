@@ -0,0 +1,225 @@
+# stdlib
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import Any
+from typing import AsyncIterator
+from typing import BinaryIO
+from typing import Callable
+from typing import Generator
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# relative
+from .recursive import oob_buffers
+from .recursive import recursive_scheme
+from .recursive import rs_proto2object
+
+# A syft stream is the capnp stream framing of the RecursiveSerde skeleton
+# (identical to `to_bytes`) followed by a table of out-of-band buffers:
+#
+#   <capnp segment table> <segments> <uint64 buffer count> (<uint64 size> <buffer>)*
+#
+# A plain `to_bytes` blob is therefore a valid stream without buffers.
+STREAM_MEDIA_TYPE = "application/vnd.syft.stream"
+
+# upper bound for the size of a single chunk yielded by `iter_serialized`
+STREAM_CHUNK_SIZE = 2**20
+
+MAX_TRAVERSAL_LIMIT = 2**64 - 1
+
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+
+Frames = Tuple[List[Union[bytes, memoryview]], List[Union[bytes, memoryview]]]
+
+
+def _chunks(data: Union[bytes, memoryview]) -> Iterator[memoryview]:
+    view = memoryview(data).cast("B")
+    for start in range(0, len(view), STREAM_CHUNK_SIZE):
+        yield view[start : start + STREAM_CHUNK_SIZE]  # noqa: E203
+
+
+def iter_serialized(obj: Any) -> Iterator[memoryview]:
+    """Serialize `obj` as a syft stream, one bounded chunk at a time.
+
+    Large payloads are emitted out-of-band and written straight from the
+    memory of the original object, so the whole stream never has to be
+    materialized.
+    """
+    # relative
+    from .serialize import _serialize
+
+    buffers: List[memoryview] = []
+    proto = _serialize(obj, to_proto=True, buffers=buffers)
+    segments = proto.to_segments()
+
+    header = _UINT32.pack(len(segments) - 1)
+    header += b"".join(_UINT32.pack(len(segment) // 8) for segment in segments)
+    if len(segments) % 2 == 0:
+        # the segment table is padded to a word boundary
+        header += b"\x00" * 4
+    yield memoryview(header)
+
+    for segment in segments:
+        yield from _chunks(segment)
+
+    yield memoryview(_UINT64.pack(len(buffers)))
+    for buffer in buffers:
+        yield memoryview(_UINT64.pack(buffer.nbytes))
+        yield from _chunks(buffer)
+
+
+def serialize_to_stream(obj: Any, stream: BinaryIO) -> int:
+    """Write `obj` to a file-like object, returns the number of bytes written."""
+    written = 0
+    for chunk in iter_serialized(obj):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _expect(data: bytes, size: int) -> bytes:
+    if len(data) != size:
+        raise EOFError(f"Truncated syft stream, expected {size} bytes got {len(data)}")
+    return data
+
+
+def _frame_parser() -> Generator[int, bytes, Frames]:
+    """Sans-io parser for a syft stream. It yields how many bytes it needs next,
+    is sent at most that many bytes back and finally returns the capnp segments
+    together with the out-of-band buffers."""
+    segment_count = _UINT32.unpack(_expect((yield 4), 4))[0] + 1
+    table = _expect((yield 4 * segment_count), 4 * segment_count)
+    sizes = struct.unpack(f"<{segment_count}I", table)
+    if segment_count % 2 == 0:
+        _expect((yield 4), 4)
+
+    segments = []
+    for size in sizes:
+        segments.append(_expect((yield size * 8), size * 8))
+
+    buffers: List[bytes] = []
+    count = yield 8
+    if len(count) == 0:
+        # plain `to_bytes` blob without a buffer table
+        return segments, buffers
+
+    for _ in range(_UINT64.unpack(_expect(count, 8))[0]):
+        size = _UINT64.unpack(_expect((yield 8), 8))[0]
+        buffers.append(_expect((yield size), size))
+    return segments, buffers
+
+
+def _read_exact(read: Callable[[int], Optional[bytes]], size: int) -> bytes:
+    parts = []
+    received = 0
+    while received < size:
+        # short reads are legal for sockets and raw streams
+        part = read(size - received)
+        if not part:
+            break
+        parts.append(part)
+        received += len(part)
+    return parts[0] if len(parts) == 1 else b"".join(parts)
+
+
+def read_frames(read: Callable[[int], Optional[bytes]]) -> Frames:
+    parser = _frame_parser()
+    size = next(parser)
+    try:
+        while True:
+            size = parser.send(_read_exact(read, size))
+    except StopIteration as result:
+        return result.value
+
+
+def read_buffer_frames(data: Union[bytes, memoryview, mmap.mmap]) -> Frames:
+    """The frames of a syft stream held in a buffer, as views into it"""
+    view = memoryview(data).cast("B")
+    offset = 0
+
+    def read(size: int) -> memoryview:
+        nonlocal offset
+        part = view[offset : offset + size]  # noqa: E203
+        offset += len(part)
+        return part
+
+    return read_frames(read)
+
+
+class AsyncChunkReader:
+    """Adapts an async iterator of arbitrarily sized chunks, like the body of a
+    starlette `Request.stream()`, to exact size reads."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self.chunks = chunks
+        self.remainder = memoryview(b"")
+
+    async def read(self, size: int) -> bytes:
+        parts = []
+        received = 0
+        while received < size:
+            if len(self.remainder) == 0:
+                try:
+                    self.remainder = memoryview(await self.chunks.__anext__())
+                except StopAsyncIteration:
+                    break
+                continue
+            part = self.remainder[: size - received]
+            self.remainder = self.remainder[len(part) :]  # noqa: E203
+            parts.append(part)
+            received += len(part)
+        return b"".join(parts)
+
+
+async def async_read_frames(chunks: AsyncIterator[bytes]) -> Frames:
+    reader = AsyncChunkReader(chunks)
+    parser = _frame_parser()
+    size = next(parser)
+    try:
+        while True:
+            size = parser.send(await reader.read(size))
+    except StopIteration as result:
+        return result.value
+
+
+def deserialize_frames(frames: Frames) -> Any:
+    segments, buffers = frames
+    proto = recursive_scheme.from_segments(
+        segments, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+    )
+    with oob_buffers(buffers):
+        return rs_proto2object(proto)
+
+
+def deserialize_from_stream(stream: BinaryIO) -> Any:
+    """Read an object written with `serialize_to_stream` from a file-like object."""
+    return deserialize_frames(read_frames(stream.read))
+
+
+def deserialize_from_file(path: Union[str, Path]) -> Any:
+    """Read an object written with `serialize_to_stream` from the file `path`.
+
+    The file is memory-mapped and its frames are views into the mapping, the
+    out-of-band buffers are only copied out of it by the codecs of the payloads
+    they hold. The peak memory is the size of the object plus its capnp skeleton,
+    not the size of the file.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise EOFError("Truncated syft stream, the file is empty")
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return deserialize_frames(read_buffer_frames(mapped))
+    finally:
+        try:
+            mapped.close()
+        except BufferError:
+            # views into the mapping are still referenced, by the traceback of an
+            # error, it is unmapped once they are collected
+            pass
@@ -2,7 +2,13 @@
 from datetime import date
 from datetime import datetime
 from datetime import time
+from datetime import timedelta
+from datetime import timezone
+from datetime import tzinfo
 from io import BytesIO
+import struct
+from typing import Optional
+from typing import Tuple
 
 # third party
 from dateutil import parser
@@ -13,8 +19,15 @@ from nacl.signing import VerifyKey
 import networkx as nx
 from networkx import DiGraph
 import numpy as np
+from pandas import Categorical
+from pandas import CategoricalIndex
 from pandas import DataFrame
+from pandas import DatetimeIndex
+from pandas import Index
+from pandas import MultiIndex
+from pandas import RangeIndex
 from pandas import Series
+from pandas import TimedeltaIndex
 from pandas._libs.tslibs.timestamps import Timestamp
 import pyarrow as pa
 import pyarrow.parquet as pq
@@ -88,36 +101,171 @@ recursive_serde_register(
 )
 
 
+# Arrow IPC streams start with a continuation marker, a capnp message can't
+ARROW_IPC_MARKER = b"\xff\xff\xff\xff"
+
+SERIES_COLUMN = "__series__"
+
+
+def serialize_arrow_table(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def deserialize_arrow_table(buf: bytes) -> pa.Table:
+    return pa.ipc.open_stream(pa.py_buffer(buf)).read_all()
+
+
+def serialize_series(series: Series) -> bytes:
+    try:
+        # the pandas metadata of the table keeps the dtype and the index
+        table = pa.Table.from_pandas(series.to_frame(name=SERIES_COLUMN))
+    except pa.ArrowException:
+        # mixed type objects arrow can't convert
+        values = (series.tolist(), series.index, series.name, str(series.dtype))
+        return serialize(values, to_bytes=True)
+    metadata = {
+        **table.schema.metadata,
+        b"series_name": serialize(series.name, to_bytes=True),
+    }
+    return serialize_arrow_table(table.replace_schema_metadata(metadata))
+
+
 def deserialize_series(blob: bytes) -> Series:
-    df = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return df[df.columns[0]]
+    if not blob.startswith(ARROW_IPC_MARKER):
+        values = deserialize(blob, from_bytes=True)
+        if isinstance(values, tuple):
+            data, index, name, dtype = values
+            series = Series(data, index=index, name=name, dtype=object)
+            return series.astype(dtype) if dtype == "category" else series
+        # series serialized as a dict by earlier versions
+        df = DataFrame.from_dict(values)
+        return df[df.columns[0]]
+
+    table = deserialize_arrow_table(blob)
+    series = table.to_pandas()[SERIES_COLUMN]
+    series.name = deserialize(table.schema.metadata[b"series_name"], from_bytes=True)
+    return series
 
 
 recursive_serde_register(
     Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
+    serialize=serialize_series,
     deserialize=deserialize_series,
 )
 
 
-recursive_serde_register(
-    datetime,
-    serialize=lambda x: serialize(x.isoformat(), to_bytes=True),
-    deserialize=lambda x: parser.isoparse(deserialize(x, from_bytes=True)),
-)
+def serialize_index(index: Index) -> bytes:
+    try:
+        table = pa.Table.from_pandas(DataFrame(index=index))
+    except pa.ArrowException:
+        # mixed type objects arrow can't convert
+        return serialize((index.tolist(), list(index.names)), to_bytes=True)
+    return serialize_arrow_table(table)
+
+
+def deserialize_index(blob: bytes) -> Index:
+    if not blob.startswith(ARROW_IPC_MARKER):
+        values, names = deserialize(blob, from_bytes=True)
+        return Index(values).set_names(names)
+    return deserialize_arrow_table(blob).to_pandas().index
+
+
+# the numeric index classes only exist before pandas 2
+NUMERIC_INDEX_TYPES = [
+    type(Index(np.zeros(0, dtype=dtype))) for dtype in ("int64", "uint64", "float64")
+]
+
+for index_type in [
+    Index,
+    MultiIndex,
+    RangeIndex,
+    CategoricalIndex,
+    DatetimeIndex,
+    TimedeltaIndex,
+    *NUMERIC_INDEX_TYPES,
+]:
+    recursive_serde_register(
+        index_type,
+        serialize=serialize_index,
+        deserialize=deserialize_index,
+    )
+
 
 recursive_serde_register(
-    time,
-    serialize=lambda x: serialize(x.isoformat(), to_bytes=True),
-    deserialize=lambda x: parser.parse(deserialize(x, from_bytes=True)).time(),
+    Categorical,
+    serialize=lambda x: serialize_series(Series(x)),
+    deserialize=lambda x: Categorical(deserialize_series(x)),
 )
 
+
+# naive datetimes and times are serialized as microseconds since the epoch or
+# midnight, aware ones are followed by the microseconds of their utc offset
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def _pack_temporal(micros: int, offset: Optional[timedelta]) -> bytes:
+    if offset is None:
+        return struct.pack("<q", micros)
+    return struct.pack("<qq", micros, offset // MICROSECOND)
+
+
+def _unpack_temporal(blob: bytes) -> Tuple[int, Optional[tzinfo]]:
+    micros, *offset = struct.unpack(f"<{len(blob) // 8}q", blob)
+    if not offset:
+        return micros, None
+    return micros, timezone(offset[0] * MICROSECOND)
+
+
+def serialize_datetime(x: datetime) -> bytes:
+    micros = (x.replace(tzinfo=None) - EPOCH) // MICROSECOND
+    return _pack_temporal(micros, x.utcoffset())
+
+
+def deserialize_datetime(blob: bytes) -> datetime:
+    if len(blob) not in (8, 16):
+        # isoformat strings written by earlier versions
+        return parser.isoparse(deserialize(blob, from_bytes=True))
+    micros, tz = _unpack_temporal(blob)
+    return (EPOCH + micros * MICROSECOND).replace(tzinfo=tz)
+
+
+def serialize_time(x: time) -> bytes:
+    micros = ((x.hour * 60 + x.minute) * 60 + x.second) * 1_000_000 + x.microsecond
+    return _pack_temporal(micros, x.utcoffset())
+
+
+def deserialize_time(blob: bytes) -> time:
+    if len(blob) not in (8, 16):
+        return parser.parse(deserialize(blob, from_bytes=True)).time()
+    micros, tz = _unpack_temporal(blob)
+    return (EPOCH + micros * MICROSECOND).time().replace(tzinfo=tz)
+
+
+def serialize_date(x: date) -> bytes:
+    # days since the epoch
+    return struct.pack("<q", (x - EPOCH.date()).days)
+
+
+def deserialize_date(blob: bytes) -> date:
+    if len(blob) != 8:
+        return parser.parse(deserialize(blob, from_bytes=True)).date()
+    return EPOCH.date() + timedelta(days=struct.unpack("<q", blob)[0])
+
+
 recursive_serde_register(
-    date,
-    serialize=lambda x: serialize(x.isoformat(), to_bytes=True),
-    deserialize=lambda x: parser.parse(deserialize(x, from_bytes=True)).date(),
+    datetime,
+    serialize=serialize_datetime,
+    deserialize=deserialize_datetime,
 )
 
+recursive_serde_register(time, serialize=serialize_time, deserialize=deserialize_time)
+
+recursive_serde_register(date, serialize=serialize_date, deserialize=deserialize_date)
+
 recursive_serde_register(
     Timestamp,
     serialize=lambda x: serialize(x.value, to_bytes=True),
@@ -28,6 +28,7 @@ from typing_extensions import Self
 from ...client.api import SyftAPI
 from ...client.client import SyftClient
 from ...serde.serializable import serializable
+from ...store.blob_storage import BlobFile
 from ...store.linked_obj import LinkedObject
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import SyftBaseObject
@@ -465,8 +466,9 @@ class ActionObject(SyftObject):
     def check_action_data(
         cls, v: ActionObject.syft_pointer_type
     ) -> ActionObject.syft_pointer_type:
+        # a stored object holds a reference to the blob file of its payload
         if cls == AnyActionObject or isinstance(
-            v, (cls.syft_internal_type, ActionDataEmpty)
+            v, (cls.syft_internal_type, ActionDataEmpty, BlobFile)
         ):
             return v
         raise SyftException(
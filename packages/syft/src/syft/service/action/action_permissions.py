@@ -1,11 +1,13 @@
 # stdlib
 from enum import Enum
+from typing import List
 from typing import Optional
 
 # relative
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...types.uid import UID
+from ..user.user_roles import ServiceRole
 
 
 @serializable()
@@ -27,6 +29,9 @@ COMPOUND_ACTION_PERMISSION = set(
     ]
 )
 
+# the permissions granted to everyone which imply the one of a user
+COMPOUND_PERMISSIONS = {ActionPermission.READ: ActionPermission.ALL_READ}
+
 
 @serializable()
 class ActionObjectPermission:
@@ -84,3 +89,26 @@ class ActionObjectEXECUTE(ActionObjectPermission):
         self.uid = uid
         self.credentials = credentials
         self.permission = ActionPermission.EXECUTE
+
+
+def role_permission_string(permission: ActionPermission, role: ServiceRole) -> str:
+    """The permission string of `permission` granted to the users with `role` or
+    a higher one"""
+    return f"ROLE_{role.name}_{permission.name}"
+
+
+def granting_permission_strings(
+    permission: ActionObjectPermission, role: Optional[ServiceRole] = None
+) -> List[str]:
+    """The permission strings any of which grants `permission`, to the users
+    with `role` for the role based ones"""
+    strings = [permission.permission_string]
+    if permission.permission in COMPOUND_PERMISSIONS:
+        strings.append(COMPOUND_PERMISSIONS[permission.permission].name)
+    if role is not None:
+        strings += [
+            role_permission_string(permission.permission, granted)
+            for granted in ServiceRole
+            if granted.value <= role.value
+        ]
+    return strings
@@ -3,6 +3,7 @@ import importlib
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Union
 
 # third party
@@ -12,6 +13,7 @@ from result import Ok
 from result import Result
 
 # relative
+from ...serde.deserialize import _deserialize
 from ...serde.serializable import serializable
 from ...types.twin_object import TwinObject
 from ...types.uid import UID
@@ -35,6 +37,8 @@ from .action_object import TwinMode
 from .action_permissions import ActionObjectREAD
 from .action_store import ActionStore
 from .action_types import action_type_for_type
+from .action_upload import ChunkedUploads
+from .action_upload import UploadStatus
 from .numpy import NumpyArrayObject
 from .pandas import PandasDataFrameObject  # noqa: F401
 from .pandas import PandasSeriesObject  # noqa: F401
@@ -92,6 +96,72 @@ class ActionService(AbstractService):
             return Ok(SyftSuccess(message=f"{type(action_object)} saved"))
         return result.err()
 
+    def _uploads(self, context: AuthedServiceContext) -> ChunkedUploads:
+        return ChunkedUploads(self.store.upload_path())
+
+    @service_method(
+        path="action.upload_init", name="upload_init", roles=GUEST_ROLE_LEVEL
+    )
+    def upload_init(
+        self, context: AuthedServiceContext, upload_id: UID
+    ) -> Union[UploadStatus, SyftError]:
+        """Start uploading an object in chunks, or resume its interrupted upload"""
+        result = self._uploads(context).start(upload_id, context.credentials)
+        if result.is_err():
+            return SyftError(message=result.err())
+        return result.ok()
+
+    @service_method(
+        path="action.upload_chunk", name="upload_chunk", roles=GUEST_ROLE_LEVEL
+    )
+    def upload_chunk(
+        self,
+        context: AuthedServiceContext,
+        upload_id: UID,
+        index: int,
+        data: bytes,
+        digest: str,
+    ) -> Union[SyftSuccess, SyftError]:
+        """Append the chunk `index` of an upload, `digest` is its sha256 hex digest"""
+        result = self._uploads(context).append(
+            upload_id, context.credentials, index, data, digest
+        )
+        if result.is_err():
+            return SyftError(message=result.err())
+        return SyftSuccess(message=f"Chunk {index} of upload {upload_id} received")
+
+    @service_method(
+        path="action.upload_commit", name="upload_commit", roles=GUEST_ROLE_LEVEL
+    )
+    def upload_commit(
+        self, context: AuthedServiceContext, upload_id: UID, chunk_count: int
+    ) -> Union[ActionObject, SyftError]:
+        """Assemble the `chunk_count` chunks of an upload and save the object"""
+        uploads = self._uploads(context)
+        result = uploads.assemble(upload_id, context.credentials, chunk_count)
+        if result.is_err():
+            return SyftError(message=result.err())
+
+        # the assembled upload is memory-mapped, only the object is held in memory
+        stream_path = result.ok()
+        try:
+            action_object = _deserialize(stream_path, from_stream=True)
+        except Exception as e:
+            return SyftError(message=f"Failed to assemble upload {upload_id}. {e}")
+        finally:
+            stream_path.unlink(missing_ok=True)
+        if not isinstance(action_object, (ActionObject, TwinObject)):
+            return SyftError(
+                message=f"Upload {upload_id} is a {type(action_object)}, "
+                "not an ActionObject or a TwinObject"
+            )
+
+        result = self.set(context, action_object)
+        if isinstance(result, str):
+            return SyftError(message=result)
+        uploads.delete(upload_id)
+        return result
+
     @service_method(path="action.get", name="get", roles=GUEST_ROLE_LEVEL)
     def get(
         self,
@@ -143,6 +213,31 @@ class ActionService(AbstractService):
             return Ok(result.ok())
         return Err(result.err())
 
+    @service_method(path="action.get_slice", name="get_slice", roles=GUEST_ROLE_LEVEL)
+    def get_slice(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        slices: Any = None,
+        columns: Optional[list] = None,
+        twin_mode: TwinMode = TwinMode.PRIVATE,
+    ) -> Result[Ok[ActionObject], Err[str]]:
+        """Get a part of an object from the action store, `data[slices]` with
+        only the `columns` of a DataFrame. Large objects are read in batches of
+        rows like this, without loading the whole object."""
+        result = self.store.get_slice(
+            uid=uid,
+            credentials=context.credentials,
+            slices=slices,
+            columns=columns,
+            twin_mode=twin_mode,
+        )
+        if result.is_ok():
+            obj = result.ok()
+            obj.syft_point_to(context.node.id)
+            return Ok(obj)
+        return result
+
     # not a public service endpoint
     def _user_code_execute(
         self,
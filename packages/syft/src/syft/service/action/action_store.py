@@ -2,10 +2,21 @@
 from __future__ import annotations
 
 # stdlib
+from numbers import Number
+from pathlib import Path
+import tempfile
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
 
 # third party
+import numpy as np
+import pandas as pd
 from result import Err
 from result import Ok
 from result import Result
@@ -14,14 +25,27 @@ from result import Result
 from ...node.credentials import SyftSigningKey
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
+from ...store.blob_storage import BlobFile
+from ...store.blob_storage import BlobStorage
 from ...store.dict_document_store import DictStoreConfig
+from ...store.dict_document_store import DictStoreSnapshot
 from ...store.document_store import BasePartitionSettings
+from ...store.document_store import RoleResolver
 from ...store.document_store import StoreConfig
+from ...store.document_store import StoreSnapshot
+from ...store.kv_document_store import KeyValuePermissionIndex
+from ...store.kv_document_store import resolve_role
+from ...store.sqlite_document_store import SQLitePermissionIndex
+from ...store.sqlite_document_store import SQLiteStoreSnapshot
+from ...store.sqlite_document_store import restore_database
+from ...store.sqlite_document_store import snapshot_database
 from ...types.syft_object import SyftObject
 from ...types.twin_object import TwinObject
 from ...types.uid import LineageID
 from ...types.uid import UID
 from ..response import SyftSuccess
+from ..user.user_roles import ServiceRole
+from .action_object import ActionObject
 from .action_object import TwinMode
 from .action_object import is_action_data_empty
 from .action_permissions import ActionObjectEXECUTE
@@ -36,6 +60,47 @@ class ActionStore:
     pass
 
 
+def _with_action_data(action_object: ActionObject, data: Any) -> ActionObject:
+    """A shallow copy of `action_object` holding `data`"""
+    # attribute access on action objects is forwarded to their data, pydantic
+    # `copy` would copy the data instead
+    values = dict(object.__getattribute__(action_object, "__dict__"))
+    values["syft_action_data"] = data
+    return action_object._copy_and_set_values(
+        values, set(action_object.__fields_set__), deep=False
+    )
+
+
+def _split_rows(slices: Any) -> Tuple[Optional[slice], Any]:
+    """Splits `slices` into a slice of contiguous rows, which can be read on its
+    own, and the indexing left to apply to those rows"""
+    rows, rest = slices, None
+    if isinstance(slices, tuple) and len(slices) > 0:
+        rows, rest = slices[0], (slice(None),) + slices[1:]
+    if isinstance(rows, slice) and rows.step in (None, 1):
+        return rows, rest
+    return None, slices
+
+
+def _index_data(data: Any, slices: Any) -> Any:
+    """`data[slices]`, by position for pandas objects"""
+    if slices is None:
+        return data
+    if isinstance(slices, slice) and (
+        isinstance(data, (Number, np.generic))
+        or (isinstance(data, np.ndarray) and data.ndim == 0)
+    ):
+        # a scalar has no rows, the batches of its rows are the scalar itself
+        return data
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[slices]
+    result = data[slices]
+    if isinstance(result, np.ndarray):
+        # a copy, without the rest of a memory-mapped array
+        return np.ascontiguousarray(result)
+    return result
+
+
 @serializable()
 class KeyValueActionStore(ActionStore):
     """Generic Key-Value Action store.
@@ -47,6 +112,11 @@ class KeyValueActionStore(ActionStore):
             Signature verification key, used for checking access permissions.
     """
 
+    # the role resolver is a method of the node, which sets it again
+    __serde_overrides__: Dict[str, Sequence[Callable]] = {
+        "role_resolver": (lambda _: None, lambda _: None)
+    }
+
     def __init__(
         self, store_config: StoreConfig, root_verify_key: Optional[SyftVerifyKey] = None
     ) -> None:
@@ -55,12 +125,90 @@ class KeyValueActionStore(ActionStore):
         self.data = self.store_config.backing_store(
             "data", self.settings, self.store_config
         )
-        self.permissions = self.store_config.backing_store(
-            "permissions", self.settings, self.store_config, ddtype=set
-        )
+        self.permissions = self._init_permissions()
         if root_verify_key is None:
             root_verify_key = SyftSigningKey.generate().verify_key
         self.root_verify_key = root_verify_key
+        self.role_resolver: Optional[RoleResolver] = None
+        self.blob_storage = self._init_blob_storage()
+
+    def _init_permissions(self) -> KeyValuePermissionIndex:
+        return KeyValuePermissionIndex(self.settings, self.store_config)
+
+    def _init_blob_storage(self) -> Optional[BlobStorage]:
+        config = self.store_config.blob_storage_config
+        if config is None:
+            return None
+        path = config.path if config.path is not None else self._blob_storage_path()
+        return BlobStorage(config, path)
+
+    def _blob_storage_path(self) -> Path:
+        # the nodes of a host don't share their files
+        return Path(tempfile.gettempdir()) / "syft_blobs" / self.root_verify_key.verify
+
+    def upload_path(self) -> Path:
+        """The directory of the chunked uploads to the store"""
+        return (
+            Path(tempfile.gettempdir()) / "syft_uploads" / self.root_verify_key.verify
+        )
+
+    def _payloads(self, syft_object: SyftObject) -> Dict[str, ActionObject]:
+        """The action objects holding the payloads of `syft_object`, by name"""
+        if isinstance(syft_object, TwinObject):
+            return {"private": syft_object.private_obj, "mock": syft_object.mock_obj}
+        if isinstance(syft_object, ActionObject):
+            return {"data": syft_object}
+        return {}
+
+    def _replace_payloads(
+        self, syft_object: SyftObject, payloads: Dict[str, ActionObject]
+    ) -> SyftObject:
+        if len(payloads) == 0:
+            return syft_object
+        if isinstance(syft_object, TwinObject):
+            update = {f"{name}_obj": obj for name, obj in payloads.items()}
+            return syft_object.copy(update=update)
+        return payloads["data"]
+
+    def _detach_blobs(self, uid: UID, syft_object: SyftObject) -> SyftObject:
+        """A copy of `syft_object` with its large payloads written to blob files,
+        which is stored in its place"""
+        if self.blob_storage is None:
+            return syft_object
+
+        detached = {}
+        for name, action_object in self._payloads(syft_object).items():
+            data = action_object.syft_action_data
+            if self.blob_storage.accepts(data):
+                blob = self.blob_storage.write(uid, name, data)
+                if blob is not None:
+                    detached[name] = _with_action_data(action_object, blob)
+        return self._replace_payloads(syft_object, detached)
+
+    def _attach_blobs(self, syft_object: SyftObject) -> SyftObject:
+        """A copy of the stored `syft_object` with its payloads loaded from their
+        blob files"""
+        if self.blob_storage is None:
+            return syft_object
+
+        attached = {}
+        for name, action_object in self._payloads(syft_object).items():
+            blob = action_object.syft_action_data
+            if isinstance(blob, BlobFile):
+                data = self.blob_storage.read(blob)
+                attached[name] = _with_action_data(action_object, data)
+        return self._replace_payloads(syft_object, attached)
+
+    def _blob_files(self, syft_object: SyftObject) -> List[str]:
+        return [
+            action_object.syft_action_data.name
+            for action_object in self._payloads(syft_object).values()
+            if isinstance(action_object.syft_action_data, BlobFile)
+        ]
+
+    def set_role_resolver(self, role_resolver: Optional[RoleResolver]) -> None:
+        """Sets how the store looks up the role of a verify key"""
+        self.role_resolver = role_resolver
 
     def get(
         self, uid: UID, credentials: SyftVerifyKey, has_permission=False
@@ -77,11 +225,57 @@ class KeyValueActionStore(ActionStore):
                     syft_object = self.data[uid]
                 else:
                     raise Exception(f"Unrecognized UID type: {type(uid)}")
-                return Ok(syft_object)
+                return Ok(self._attach_blobs(syft_object))
             except Exception as e:
                 return Err(f"Could not find item with uid {uid}, {e}")
         return Err(f"Permission: {read_permission} denied")
 
+    def get_slice(
+        self,
+        uid: UID,
+        credentials: SyftVerifyKey,
+        slices: Any = None,
+        columns: Optional[List[str]] = None,
+        twin_mode: TwinMode = TwinMode.PRIVATE,
+    ) -> Result[ActionObject, str]:
+        """A part of the data of the object `uid`: `data[slices]`, by position for
+        pandas objects, and only the `columns` of a DataFrame. Only that part is
+        read from the blob file of a large payload."""
+        uid = uid.id  # We only need the UID from LineageID or UID
+
+        read_permission = ActionObjectREAD(uid=uid, credentials=credentials)
+        has_permission = self.has_permission(read_permission)
+        if not has_permission and twin_mode != TwinMode.MOCK:
+            return Err(f"Permission: {read_permission} denied")
+
+        try:
+            syft_object = self.data[uid]
+            if not has_permission and not isinstance(syft_object, TwinObject):
+                # only the mock of a twin can be read by anyone, like with
+                # `get_pointer`
+                return Err(f"Permission: {read_permission} denied")
+            if isinstance(syft_object, TwinObject):
+                if twin_mode == TwinMode.MOCK:
+                    syft_object = syft_object.mock
+                else:
+                    syft_object = syft_object.private
+            data = syft_object.syft_action_data
+
+            if isinstance(data, BlobFile):
+                rows, slices = _split_rows(slices)
+                data = self.blob_storage.read(data, columns=columns, rows=rows)
+            elif columns is not None:
+                if not isinstance(data, pd.DataFrame):
+                    raise ValueError("Only the columns of a DataFrame can be selected")
+                data = data[list(columns)]
+            data = _index_data(data, slices)
+        except Exception as e:
+            return Err(f"Could not read a slice of item with uid {uid}, {e}")
+
+        action_object = ActionObject.from_obj(data, id=uid)
+        action_object.syft_twin_type = syft_object.syft_twin_type
+        return Ok(action_object)
+
     def get_pointer(
         self, uid: UID, credentials: SyftVerifyKey, node_uid: UID
     ) -> Result[SyftObject, str]:
@@ -90,7 +284,7 @@ class KeyValueActionStore(ActionStore):
         try:
             # 🟡 TODO 34: do we want pointer read permissions?
             if uid in self.data:
-                obj = self.data[uid]
+                obj = self._attach_blobs(self.data[uid])
                 if isinstance(obj, TwinObject):
                     obj = (
                         obj.mock if not is_action_data_empty(obj.mock) else obj.private
@@ -137,11 +331,12 @@ class KeyValueActionStore(ActionStore):
                 can_write = True if ownership_result.is_ok() else False
 
         if can_write:
-            self.data[uid] = syft_object
+            stored = self._detach_blobs(uid, syft_object)
+            self.data[uid] = stored
+            if self.blob_storage is not None:
+                # the files of the payloads which are now stored inline
+                self.blob_storage.delete(uid, keep=self._blob_files(stored))
             if has_result_read_permission:
-                if uid not in self.permissions:
-                    # create default permissions
-                    self.permissions[uid] = set()
                 self.add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
             else:
                 self.add_permissions(
@@ -182,8 +377,9 @@ class KeyValueActionStore(ActionStore):
         if self.has_permission(owner_permission):
             if uid in self.data:
                 del self.data[uid]
-            if uid in self.permissions:
-                del self.permissions[uid]
+            if self.blob_storage is not None:
+                self.blob_storage.delete(uid)
+            self.permissions.revoke_all([uid])
             return Ok(SyftSuccess(message=f"ID: {uid} deleted"))
         return Err(f"Permission: {owner_permission} denied")
 
@@ -194,41 +390,58 @@ class KeyValueActionStore(ActionStore):
         if self.root_verify_key.verify == permission.credentials.verify:
             return True
 
-        if (
-            permission.uid in self.permissions
-            and permission.permission_string in self.permissions[permission.uid]
-        ):
+        if self.permissions.has(permission):
             return True
 
-        # 🟡 TODO 14: add ALL_READ, ALL_EXECUTE etc
-        if permission.permission == ActionPermission.OWNER:
-            pass
-        elif permission.permission == ActionPermission.READ:
-            pass
-        elif permission.permission == ActionPermission.WRITE:
-            pass
-        elif permission.permission == ActionPermission.EXECUTE:
-            pass
-
-        return False
+        if self.role_resolver is None or not self.permissions.has_role_grants(
+            permission.permission
+        ):
+            return False
+        role = resolve_role(self.role_resolver, permission.credentials)
+        return role is not None and self.permissions.has(permission, role=role)
 
     def has_permissions(self, permissions: List[ActionObjectPermission]) -> bool:
         return all([self.has_permission(p) for p in permissions])
 
     def add_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.add(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.grant([permission])
 
     def remove_permission(self, permission: ActionObjectPermission):
-        permissions = self.permissions[permission.uid]
-        permissions.remove(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.revoke([permission])
 
     def add_permissions(self, permissions: List[ActionObjectPermission]) -> None:
-        results = []
-        for permission in permissions:
-            results.append(self.add_permission(permission))
+        self.permissions.grant(permissions)
+
+    def remove_permissions(self, permissions: List[ActionObjectPermission]) -> None:
+        self.permissions.revoke(permissions)
+
+    def add_role_permission(
+        self, uids: List[UID], permission: ActionPermission, role: ServiceRole
+    ) -> None:
+        """Grants `permission` on `uids` to the users with `role` or a higher one"""
+        self.permissions.grant_role(uids, permission, role)
+
+    def remove_role_permission(
+        self, uids: List[UID], permission: ActionPermission, role: ServiceRole
+    ) -> None:
+        self.permissions.revoke_role(uids, permission, role)
+
+    def snapshot(self) -> Result[StoreSnapshot, str]:
+        """A point-in-time copy of the data and permissions of the store"""
+        return Err(f"{type(self).__name__} does not support snapshots")
+
+    def _snapshot_blobs(self, snapshot: StoreSnapshot, path: Path) -> None:
+        if self.blob_storage is not None:
+            self.blob_storage.snapshot(path)
+            snapshot.blob_path = path
+
+    def _restore_blobs(self, snapshot: StoreSnapshot) -> None:
+        if self.blob_storage is not None:
+            self.blob_storage.restore(snapshot.blob_path)
+
+    def restore(self, snapshot: StoreSnapshot) -> Result[SyftSuccess, str]:
+        """Replaces the data and permissions of the store with `snapshot`"""
+        return Err(f"{type(self).__name__} does not support snapshots")
 
 
 @serializable()
@@ -250,6 +463,38 @@ class DictActionStore(KeyValueActionStore):
         store_config = store_config if store_config is not None else DictStoreConfig()
         super().__init__(store_config=store_config, root_verify_key=root_verify_key)
 
+    def snapshot(self) -> Result[DictStoreSnapshot, str]:
+        stores = {
+            "data": self.data,
+            "permissions": self.permissions.grants,
+            "permission_uids": self.permissions.uids,
+        }
+        snapshot = DictStoreSnapshot(
+            partitions={
+                self.settings.name: (
+                    self.settings,
+                    {name: store.snapshot() for name, store in stores.items()},
+                )
+            }
+        )
+        if self.blob_storage is not None:
+            blob_path = self.blob_storage.path
+            self._snapshot_blobs(
+                snapshot, blob_path.with_name(f"{blob_path.name}.{UID().no_dash}")
+            )
+        return Ok(snapshot)
+
+    def restore(self, snapshot: DictStoreSnapshot) -> Result[SyftSuccess, str]:
+        if self.settings.name not in snapshot.partitions:
+            return Err(f"No {self.settings.name} data in the snapshot")
+
+        _, stores = snapshot.partitions[self.settings.name]
+        self.data.restore(stores["data"])
+        self.permissions.grants.restore(stores["permissions"])
+        self.permissions.uids.restore(stores["permission_uids"])
+        self._restore_blobs(snapshot)
+        return Ok(SyftSuccess(message="Restored the action store"))
+
 
 @serializable()
 class SQLiteActionStore(KeyValueActionStore):
@@ -262,4 +507,37 @@ class SQLiteActionStore(KeyValueActionStore):
             Signature verification key, used for checking access permissions.
     """
 
-    pass
+    def _init_permissions(self) -> SQLitePermissionIndex:
+        return SQLitePermissionIndex(self.settings, self.store_config)
+
+    def _blob_storage_path(self) -> Path:
+        file_path = self.store_config.client_config.file_path
+        if file_path is None:
+            return super()._blob_storage_path()
+        # next to the database, named after it
+        return file_path.with_name(f"{file_path.stem}_blobs")
+
+    def upload_path(self) -> Path:
+        file_path = self.store_config.client_config.file_path
+        if file_path is None:
+            return super().upload_path()
+        return file_path.with_name(f"{file_path.stem}_uploads")
+
+    def snapshot(
+        self, path: Optional[Union[str, Path]] = None
+    ) -> Result[SQLiteStoreSnapshot, str]:
+        res = snapshot_database(self.store_config.client_config, path)
+        if res.is_ok():
+            # the blob files next to the copy of the database
+            snapshot = res.ok()
+            file_path = snapshot.file_path
+            self._snapshot_blobs(
+                snapshot, file_path.with_name(f"{file_path.name}_blobs")
+            )
+        return res
+
+    def restore(self, snapshot: SQLiteStoreSnapshot) -> Result[SyftSuccess, str]:
+        res = restore_database(self.store_config.client_config, snapshot)
+        if res.is_ok():
+            self._restore_blobs(snapshot)
+        return res
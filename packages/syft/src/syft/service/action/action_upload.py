@@ -0,0 +1,281 @@
+# stdlib
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import time
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Union
+import uuid
+
+# third party
+import requests
+from result import Err
+from result import Ok
+from result import Result
+
+# relative
+from ...node.credentials import SyftVerifyKey
+from ...serde.serializable import serializable
+from ...serde.stream import iter_serialized
+from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SyftObject
+from ...types.uid import UID
+from ..response import SyftError
+
+# the size of the chunks an object is uploaded in
+UPLOAD_CHUNK_SIZE = 8 * 2**20
+
+# how many times a chunk is sent again after the connection failed
+UPLOAD_RETRIES = 3
+
+# the most bytes the uploads in progress on a node can hold on disk
+UPLOAD_MAX_BYTES = 16 * 2**30
+
+# seconds after its last chunk an upload that was not committed is deleted
+UPLOAD_EXPIRY = 24 * 60 * 60
+
+_OWNER_FILE = "owner"
+_CHUNK_SUFFIX = ".chunk"
+_STREAM_FILE = "stream"
+
+
+def chunk_digest(chunk: Union[bytes, memoryview]) -> str:
+    return hashlib.sha256(chunk).hexdigest()
+
+
+def iter_chunks(
+    stream: Iterable[Union[bytes, memoryview]], chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Regroups the parts of a syft stream into chunks of `chunk_size` bytes, the
+    last chunk can be smaller."""
+    chunk = bytearray()
+    for part in stream:
+        view = memoryview(part).cast("B")
+        while len(view) > 0:
+            missing = chunk_size - len(chunk)
+            chunk += view[:missing]
+            view = view[missing:]
+            if len(chunk) == chunk_size:
+                yield bytes(chunk)
+                chunk = bytearray()
+    if len(chunk) > 0:
+        yield bytes(chunk)
+
+
+@serializable()
+class UploadStatus(SyftObject):
+    """The chunks received for the upload `id`, by index, with their digest"""
+
+    __canonical_name__ = "UploadStatus"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    chunks: Dict[int, str] = {}
+
+
+class ChunkedUploads:
+    """The chunks of the uploads in progress, kept on disk until their upload is
+    committed so an interrupted upload can be resumed, from any process of the
+    node. Each upload is a directory holding its chunks, named after their index
+    and digest, and the verify key of the user who started it.
+
+    The uploads can be started by guests: all the chunks they hold on disk are
+    capped to `max_bytes` and an upload is deleted once no chunk was received for
+    it for `expiry` seconds.
+
+    Parameters:
+        path: Path
+            The directory of the uploads, owned by the node
+        max_bytes: int
+            The most bytes the uploads in progress can hold, together
+        expiry: float
+            Seconds after its last chunk an upload is deleted
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = UPLOAD_MAX_BYTES,
+        expiry: float = UPLOAD_EXPIRY,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.expiry = expiry
+
+    def _upload_path(self, upload_id: UID) -> Path:
+        return self.path / upload_id.no_dash
+
+    def _chunk_files(self, upload_id: UID) -> Dict[int, Path]:
+        files = {}
+        for path in self._upload_path(upload_id).glob(f"*{_CHUNK_SUFFIX}"):
+            index, _ = path.stem.split(".")
+            files[int(index)] = path
+        return files
+
+    def _check_owner(
+        self, upload_id: UID, credentials: SyftVerifyKey
+    ) -> Result[Path, str]:
+        upload_path = self._upload_path(upload_id)
+        owner_path = upload_path / _OWNER_FILE
+        if not owner_path.exists():
+            return Err(f"No upload {upload_id} in progress")
+        if owner_path.read_text() != str(credentials):
+            return Err(f"Upload {upload_id} was started by another user")
+        return Ok(upload_path)
+
+    def _upload_paths(self) -> List[Path]:
+        if not self.path.exists():
+            return []
+        return [path for path in self.path.iterdir() if path.is_dir()]
+
+    def _size(self) -> int:
+        size = 0
+        for upload_path in self._upload_paths():
+            for path in upload_path.iterdir():
+                if path.name == _OWNER_FILE:
+                    continue
+                try:
+                    size += path.stat().st_size
+                except FileNotFoundError:
+                    # committed or replaced meanwhile
+                    pass
+        return size
+
+    def purge(self) -> None:
+        """Deletes the uploads no chunk was received for since `expiry` seconds"""
+        expired = time.time() - self.expiry
+        for upload_path in self._upload_paths():
+            try:
+                # adding a chunk file updates the directory
+                if upload_path.stat().st_mtime < expired:
+                    shutil.rmtree(upload_path, ignore_errors=True)
+            except FileNotFoundError:
+                pass
+
+    def status(self, upload_id: UID) -> UploadStatus:
+        chunks = {
+            index: path.stem.split(".")[1]
+            for index, path in self._chunk_files(upload_id).items()
+        }
+        return UploadStatus(id=upload_id, chunks=chunks)
+
+    def start(
+        self, upload_id: UID, credentials: SyftVerifyKey
+    ) -> Result[UploadStatus, str]:
+        """Starts the upload `upload_id`, or resumes it if it is in progress"""
+        self.purge()
+        # the chunks are only readable by the node
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        upload_path = self._upload_path(upload_id)
+        upload_path.mkdir(mode=0o700, exist_ok=True)
+        owner_path = upload_path / _OWNER_FILE
+        if not owner_path.exists():
+            owner_path.write_text(str(credentials))
+
+        result = self._check_owner(upload_id, credentials)
+        if result.is_err():
+            return result
+        return Ok(self.status(upload_id))
+
+    def append(
+        self,
+        upload_id: UID,
+        credentials: SyftVerifyKey,
+        index: int,
+        data: bytes,
+        digest: str,
+    ) -> Result[int, str]:
+        """Writes the chunk `index` of the upload, replacing a previous one"""
+        result = self._check_owner(upload_id, credentials)
+        if result.is_err():
+            return result
+        upload_path = result.ok()
+
+        if index < 0:
+            return Err(f"Invalid chunk index {index}")
+        if chunk_digest(data) != digest:
+            return Err(f"Chunk {index} of upload {upload_id} is corrupted")
+        if self._size() + len(data) > self.max_bytes:
+            return Err(
+                f"Chunk {index} of upload {upload_id} exceeds the {self.max_bytes} "
+                "bytes the uploads in progress can hold"
+            )
+
+        # written under a temporary name, a chunk file is always complete
+        temp_path = upload_path / f".{index}.{uuid.uuid4().hex}"
+        temp_path.write_bytes(data)
+        previous = self._chunk_files(upload_id).get(index, None)
+        os.replace(temp_path, upload_path / f"{index}.{digest}{_CHUNK_SUFFIX}")
+        if previous is not None and previous.stem.split(".")[1] != digest:
+            previous.unlink(missing_ok=True)
+        return Ok(len(data))
+
+    def assemble(
+        self, upload_id: UID, credentials: SyftVerifyKey, chunk_count: int
+    ) -> Result[Path, str]:
+        """Concatenates the `chunk_count` chunks of the upload, in order, into a
+        single file holding the syft stream of the object and returns its path.
+        The chunks are copied a block at a time, never held in memory."""
+        result = self._check_owner(upload_id, credentials)
+        if result.is_err():
+            return result
+        upload_path = result.ok()
+
+        files = self._chunk_files(upload_id)
+        missing = [index for index in range(chunk_count) if index not in files]
+        if len(missing) > 0:
+            return Err(f"Upload {upload_id} is missing the chunks {missing}")
+
+        stream_path = upload_path / _STREAM_FILE
+        with open(stream_path, "wb") as stream:
+            for index in range(chunk_count):
+                with open(files[index], "rb") as chunk:
+                    shutil.copyfileobj(chunk, stream)
+        return Ok(stream_path)
+
+    def delete(self, upload_id: UID) -> None:
+        shutil.rmtree(self._upload_path(upload_id), ignore_errors=True)
+
+
+def upload_action_object(
+    action_service: Any, action_object: Any, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Any:
+    """Uploads `action_object` to the action store in chunks of `chunk_size` bytes
+    through the `action` API module `action_service`.
+
+    The object is serialized while it is sent, one chunk at a time. The chunks
+    the node already received for the object, from an earlier interrupted upload,
+    are not sent again. Returns the pointer to the object, or a `SyftError`.
+    """
+    status = action_service.upload_init(upload_id=action_object.id)
+    if isinstance(status, SyftError):
+        return status
+
+    chunk_count = 0
+    for index, chunk in enumerate(
+        iter_chunks(iter_serialized(action_object), chunk_size)
+    ):
+        chunk_count += 1
+        digest = chunk_digest(chunk)
+        if status.chunks.get(index, None) == digest:
+            continue
+
+        for attempt in range(UPLOAD_RETRIES + 1):
+            try:
+                result = action_service.upload_chunk(
+                    upload_id=action_object.id, index=index, data=chunk, digest=digest
+                )
+                break
+            except requests.ConnectionError:
+                if attempt == UPLOAD_RETRIES:
+                    raise
+        if isinstance(result, SyftError):
+            return result
+
+    return action_service.upload_commit(
+        upload_id=action_object.id, chunk_count=chunk_count
+    )
@@ -36,9 +36,11 @@ class PandasDataFrameObject(ActionObject):
         return getattr(self.syft_action_data, method)
 
     def syft_is_property(self, obj: Any, method: str) -> bool:
-        cols = self.syft_action_data.columns.values.tolist()
-        if method in cols:
-            return True
+        # a stored object can hold the reference to a blob file instead
+        if isinstance(self.syft_action_data, DataFrame):
+            cols = self.syft_action_data.columns.values.tolist()
+            if method in cols:
+                return True
         return super().syft_is_property(obj, method)
 
 
@@ -197,7 +197,8 @@ class UserCode(SyftObject):
 
     def __setattr__(self, key: str, value: Any) -> None:
         attr = getattr(type(self), key, None)
-        if inspect.isdatadescriptor(attr):
+        # private attributes are slot descriptors without a setter
+        if inspect.isdatadescriptor(attr) and hasattr(attr, "fset"):
             attr.fset(self, value)
         else:
             return super().__setattr__(key, value)
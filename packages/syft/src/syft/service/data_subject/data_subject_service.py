@@ -75,16 +75,22 @@ class DataSubjectService(AbstractService):
         )
 
         member_relationships = data_subject.member_relationships
+        data_subjects = [
+            ds.to(DataSubject, context=context)
+            for member_relationship in member_relationships
+            for ds in member_relationship
+        ]
+        result = self.stash.set_many(
+            context.credentials, data_subjects, ignore_duplicates=True
+        )
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        for ds_result in result.ok():
+            if ds_result.is_err():
+                return SyftError(message=str(ds_result.err()))
+
         for member_relationship in member_relationships:
             parent_ds, child_ds = member_relationship
-            for ds in [parent_ds, child_ds]:
-                result = self.stash.set(
-                    context.credentials,
-                    ds.to(DataSubject, context=context),
-                    ignore_duplicates=True,
-                )
-                if result.is_err():
-                    return SyftError(message=str(result.err()))
             result = member_relationship_add(context, parent_ds.name, child_ds.name)
             if isinstance(result, SyftError):
                 return result
@@ -5,6 +5,7 @@ from enum import Enum
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -201,6 +202,13 @@ class Asset(SyftObject):
 
     @property
     def data(self) -> Any:
+        return self.get_data()
+
+    def get_data(self, mock: bool = False) -> Any:
+        """The private data, or the `mock` data of the asset"""
+        if mock:
+            return self.mock
+
         # relative
         from ...client.api import APIRegistry
 
@@ -214,6 +222,69 @@ class Asset(SyftObject):
         else:
             return None
 
+    def get_slice(
+        self,
+        slices: Any = None,
+        columns: Optional[List[str]] = None,
+        mock: bool = False,
+    ) -> Any:
+        """A part of the private data, or of the `mock` data, `data[slices]` by
+        position, with only the `columns` of a DataFrame. Only that part is read
+        on the node and sent."""
+        # relative
+        from ...client.api import APIRegistry
+        from ..action.action_object import TwinMode
+
+        api = APIRegistry.api_for(
+            node_uid=self.node_uid,
+            user_verify_key=self.syft_client_verify_key,
+        )
+        # the api only checks the first type of an Optional, None is not sent
+        kwargs = {"columns": columns} if columns is not None else {}
+        res = api.services.action.get_slice(
+            self.action_id,
+            slices=slices,
+            twin_mode=TwinMode.MOCK if mock else TwinMode.PRIVATE,
+            **kwargs,
+        )
+        if not self.has_permission(res):
+            return None
+        if isinstance(res, str):
+            return SyftError(message=res)
+        if isinstance(res, SyftError):
+            return res
+        return res.syft_action_data
+
+    def iter_data(
+        self,
+        batch_size: int = 10_000,
+        columns: Optional[List[str]] = None,
+        mock: bool = False,
+    ) -> Iterator[Any]:
+        """The private data, or the `mock` data, in batches of `batch_size` rows,
+        with only the `columns` of a DataFrame, so a large asset is never held in
+        memory at once"""
+        start = 0
+        while True:
+            batch = self.get_slice(
+                slice(start, start + batch_size), columns=columns, mock=mock
+            )
+            if batch is None:
+                return
+            if isinstance(batch, SyftError):
+                raise SyftException(batch.message)
+            try:
+                size = len(batch)
+            except TypeError:
+                # a scalar or a 0-d array has no rows, it is a single batch
+                yield batch
+                return
+            if size > 0:
+                yield batch
+            if size < batch_size:
+                return
+            start += batch_size
+
 
 def _is_action_data_empty(obj: Any) -> bool:
     # just a wrapper of action_object.is_action_data_empty
@@ -353,7 +424,8 @@ class CreateAsset(SyftObject):
 def get_shape_or_len(obj: Any) -> Optional[Union[Tuple[int, ...], int]]:
     if hasattr(obj, "shape"):
         shape = getattr(obj, "shape", None)
-        if shape:
+        # the shape of a 0-d array is empty, it has no length either
+        if shape is not None:
             return shape
     len_attr = getattr(obj, "__len__", None)
     if len_attr is not None:
@@ -6,6 +6,7 @@ from typing import Union
 # relative
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
+from ...store.document_store import StorePage
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
@@ -66,26 +67,40 @@ class DatasetService(AbstractService):
         page_index: Optional[int] = 0,
     ) -> Union[List[Dataset], SyftError]:
         """Get a Dataset"""
-        result = self.stash.get_all(context.credentials)
+        # If page size is defined, then only that page is read from the store
+        limit, offset = None, 0
+        if page_size:
+            limit, offset = page_size, page_size * (page_index or 0)
+
+        result = self.stash.get_all(context.credentials, limit=limit, offset=offset)
         if result.is_ok():
             datasets = result.ok()
             results = []
             for dataset in datasets:
                 dataset.node_uid = context.node.id
                 results.append(dataset)
-
-            # If chunk size is defined, then split list into evenly sized chunks
-            if page_size:
-                results = [
-                    results[i : i + page_size]
-                    for i in range(0, len(results), page_size)
-                ]
-                # Return the proper slice using chunk_index
-                results = results[page_index]
-
             return results
         return SyftError(message=result.err())
 
+    @service_method(path="dataset.get_page", name="get_page")
+    def get_page(
+        self,
+        context: AuthedServiceContext,
+        page_size: int,
+        cursor: Optional[str] = None,
+    ) -> Union[StorePage, SyftError]:
+        """Get a page of Datasets, the cursor of a page gets the next one"""
+        result = self.stash.get_page(
+            context.credentials, page_size=page_size, cursor=cursor
+        )
+        if result.is_err():
+            return SyftError(message=result.err())
+
+        page = result.ok()
+        for dataset in page.objs:
+            dataset.node_uid = context.node.id
+        return page
+
     @service_method(path="dataset.search", name="search")
     def search(
         self,
@@ -0,0 +1,24 @@
+# stdlib
+from typing import List
+
+# relative
+from ...serde.serializable import serializable
+from ...store.locks import LockReport
+from ..context import AuthedServiceContext
+from ..service import AbstractService
+from ..service import service_method
+from ..user.user_roles import ADMIN_ROLE_LEVEL
+
+
+@serializable()
+class DiagnosticsService(AbstractService):
+    @service_method(path="diagnostics.locks", name="locks", roles=ADMIN_ROLE_LEVEL)
+    def locks(
+        self, context: AuthedServiceContext, include_stacks: bool = False
+    ) -> List[LockReport]:
+        """The holders and contention metrics of the locks of the document store"""
+        partitions = context.node.document_store.partitions
+        return [
+            partition.lock.report(include_stacks=include_stacks)
+            for partition in partitions.values()
+        ]
@@ -117,8 +117,12 @@ class MessageStash(BaseUIDStoreStash):
         # get the list of messages
         messages = result.ok()
 
-        for message in messages:
-            result = self.delete_by_uid(credentials, uid=message.id)
-            if result.is_err():
-                return result
+        result = self.delete_many_by_uid(
+            credentials, uids=[message.id for message in messages]
+        )
+        if result.is_err():
+            return result
+        for message_result in result.ok():
+            if message_result.is_err():
+                return message_result
         return Ok(True)
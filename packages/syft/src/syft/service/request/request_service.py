@@ -115,7 +115,12 @@ class RequestService(AbstractService):
         page_size: Optional[int] = 0,
     ) -> Union[List[RequestInfo], SyftError]:
         """Get a Dataset"""
-        result = self.stash.get_all(context.credentials)
+        # If page size is defined, then only that page is read from the store
+        limit, offset = None, 0
+        if page_size:
+            limit, offset = page_size, page_size * (page_index or 0)
+
+        result = self.stash.get_all(context.credentials, limit=limit, offset=offset)
         method = context.node.get_service_method(UserService.get_by_verify_key)
         get_message = context.node.get_service_method(MessageService.filter_by_obj)
 
@@ -125,16 +130,6 @@ class RequestService(AbstractService):
                 user = method(req.requesting_user_verify_key).to(UserView)
                 message = get_message(context=context, obj_uid=req.id)
                 requests.append(RequestInfo(user=user, request=req, message=message))
-
-            # If chunk size is defined, then split list into evenly sized chunks
-            if page_size:
-                requests = [
-                    requests[i : i + page_size]
-                    for i in range(0, len(requests), page_size)
-                ]
-                # Return the proper slice using chunk_index
-                requests = requests[page_index]
-
             return requests
 
         return SyftError(message=result.err())
@@ -99,20 +99,14 @@ class UserService(AbstractService):
         page_size: Optional[int] = 0,
         page_index: Optional[int] = 0,
     ) -> Union[Optional[UserView], SyftError]:
-        result = self.stash.get_all(context.credentials)
+        # If page size is defined, then only that page is read from the store
+        limit, offset = None, 0
+        if page_size:
+            limit, offset = page_size, page_size * (page_index or 0)
+
+        result = self.stash.get_all(context.credentials, limit=limit, offset=offset)
         if result.is_ok():
-            results = [user.to(UserView) for user in result.ok()]
-
-            # If chunk size is defined, then split list into evenly sized chunks
-            if page_size:
-                results = [
-                    results[i : i + page_size]
-                    for i in range(0, len(results), page_size)
-                ]
-                # Return the proper slice using chunk_index
-                results = results[page_index]
-
-            return results
+            return [user.to(UserView) for user in result.ok()]
 
         # 🟡 TODO: No user exists will happen when result.ok() is empty list
         return SyftError(message="No users exists")
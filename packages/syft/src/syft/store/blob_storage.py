@@ -0,0 +1,213 @@
+# stdlib
+import os
+from pathlib import Path
+import shutil
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+import uuid
+
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pydantic import BaseModel
+
+# relative
+from ..serde.serializable import serializable
+from ..types.uid import UID
+
+# numpy dtype kinds which can be memory-mapped from a `.npy` file
+MEMMAP_KINDS = ("b", "i", "u", "f", "c", "m", "M")
+
+NPY_FORMAT = "npy"
+ARROW_FORMAT = "arrow"
+
+
+@serializable()
+class BlobStorageConfig(BaseModel):
+    """
+    Blob storage config
+
+    Args:
+        path: Optional[Path]
+            The directory of the blob files. Defaults to a directory next to the
+            database of the store, or to one for the node in the temporary
+            directory.
+        min_size: int
+            The arrays and DataFrames of at least this many bytes are stored as blob
+            files, the smaller ones are stored with their object.
+    """
+
+    path: Optional[Path] = None
+    min_size: int = 16 * 1024 * 1024
+
+
+@serializable()
+class BlobFile(BaseModel):
+    """A payload written to a blob file, stored in its place
+
+    Args:
+        name: str
+            The name of the file in the blob directory
+        format: str
+            `npy` for the numpy arrays, `arrow` for the DataFrames
+        size: int
+            The size of the payload in bytes
+    """
+
+    name: str
+    format: str
+    size: int
+
+
+class BlobStorage:
+    """Stores the large array and DataFrame payloads of a store as files, keyed by
+    the UID of their object. The arrays are written as `.npy` files and loaded
+    memory-mapped, the DataFrames as Arrow IPC files read from a memory map.
+
+    A file is replaced atomically when its object is written again, the previously
+    loaded payloads keep reading the file they were loaded from. As the files are
+    never modified, a snapshot of the store hard-links them.
+
+    Parameters:
+        config: BlobStorageConfig
+            The blob storage settings
+        path: Path
+            The directory of the blob files
+    """
+
+    def __init__(self, config: BlobStorageConfig, path: Path) -> None:
+        self.config = config
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def accepts(self, value: Any) -> bool:
+        """If `value` is a payload large enough to be stored as a blob file"""
+        # subclasses like masked arrays would lose their extra state
+        if type(value) is np.ndarray:
+            return (
+                value.dtype.kind in MEMMAP_KINDS
+                and value.nbytes >= self.config.min_size
+            )
+        if type(value) is pd.DataFrame:
+            size = value.memory_usage(index=True, deep=False).sum()
+            return int(size) >= self.config.min_size
+        return False
+
+    def _file_name(self, uid: UID, slot: str, format: str) -> str:
+        return f"{uid.no_dash}.{slot}.{format}"
+
+    def files(self, uid: UID) -> List[Path]:
+        return sorted(self.path.glob(f"{uid.no_dash}.*"))
+
+    @staticmethod
+    def _blob_files(path: Path) -> List[Path]:
+        # the files being written have a hidden temporary name
+        return sorted(p for p in path.glob("*") if not p.name.startswith("."))
+
+    @staticmethod
+    def _link(source: Path, target: Path) -> None:
+        try:
+            os.link(source, target)
+        except OSError:
+            # another file system, or no hard links
+            shutil.copy2(source, target)
+
+    def snapshot(self, path: Path) -> None:
+        """Links the blob files into the directory `path`, they keep the payloads
+        of the snapshot when the files of the store are replaced or deleted."""
+        path.mkdir(parents=True)
+        for source in self._blob_files(self.path):
+            self._link(source, path / source.name)
+
+    def restore(self, path: Optional[Path]) -> None:
+        """Replaces the blob files with the ones of the snapshot at `path`, None for
+        a snapshot without blob files. The payloads already loaded stay valid."""
+        for blob_path in self._blob_files(self.path):
+            blob_path.unlink(missing_ok=True)
+        if path is None:
+            return
+        for source in self._blob_files(path):
+            self._link(source, self.path / source.name)
+
+    def write(self, uid: UID, slot: str, value: Any) -> Optional[BlobFile]:
+        """Writes the `slot` payload of the object `uid` to its blob file, None if
+        it can't be stored as one and has to be stored with its object."""
+        if isinstance(value, np.ndarray):
+            format = NPY_FORMAT
+        else:
+            format = ARROW_FORMAT
+        name = self._file_name(uid, slot, format)
+        temp_path = self.path / f".{name}.{uuid.uuid4().hex}"
+        try:
+            if format == NPY_FORMAT:
+                with open(temp_path, "wb") as f:
+                    np.save(f, value, allow_pickle=False)
+                size = value.nbytes
+            else:
+                table = pa.Table.from_pandas(value)
+                with pa.OSFile(str(temp_path), "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                size = table.nbytes
+            os.replace(temp_path, self.path / name)
+        except (pa.ArrowException, ValueError):
+            # columns arrow can't convert, like mixed types
+            temp_path.unlink(missing_ok=True)
+            return None
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return BlobFile(name=name, format=format, size=size)
+
+    def read(
+        self,
+        blob: BlobFile,
+        columns: Optional[List[str]] = None,
+        rows: Optional[slice] = None,
+    ) -> Any:
+        """Loads the payload of `blob` from its memory-mapped file. Only the `rows`,
+        a slice with a step of 1, and the `columns` of a DataFrame are read."""
+        path = self.path / blob.name
+        if blob.format == NPY_FORMAT:
+            if columns is not None:
+                raise ValueError("Only the columns of a DataFrame can be selected")
+            # copy-on-write: the array is writable, the file is never modified
+            array = np.load(path, mmap_mode="c", allow_pickle=False)
+            array = array.view(np.ndarray)
+            return array if rows is None else array[rows]
+
+        source = pa.memory_map(str(path), "r")
+        table = pa.ipc.open_file(source).read_all()
+        index_columns = (table.schema.pandas_metadata or {}).get("index_columns", [])
+        if columns is not None:
+            # the index is stored as columns too, unless it is a range
+            stored_index = [
+                column for column in index_columns if isinstance(column, str)
+            ]
+            table = table.select(list(dict.fromkeys(list(columns) + stored_index)))
+        if rows is None:
+            return table.to_pandas()
+
+        start, stop, _ = rows.indices(table.num_rows)
+        df = table.slice(start, max(0, stop - start)).to_pandas()
+        if len(index_columns) == 1 and isinstance(index_columns[0], dict):
+            # arrow rebuilds a range index from 0 for a slice of the table
+            index = index_columns[0]
+            first = index["start"] + start * index["step"]
+            df.index = pd.RangeIndex(
+                first,
+                first + len(df) * index["step"],
+                index["step"],
+                name=index["name"],
+            )
+        return df
+
+    def delete(self, uid: UID, keep: Iterable[str] = ()) -> None:
+        """Deletes the blob files of the object `uid`, except the ones in `keep`"""
+        keep = set(keep)
+        for path in self.files(uid):
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
@@ -2,15 +2,27 @@
 from __future__ import annotations
 
 # stdlib
+from copy import deepcopy
 from typing import Any
+from typing import Dict
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Type
 
+# third party
+from result import Ok
+from result import Result
+
 # relative
 from ..node.credentials import SyftVerifyKey
 from ..serde.serializable import serializable
+from ..service.response import SyftSuccess
+from ..types.syft_object import SyftObject
+from .document_store import BasePartitionSettings
 from .document_store import DocumentStore
 from .document_store import StoreConfig
+from .document_store import StoreSnapshot
 from .kv_document_store import KeyValueBackingStore
 from .kv_document_store import KeyValueStorePartition
 from .locks import LockingConfig
@@ -24,16 +36,40 @@ class DictBackingStore(dict, KeyValueBackingStore):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super(dict).__init__()
         self._ddtype = kwargs.get("ddtype", None)
+        # the keys whose values are also referenced by a snapshot
+        self._shared: Set[Any] = set()
 
     def __getitem__(self, key: Any) -> Any:
         try:
             value = super().__getitem__(key)
-            return value
         except KeyError as e:
             if self._ddtype:
                 return self._ddtype()
             raise e
 
+        if key in self._shared:
+            # the callers may mutate the value in place, it is copied so the
+            # snapshots keep the one they were taken with
+            if isinstance(value, SyftObject):
+                value = value._syft_shallow_copy()
+            else:
+                value = deepcopy(value)
+            super().__setitem__(key, value)
+            self._shared.discard(key)
+        return value
+
+    def snapshot(self) -> Dict[Any, Any]:
+        """A copy of the store, its values are only copied when they are read
+        from the store again."""
+        self._shared = set(self.keys())
+        return dict(self)
+
+    def restore(self, data: Dict[Any, Any]) -> None:
+        self.clear()
+        self.update(data)
+        # the snapshot can be restored again
+        self._shared = set(self.keys())
+
 
 @serializable()
 class DictStorePartition(KeyValueStorePartition):
@@ -49,6 +85,31 @@ class DictStorePartition(KeyValueStorePartition):
     def prune(self):
         self.init_store()
 
+    @property
+    def backing_stores(self) -> Dict[str, DictBackingStore]:
+        return {
+            "data": self.data,
+            "permissions": self.permissions.grants,
+            "permission_uids": self.permissions.uids,
+            "unique_keys": self.unique_keys,
+            "searchable_keys": self.searchable_keys,
+        }
+
+
+class DictStoreSnapshot(StoreSnapshot):
+    """Dictionary-based snapshot, sharing the values which weren't read since it
+    was taken with the store.
+
+    Parameters:
+        partitions: Dict[str, Tuple[BasePartitionSettings, Dict[str, Dict]]]
+            The settings of each partition and the data of its backing stores
+    """
+
+    def __init__(
+        self, partitions: Dict[str, Tuple[BasePartitionSettings, Dict[str, Dict]]]
+    ) -> None:
+        self.partitions = partitions
+
 
 # the base document store is already a dict but we can change it later
 @serializable()
@@ -75,6 +136,48 @@ class DictDocumentStore(DocumentStore):
         for _, partition in self.partitions.items():
             partition.prune()
 
+    def snapshot(self) -> Result[DictStoreSnapshot, str]:
+        # the partitions are locked while their dicts are copied, which doesn't
+        # copy the objects
+        partitions = list(self.partitions.values())
+        for partition in partitions:
+            partition.lock.acquire(blocking=True)
+        try:
+            return Ok(
+                DictStoreSnapshot(
+                    partitions={
+                        partition.settings.name: (
+                            partition.settings,
+                            {
+                                name: store.snapshot()
+                                for name, store in partition.backing_stores.items()
+                            },
+                        )
+                        for partition in partitions
+                    }
+                )
+            )
+        finally:
+            for partition in partitions:
+                partition.lock.release()
+
+    def restore(self, snapshot: DictStoreSnapshot) -> Result[SyftSuccess, str]:
+        for name, partition in self.partitions.items():
+            if name not in snapshot.partitions:
+                partition.prune()
+
+        for settings, stores in snapshot.partitions.values():
+            partition = self.partition(settings)
+            partition.lock.acquire(blocking=True)
+            try:
+                for name, store in partition.backing_stores.items():
+                    store.restore(stores[name])
+            finally:
+                partition.lock.release()
+
+        self._clear_caches()
+        return Ok(SyftSuccess(message="Restored the store"))
+
 
 @serializable()
 class DictStoreConfig(StoreConfig):
@@ -2,14 +2,25 @@
 from __future__ import annotations
 
 # stdlib
+import base64
+import binascii
+from contextlib import contextmanager
+from itertools import islice
+import operator
+from pathlib import Path
+import re
 import sys
+import threading
 import types
 import typing
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -27,15 +38,19 @@ from ..node.credentials import SyftVerifyKey
 from ..serde.serializable import serializable
 from ..service.action.action_permissions import ActionObjectPermission
 from ..service.response import SyftSuccess
+from ..service.user.user_roles import ServiceRole
 from ..types.base import SyftBaseModel
 from ..types.syft_object import SYFT_OBJECT_VERSION_1
 from ..types.syft_object import SyftBaseObject
 from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from ..util.telemetry import instrument
+from .blob_storage import BlobStorageConfig
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
+from .object_cache import CacheConfig
+from .object_cache import ObjectCache
 
 
 @serializable()
@@ -50,6 +65,19 @@ class BasePartitionSettings(SyftBaseModel):
     name: str
 
 
+# looks up the role of a verify key, for the permissions granted to roles
+RoleResolver = Callable[[SyftVerifyKey], Optional[ServiceRole]]
+
+# the roles of the callers of the locked operations running in each thread
+_locked_roles = threading.local()
+
+
+def locked_roles() -> Optional[Dict[str, Optional[ServiceRole]]]:
+    """The roles resolved for the locked operation running in the thread, by
+    verify key. None outside of the locked operations."""
+    return getattr(_locked_roles, "roles", None)
+
+
 def first_or_none(result: Any) -> Ok:
     if hasattr(result, "__len__") and len(result) > 0:
         return Ok(result[0])
@@ -67,6 +95,44 @@ else:
         return isinstance(t, typing._GenericAlias)
 
 
+def paginate(objs: Iterable, limit: Optional[int] = None, offset: int = 0) -> List:
+    """The page of `objs` after the first `offset` ones, with at most `limit`
+    objects. Only the iterated objects of a generator are computed."""
+    stop = None if limit is None else offset + limit
+    return list(islice(objs, offset, stop))
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Result[int, str]:
+    if cursor is None:
+        return Ok(0)
+    try:
+        offset = int(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        return Err(f"Invalid cursor: {cursor}")
+    if offset < 0:
+        return Err(f"Invalid cursor: {cursor}")
+    return Ok(offset)
+
+
+@serializable()
+class StorePage(SyftBaseModel):
+    """A page of the objects of a listing
+
+    Parameters:
+        objs: List[Any]
+            The objects of the page
+        cursor: Optional[str]
+            Opaque token of the next page, None on the last page
+    """
+
+    objs: List[Any]
+    cursor: Optional[str] = None
+
+
 class StoreClientConfig(BaseModel):
     """Base Client specific configuration"""
 
@@ -137,6 +203,114 @@ class PartitionKeys(BaseModel):
         return PartitionKeys(pks=pks)
 
 
+@serializable()
+class QueryPredicate(SyftBaseModel):
+    """A condition on the values of a QueryKey, which otherwise matches a single
+    value by equality"""
+
+    @property
+    def type_(self) -> type:
+        raise NotImplementedError
+
+    def matches(self, value: Any) -> bool:
+        raise NotImplementedError
+
+    def describe(self, key: str) -> str:
+        raise NotImplementedError
+
+    @property
+    def as_mongo(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+@serializable()
+class InPredicate(QueryPredicate):
+    """Matches any of `values`"""
+
+    values: List[Any]
+
+    @property
+    def type_(self) -> type:
+        return type(self.values[0]) if len(self.values) > 0 else object
+
+    def matches(self, value: Any) -> bool:
+        return value in self.values
+
+    def describe(self, key: str) -> str:
+        return f"{key} in {self.values}"
+
+    @property
+    def as_mongo(self) -> Dict[str, Any]:
+        return {"$in": self.values}
+
+
+RANGE_OPERATORS = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+@serializable()
+class RangePredicate(QueryPredicate):
+    """Matches the values within the bounds, a bound which is None is open"""
+
+    gt: Optional[Any] = None
+    gte: Optional[Any] = None
+    lt: Optional[Any] = None
+    lte: Optional[Any] = None
+
+    @property
+    def bounds(self) -> Dict[str, Any]:
+        bounds = {op: getattr(self, op) for op in RANGE_OPERATORS}
+        return {op: bound for op, bound in bounds.items() if bound is not None}
+
+    @property
+    def type_(self) -> type:
+        bounds = list(self.bounds.values())
+        return type(bounds[0]) if len(bounds) > 0 else object
+
+    def matches(self, value: Any) -> bool:
+        try:
+            return all(
+                RANGE_OPERATORS[op](value, bound) for op, bound in self.bounds.items()
+            )
+        except TypeError:
+            # values which can't be compared to the bounds are out of the range
+            return False
+
+    def describe(self, key: str) -> str:
+        return " and ".join(
+            f"{key} {op} {bound!r}" for op, bound in self.bounds.items()
+        )
+
+    @property
+    def as_mongo(self) -> Dict[str, Any]:
+        return {f"${op}": bound for op, bound in self.bounds.items()}
+
+
+@serializable()
+class PrefixPredicate(QueryPredicate):
+    """Matches the strings starting with `prefix`"""
+
+    prefix: str
+
+    @property
+    def type_(self) -> type:
+        return str
+
+    def matches(self, value: Any) -> bool:
+        return isinstance(value, str) and value.startswith(self.prefix)
+
+    def describe(self, key: str) -> str:
+        return f"{key} startswith {self.prefix!r}"
+
+    @property
+    def as_mongo(self) -> Dict[str, Any]:
+        return {"$regex": f"^{re.escape(self.prefix)}"}
+
+
 @serializable()
 class QueryKey(PartitionKey):
     value: Any
@@ -153,13 +327,24 @@ class QueryKey(PartitionKey):
     def partition_key(self) -> PartitionKey:
         return PartitionKey(key=self.key, type_=self.type_)
 
+    @property
+    def predicate(self) -> Optional[QueryPredicate]:
+        return self.value if isinstance(self.value, QueryPredicate) else None
+
+    def describe(self) -> str:
+        if self.predicate is not None:
+            return self.predicate.describe(self.key)
+        return f"{self.key} == {self.value!r}"
+
     @staticmethod
     def from_obj(partition_key: PartitionKey, obj: Any) -> QueryKey:
         pk_key = partition_key.key
         pk_type = partition_key.type_
 
         # 🟡 TODO: support more advanced types than List[type]
-        if partition_key.type_list:
+        if isinstance(obj, QueryPredicate):
+            pk_value = obj
+        elif partition_key.type_list:
             pk_value = partition_key.extract_list(obj)
         else:
             if isinstance(obj, pk_type):
@@ -187,6 +372,8 @@ class QueryKey(PartitionKey):
         key = self.key
         if key == "id":
             key = "_id"
+        if self.predicate is not None:
+            return {key: self.predicate.as_mongo}
         if self.type_list:
             # We want to search inside the list of values
             return {key: {"$in": self.value}}
@@ -255,7 +442,9 @@ class QueryKeys(SyftBaseModel):
     def from_dict(qks_dict: Dict[str, Any]) -> QueryKeys:
         qks = []
         for k, v in qks_dict.items():
-            qks.append(QueryKey(key=k, type_=type(v), value=v))
+            # a predicate matches the partition key of the values it compares to
+            type_ = v.type_ if isinstance(v, QueryPredicate) else type(v)
+            qks.append(QueryKey(key=k, type_=type_, value=v))
         return QueryKeys(qks=qks)
 
     @property
@@ -275,7 +464,9 @@ class QueryKeys(SyftBaseModel):
             qk_value = qk.value
             if qk_key == "id":
                 qk_key = "_id"
-            if qk.type_list:
+            if qk.predicate is not None:
+                qk_dict[qk_key] = qk.predicate.as_mongo
+            elif qk.type_list:
                 # We want to search inside the list of values
                 qk_dict[qk_key] = {"$in": qk_value}
             else:
@@ -286,6 +477,32 @@ class QueryKeys(SyftBaseModel):
 UIDPartitionKey = PartitionKey(key="id", type_=UID)
 
 
+@serializable()
+class QueryStep(SyftBaseModel):
+    """A query key matched against the unique or the searchable keys"""
+
+    qk: QueryKey
+    unique: bool
+    estimate: int
+
+
+@serializable()
+class QueryPlan(SyftBaseModel):
+    """The steps of a query, from the most selective one. Each step only narrows
+    the objects matched by the previous ones."""
+
+    steps: List[QueryStep]
+
+    def explain(self) -> str:
+        lines = []
+        for idx, step in enumerate(self.steps):
+            index = "unique" if step.unique else "searchable"
+            lines.append(
+                f"{idx + 1}. {index} key {step.qk.describe()}: ~{step.estimate} objects"
+            )
+        return "\n".join(lines)
+
+
 @serializable()
 class PartitionSettings(BasePartitionSettings):
     object_type: type
@@ -324,6 +541,9 @@ class StorePartition:
         self.root_verify_key = root_verify_key
         self.settings = settings
         self.store_config = store_config
+        cache_config = store_config.cache_config_for(settings.name)
+        self.cache = None if cache_config is None else ObjectCache(cache_config)
+        self.role_resolver: Optional[RoleResolver] = None
         self.init_store()
 
         store_config.locking_config.lock_name = settings.name
@@ -352,18 +572,64 @@ class StorePartition:
 
     # Thread-safe methods
     def _thread_safe_cbk(self, cbk: Callable, *args, **kwargs):
-        locked = self.lock.acquire(blocking=True)
+        """Runs `cbk` holding the lock of the partition exclusively, for the
+        operations writing to the store."""
+        return self._locked_cbk(False, cbk, *args, **kwargs)
+
+    def _thread_safe_read_cbk(self, cbk: Callable, *args, **kwargs):
+        """Runs `cbk` holding the lock of the partition shared, for the operations
+        only reading from the store. They run concurrently with each other."""
+        return self._locked_cbk(True, cbk, *args, **kwargs)
+
+    def _locked_cbk(self, shared: bool, cbk: Callable, *args, **kwargs):
+        operation = getattr(cbk, "__name__", None)
+        # the role is resolved before the lock is taken, the operation doesn't
+        # call into another stash holding it
+        credentials = kwargs.get("credentials", args[0] if len(args) > 0 else None)
+        roles = {}
+        if isinstance(credentials, SyftVerifyKey):
+            roles[credentials.verify] = self._caller_role(credentials)
+
+        if shared:
+            locked = self.lock.acquire_shared(blocking=True, operation=operation)
+        else:
+            locked = self.lock.acquire(blocking=True, operation=operation)
         if not locked:
             return Err("Failed to acquire lock for the operation")
 
+        previous_roles = locked_roles()
+        _locked_roles.roles = roles
         try:
-            result = cbk(*args, **kwargs)
+            with self.transaction():
+                result = cbk(*args, **kwargs)
         except BaseException as e:
             result = Err(str(e))
-        self.lock.release()
+        finally:
+            _locked_roles.roles = previous_roles
 
+        if shared:
+            self.lock.release_shared()
+        else:
+            self.lock.release()
         return result
 
+    def _caller_role(self, credentials: SyftVerifyKey) -> Optional[ServiceRole]:
+        """The role of the caller of an operation, if the partition grants
+        permissions to roles"""
+        return None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Groups the writes of the block into one transaction if the backend
+        supports it, every operation of the partition runs in one."""
+        yield
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """Undoes the writes of the block if it raises, without the rest of the
+        transaction, if the backend supports it."""
+        yield
+
     def set(
         self,
         credentials: SyftVerifyKey,
@@ -379,30 +645,68 @@ class StorePartition:
             ignore_duplicates=ignore_duplicates,
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        """Sets the objects under a single lock, with one result per object."""
+        return self._thread_safe_cbk(
+            self._set_many,
+            credentials=credentials,
+            objs=objs,
+            add_permissions=add_permissions,
+            ignore_duplicates=ignore_duplicates,
+        )
+
     def get(
         self,
         credentials: SyftVerifyKey,
         uid: UID,
     ) -> Result[SyftObject, str]:
-        return self._thread_safe_cbk(
+        return self._thread_safe_read_cbk(
             self._get,
             uid=uid,
             credentials=credentials,
         )
 
+    def get_many(
+        self,
+        credentials: SyftVerifyKey,
+        uids: List[UID],
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        """Gets the objects under a single lock, with one result per uid."""
+        return self._thread_safe_read_cbk(
+            self._get_many,
+            uids=uids,
+            credentials=credentials,
+        )
+
     def find_index_or_search_keys(
         self,
         credentials: SyftVerifyKey,
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[SyftObject], str]:
-        return self._thread_safe_cbk(
+        return self._thread_safe_read_cbk(
             self._find_index_or_search_keys,
             credentials,
             index_qks=index_qks,
             search_qks=search_qks,
             order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+    def explain(self, index_qks: QueryKeys, search_qks: QueryKeys) -> Result[str, str]:
+        """The plan of a query of `find_index_or_search_keys`, for debugging"""
+        return self._thread_safe_read_cbk(
+            self._explain, index_qks=index_qks, search_qks=search_qks
         )
 
     def remove_keys(
@@ -431,14 +735,36 @@ class StorePartition:
             has_permission=has_permission,
         )
 
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        has_permission=False,
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        """Updates the objects by their store key under a single lock, with one
+        result per object."""
+        return self._thread_safe_cbk(
+            self._update_many,
+            credentials=credentials,
+            objs=objs,
+            has_permission=has_permission,
+        )
+
     def get_all_from_store(
         self,
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[SyftObject], str]:
-        return self._thread_safe_cbk(
-            self._get_all_from_store, credentials, qks, order_by
+        return self._thread_safe_read_cbk(
+            self._get_all_from_store,
+            credentials,
+            qks,
+            order_by,
+            limit=limit,
+            offset=offset,
         )
 
     def delete(
@@ -448,10 +774,26 @@ class StorePartition:
             self._delete, credentials, qk, has_permission=has_permission
         )
 
+    def delete_many(
+        self, credentials: SyftVerifyKey, qks: List[QueryKey], has_permission=False
+    ) -> Result[List[Result[SyftSuccess, str]], str]:
+        """Deletes the objects under a single lock, with one result per query key."""
+        return self._thread_safe_cbk(
+            self._delete_many, credentials, qks, has_permission=has_permission
+        )
+
     def all(
-        self, credentials: SyftVerifyKey, order_by: Optional[PartitionKey] = None
+        self,
+        credentials: SyftVerifyKey,
+        order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[BaseStash.object_type], str]:
-        return self._thread_safe_cbk(self._all, credentials, order_by)
+        """The objects readable with `credentials`, `limit` and `offset` select a
+        page of them."""
+        return self._thread_safe_read_cbk(
+            self._all, credentials, order_by, limit=limit, offset=offset
+        )
 
     # Potentially thread-unsafe methods.
     # CAUTION:
@@ -473,6 +815,8 @@ class StorePartition:
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[SyftObject], str]:
         raise NotImplementedError
 
@@ -482,6 +826,122 @@ class StorePartition:
     def _all(self) -> Result[List[BaseStash.object_type], str]:
         raise NotImplementedError
 
+    def plan(self, index_qks: QueryKeys, search_qks: QueryKeys) -> QueryPlan:
+        steps = [
+            QueryStep(qk=qk, unique=True, estimate=self._estimate(qk, unique=True))
+            for qk in index_qks.all
+        ] + [
+            QueryStep(qk=qk, unique=False, estimate=self._estimate(qk, unique=False))
+            for qk in search_qks.all
+        ]
+        # the sort is stable, the steps with the same estimate keep the query order
+        return QueryPlan(steps=sorted(steps, key=lambda step: step.estimate))
+
+    def _estimate(self, qk: QueryKey, unique: bool) -> int:
+        """The estimated number of objects matching `qk`, backends with statistics
+        of their keys override it"""
+        if unique and qk.predicate is None and not qk.type_list:
+            return 1
+        if unique and isinstance(qk.predicate, InPredicate):
+            return len(qk.predicate.values)
+        return len(self)
+
+    def _explain(self, index_qks: QueryKeys, search_qks: QueryKeys) -> Result[str, str]:
+        return Ok(self.plan(index_qks, search_qks).explain())
+
+    def _each(
+        self, items: List[Any], cbk: Callable[[Any], Result], error: str
+    ) -> List[Result]:
+        """The results of `cbk` on each of `items`. Each item runs in its own
+        savepoint, a failed one only undoes its own writes."""
+        results = []
+        for item in items:
+            try:
+                with self.savepoint():
+                    result = cbk(item)
+                    if result.is_err():
+                        raise _ItemFailed(result)
+            except _ItemFailed as e:
+                result = e.result
+            except Exception as e:
+                result = Err(f"{error} {item}. {e}")
+            results.append(result)
+        return results
+
+    # the bulk operations run the single object ones, backends override them to
+    # write all the objects at once
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        return Ok(
+            self._each(
+                objs,
+                lambda obj: self._set(
+                    credentials,
+                    obj,
+                    add_permissions=add_permissions,
+                    ignore_duplicates=ignore_duplicates,
+                ),
+                error="Failed to write obj",
+            )
+        )
+
+    def _get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        results = []
+        for uid in uids:
+            try:
+                results.append(self._get(uid=uid, credentials=credentials))
+            except Exception as e:
+                results.append(Err(f"Failed to get {uid}. {e}"))
+        return Ok(results)
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        return Ok(
+            self._each(
+                objs,
+                lambda obj: self._update(
+                    credentials,
+                    self.store_query_key(obj),
+                    obj,
+                    has_permission=has_permission,
+                ),
+                error="Failed to update obj",
+            )
+        )
+
+    def _delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: List[QueryKey],
+        has_permission: bool = False,
+    ) -> Result[List[Result[SyftSuccess, str]], str]:
+        return Ok(
+            self._each(
+                qks,
+                lambda qk: self._delete(credentials, qk, has_permission=has_permission),
+                error="Failed to delete with query key",
+            )
+        )
+
+
+class _ItemFailed(Exception):
+    """Rolls back the savepoint of an item of a bulk operation which failed"""
+
+    def __init__(self, result: Err) -> None:
+        super().__init__(result.err())
+        self.result = result
+
 
 @instrument
 @serializable()
@@ -496,6 +956,11 @@ class DocumentStore:
     partitions: Dict[str, StorePartition]
     partition_type: Type[StorePartition]
 
+    # the role resolver is a method of the node, which sets it again
+    __serde_overrides__: Dict[str, Sequence[Callable]] = {
+        "role_resolver": (lambda _: None, lambda _: None)
+    }
+
     def __init__(
         self, root_verify_key: Optional[SyftVerifyKey], store_config: StoreConfig
     ) -> None:
@@ -504,6 +969,7 @@ class DocumentStore:
         self.partitions = {}
         self.store_config = store_config
         self.root_verify_key = root_verify_key
+        self.role_resolver: Optional[RoleResolver] = None
 
     def partition(self, settings: PartitionSettings) -> StorePartition:
         if settings.name not in self.partitions:
@@ -512,8 +978,42 @@ class DocumentStore:
                 settings=settings,
                 store_config=self.store_config,
             )
+            self.partitions[settings.name].role_resolver = self.role_resolver
         return self.partitions[settings.name]
 
+    def set_role_resolver(self, role_resolver: Optional[RoleResolver]) -> None:
+        """Sets how the partitions look up the role of a verify key"""
+        self.role_resolver = role_resolver
+        for partition in self.partitions.values():
+            partition.role_resolver = role_resolver
+
+    def snapshot(self) -> Result[StoreSnapshot, str]:
+        """A point-in-time copy of the data of the store, taken while it keeps
+        serving the other operations"""
+        return Err(f"{type(self).__name__} does not support snapshots")
+
+    def restore(self, snapshot: StoreSnapshot) -> Result[SyftSuccess, str]:
+        """Replaces the data of the store with the one of `snapshot`"""
+        return Err(f"{type(self).__name__} does not support snapshots")
+
+    def _clear_caches(self) -> None:
+        for partition in self.partitions.values():
+            if partition.cache is not None:
+                partition.cache.clear()
+
+
+class StoreSnapshot:
+    """A point-in-time copy of the data of a store, which can be restored into a
+    store of the same type
+
+    Parameters:
+        blob_path: Optional[Path]
+            The directory of the blob files of an action store snapshot, None if
+            it has none.
+    """
+
+    blob_path: Optional[Path] = None
+
 
 @instrument
 class BaseStash:
@@ -533,9 +1033,53 @@ class BaseStash:
         )
 
     def get_all(
-        self, credentials: SyftVerifyKey, order_by: Optional[PartitionKey] = None
+        self,
+        credentials: SyftVerifyKey,
+        order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[BaseStash.object_type], str]:
-        return self.partition.all(credentials, order_by)
+        return self.partition.all(credentials, order_by, limit=limit, offset=offset)
+
+    def get_page(
+        self,
+        credentials: SyftVerifyKey,
+        page_size: int,
+        cursor: Optional[str] = None,
+        qks: Optional[Union[QueryKey, QueryKeys]] = None,
+        order_by: Optional[PartitionKey] = None,
+    ) -> Result[StorePage, str]:
+        """A page of the objects matching `qks`, all of them if None. The listing
+        continues from the `cursor` of the previous page."""
+        if page_size < 1:
+            return Err(f"Page size must be at least 1, not {page_size}")
+
+        offset_result = decode_cursor(cursor)
+        if offset_result.is_err():
+            return offset_result
+        offset = offset_result.ok()
+
+        # one more object tells if there is a next page
+        if qks is None:
+            result = self.get_all(
+                credentials, order_by=order_by, limit=page_size + 1, offset=offset
+            )
+        else:
+            result = self.query_all(
+                credentials,
+                qks=qks,
+                order_by=order_by,
+                limit=page_size + 1,
+                offset=offset,
+            )
+        if result.is_err():
+            return result
+        objs = result.ok()
+
+        next_cursor = None
+        if len(objs) > page_size:
+            next_cursor = encode_cursor(offset + page_size)
+        return Ok(StorePage(objs=objs[:page_size], cursor=next_cursor))
 
     def __len__(self) -> int:
         return len(self.partition)
@@ -554,12 +1098,51 @@ class BaseStash:
             add_permissions=add_permissions,
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[BaseStash.object_type],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[Result[BaseStash.object_type, str]], str]:
+        return self.partition.set_many(
+            credentials=credentials,
+            objs=objs,
+            ignore_duplicates=ignore_duplicates,
+            add_permissions=add_permissions,
+        )
+
+    def get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[Result[BaseStash.object_type, str]], str]:
+        return self.partition.get_many(credentials=credentials, uids=uids)
+
     def query_all(
         self,
         credentials: SyftVerifyKey,
         qks: Union[QueryKey, QueryKeys],
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[BaseStash.object_type], str]:
+        split_result = self._split_query_keys(qks)
+        if split_result.is_err():
+            return split_result
+        index_qks, search_qks = split_result.ok()
+
+        return self.partition.find_index_or_search_keys(
+            credentials=credentials,
+            index_qks=index_qks,
+            search_qks=search_qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+    def _split_query_keys(
+        self, qks: Union[QueryKey, QueryKeys]
+    ) -> Result[Tuple[QueryKeys, QueryKeys], str]:
+        """The unique and the searchable query keys of `qks`"""
         if isinstance(qks, QueryKey):
             qks = QueryKeys(qks=qks)
 
@@ -577,15 +1160,15 @@ class BaseStash:
                     f"{qk} not in {type(self.partition)} unique or searchable keys"
                 )
 
-        index_qks = QueryKeys(qks=unique_keys)
-        search_qks = QueryKeys(qks=searchable_keys)
+        return Ok((QueryKeys(qks=unique_keys), QueryKeys(qks=searchable_keys)))
 
-        return self.partition.find_index_or_search_keys(
-            credentials=credentials,
-            index_qks=index_qks,
-            search_qks=search_qks,
-            order_by=order_by,
-        )
+    def explain(self, qks: Union[QueryKey, QueryKeys]) -> Result[str, str]:
+        """How `query_all` evaluates `qks`, from the most selective key"""
+        split_result = self._split_query_keys(qks)
+        if split_result.is_err():
+            return split_result
+        index_qks, search_qks = split_result.ok()
+        return self.partition.explain(index_qks=index_qks, search_qks=search_qks)
 
     def query_all_kwargs(
         self,
@@ -603,7 +1186,7 @@ class BaseStash:
         order_by: Optional[PartitionKey] = None,
     ) -> Result[Optional[BaseStash.object_type], str]:
         return self.query_all(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials, qks=qks, order_by=order_by, limit=1
         ).and_then(first_or_none)
 
     def query_one_kwargs(
@@ -644,6 +1227,13 @@ class BaseStash:
             credentials=credentials, qk=qk, has_permission=has_permission
         )
 
+    def delete_many(
+        self, credentials: SyftVerifyKey, qks: List[QueryKey], has_permission=False
+    ) -> Result[List[Result[SyftSuccess, str]], str]:
+        return self.partition.delete_many(
+            credentials=credentials, qks=qks, has_permission=has_permission
+        )
+
     def update(
         self,
         credentials: SyftVerifyKey,
@@ -655,6 +1245,16 @@ class BaseStash:
             credentials=credentials, qk=qk, obj=obj, has_permission=has_permission
         )
 
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[BaseStash.object_type],
+        has_permission=False,
+    ) -> Result[List[Result[BaseStash.object_type, str]], str]:
+        return self.partition.update_many(
+            credentials=credentials, objs=objs, has_permission=has_permission
+        )
+
 
 @instrument
 class BaseUIDStoreStash(BaseStash):
@@ -667,6 +1267,12 @@ class BaseUIDStoreStash(BaseStash):
             return Ok(SyftSuccess(message=f"ID: {uid} deleted"))
         return result
 
+    def delete_many_by_uid(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[Result[SyftSuccess, str]], str]:
+        qks = [UIDPartitionKey.with_obj(uid) for uid in uids]
+        return super().delete_many(credentials=credentials, qks=qks)
+
     def get_by_uid(
         self, credentials: SyftVerifyKey, uid: UID
     ) -> Result[Optional[BaseUIDStoreStash.object_type], str]:
@@ -691,6 +1297,24 @@ class BaseUIDStoreStash(BaseStash):
             add_permissions=add_permissions,
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[BaseUIDStoreStash.object_type],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[Result[BaseUIDStoreStash.object_type, str]], str]:
+        for obj in objs:
+            res = self.check_type(obj, self.object_type)
+            if res.is_err():
+                return res
+        return super().set_many(
+            credentials=credentials,
+            objs=objs,
+            ignore_duplicates=ignore_duplicates,
+            add_permissions=add_permissions,
+        )
+
 
 @serializable()
 class StoreConfig(SyftBaseObject):
@@ -708,6 +1332,14 @@ class StoreConfig(SyftBaseObject):
                 * FileLockingConfig: file based locking, ideal for same-device different-processes/threads stores.
                 * RedisLockingConfig: Redis-based locking, ideal for multi-device stores.
             Defaults to NoLockingConfig.
+        cache_config: Optional[CacheConfig]
+            The config of the cache of the deserialized objects of each partition,
+            None to read every object from the store. Defaults to None.
+        partition_cache_configs: Dict[str, Optional[CacheConfig]]
+            The cache configs of the partitions, by name, overriding `cache_config`.
+        blob_storage_config: Optional[BlobStorageConfig]
+            The config of the files the action stores write their large array and
+            DataFrame payloads to, None to keep them in the store. Defaults to None.
     """
 
     __canonical_name__ = "StoreConfig"
@@ -716,3 +1348,9 @@ class StoreConfig(SyftBaseObject):
     store_type: Type[DocumentStore]
     client_config: Optional[StoreClientConfig]
     locking_config: LockingConfig = NoLockingConfig()
+    cache_config: Optional[CacheConfig] = None
+    partition_cache_configs: Dict[str, Optional[CacheConfig]] = {}
+    blob_storage_config: Optional[BlobStorageConfig] = None
+
+    def cache_config_for(self, partition_name: str) -> Optional[CacheConfig]:
+        return self.partition_cache_configs.get(partition_name, self.cache_config)
@@ -4,10 +4,15 @@ from __future__ import annotations
 # stdlib
 from collections import defaultdict
 from enum import Enum
+import threading
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 # third party
 from result import Err
@@ -24,16 +29,23 @@ from ..service.action.action_permissions import ActionObjectPermission
 from ..service.action.action_permissions import ActionObjectREAD
 from ..service.action.action_permissions import ActionObjectWRITE
 from ..service.action.action_permissions import ActionPermission
+from ..service.action.action_permissions import granting_permission_strings
+from ..service.action.action_permissions import role_permission_string
 from ..service.response import SyftSuccess
+from ..service.user.user_roles import ServiceRole
 from ..types.syft_object import SyftObject
 from ..types.uid import UID
+from .document_store import BasePartitionSettings
 from .document_store import BaseStash
+from .document_store import InPredicate
 from .document_store import PartitionKey
 from .document_store import PartitionSettings
 from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
 from .document_store import StorePartition
+from .document_store import locked_roles
+from .document_store import paginate
 
 
 @serializable()
@@ -88,6 +100,177 @@ class KeyValueBackingStore:
     def __iter__(self) -> Any:
         raise NotImplementedError
 
+    def get_many(self, keys: List[Any]) -> Dict[Any, Any]:
+        """The values of the `keys` which are in the store."""
+        return {key: self[key] for key in keys if key in self}
+
+    def changed(self) -> bool:
+        """Whether the store was written to by someone else since the previous call,
+        so the values read from it before may be stale."""
+        return False
+
+
+@serializable(attrs=["grants", "uids"])
+class KeyValuePermissionIndex:
+    """The permissions granted on the objects of a store, as (uid, permission
+    string) pairs where the string holds the permission and its grantee: a verify
+    key, a role or everyone for the ALL_ permissions. The uids of each permission
+    string are indexed as well, for the objects a user can access.
+
+    Parameters:
+        `settings`: BasePartitionSettings
+            Syft specific settings
+        `store_config`: StoreConfig
+            Backend specific configuration
+    """
+
+    def __init__(
+        self, settings: BasePartitionSettings, store_config: StoreConfig
+    ) -> None:
+        # uid -> the permission strings granted on it
+        self.grants = store_config.backing_store(
+            "permissions", settings, store_config, ddtype=set
+        )
+        # permission string -> the uids it is granted on
+        self.uids = store_config.backing_store(
+            "permission_uids", settings, store_config, ddtype=set
+        )
+        if len(self.uids) == 0 and len(self.grants) > 0:
+            # a store written before the reverse index existed
+            self._add(self.grants.items(), self.uids)
+
+    @staticmethod
+    def _add(
+        pairs: Iterable[Tuple[Any, Set[Any]]], store: KeyValueBackingStore
+    ) -> None:
+        # each set is read and written once
+        added = defaultdict(set)
+        for key, values in pairs:
+            added[key].update(values)
+        for key, values in added.items():
+            current = store[key]
+            current.update(values)
+            store[key] = current
+
+    @staticmethod
+    def _discard(
+        pairs: Iterable[Tuple[Any, Set[Any]]], store: KeyValueBackingStore
+    ) -> None:
+        discarded = defaultdict(set)
+        for key, values in pairs:
+            discarded[key].update(values)
+        for key, values in discarded.items():
+            if key in store:
+                store[key] = store[key] - values
+
+    def __contains__(self, uid: UID) -> bool:
+        return uid in self.grants
+
+    def init(self, uids: Iterable[UID]) -> None:
+        """Adds the objects of `uids` without any permission"""
+        self.grant_strings((uid, []) for uid in uids)
+
+    def grant_strings(self, grants: Iterable[Tuple[UID, Iterable[str]]]) -> None:
+        grants = [(uid, set(strings)) for uid, strings in grants]
+        self._add(grants, self.grants)
+        self._add(
+            ((string, {uid}) for uid, strings in grants for string in strings),
+            self.uids,
+        )
+
+    def revoke_strings(self, grants: Iterable[Tuple[UID, Iterable[str]]]) -> None:
+        grants = [(uid, set(strings)) for uid, strings in grants]
+        self._discard(grants, self.grants)
+        self._discard(
+            ((string, {uid}) for uid, strings in grants for string in strings),
+            self.uids,
+        )
+
+    def grant(self, permissions: Iterable[ActionObjectPermission]) -> None:
+        self.grant_strings(
+            (permission.uid, [permission.permission_string])
+            for permission in permissions
+        )
+
+    def revoke(self, permissions: Iterable[ActionObjectPermission]) -> None:
+        self.revoke_strings(
+            (permission.uid, [permission.permission_string])
+            for permission in permissions
+        )
+
+    def grant_role(
+        self, uids: Iterable[UID], permission: ActionPermission, role: ServiceRole
+    ) -> None:
+        """Grants `permission` on `uids` to the users with `role` or a higher one"""
+        string = role_permission_string(permission, role)
+        self.grant_strings((uid, [string]) for uid in uids)
+
+    def revoke_role(
+        self, uids: Iterable[UID], permission: ActionPermission, role: ServiceRole
+    ) -> None:
+        string = role_permission_string(permission, role)
+        self.revoke_strings((uid, [string]) for uid in uids)
+
+    def revoke_all(self, uids: Iterable[UID]) -> None:
+        """Removes the objects of `uids` with all their permissions"""
+        uids = [uid for uid in uids if uid in self.grants]
+        self._discard(
+            ((string, {uid}) for uid in uids for string in self.grants[uid]),
+            self.uids,
+        )
+        for uid in uids:
+            del self.grants[uid]
+
+    def has(
+        self, permission: ActionObjectPermission, role: Optional[ServiceRole] = None
+    ) -> bool:
+        if permission.uid not in self.grants:
+            return False
+        strings = granting_permission_strings(permission, role)
+        return not self.grants[permission.uid].isdisjoint(strings)
+
+    def uids_with(
+        self, permission: ActionObjectPermission, role: Optional[ServiceRole] = None
+    ) -> Set[UID]:
+        """The uids on which `permission` is granted, its uid is ignored"""
+        uids = set()
+        for string in granting_permission_strings(permission, role):
+            # reading a missing string from a store with a default adds it
+            if string in self.uids:
+                uids.update(self.uids[string])
+        return uids
+
+    def has_role_grants(self, permission: Optional[ActionPermission] = None) -> bool:
+        """Whether `permission` is granted to a role on any object, any permission
+        if None"""
+        permissions = list(ActionPermission) if permission is None else [permission]
+        strings = [
+            role_permission_string(permission, role)
+            for permission in permissions
+            for role in ServiceRole
+        ]
+        return any(
+            string in self.uids and len(self.uids[string]) > 0 for string in strings
+        )
+
+
+# the threads resolving a role, the lookup of the user can't depend on a role
+_resolving_role = threading.local()
+
+
+def resolve_role(
+    role_resolver: Optional[Callable[[SyftVerifyKey], Optional[ServiceRole]]],
+    credentials: SyftVerifyKey,
+) -> Optional[ServiceRole]:
+    if role_resolver is None or getattr(_resolving_role, "active", False):
+        return None
+    _resolving_role.active = True
+    try:
+        role = role_resolver(credentials)
+    finally:
+        _resolving_role.active = False
+    return role if isinstance(role, ServiceRole) else None
+
 
 class KeyValueStorePartition(StorePartition):
     """Key-Value StorePartition
@@ -116,33 +299,55 @@ class KeyValueStorePartition(StorePartition):
             self.data = self.store_config.backing_store(
                 "data", self.settings, self.store_config
             )
-            self.unique_keys = self.store_config.backing_store(
-                "unique_keys", self.settings, self.store_config
-            )
-            self.searchable_keys = self.store_config.backing_store(
-                "searchable_keys", self.settings, self.store_config
-            )
-            self.permissions = self.store_config.backing_store(
-                "permissions", self.settings, self.store_config, ddtype=set
-            )
-
-            for partition_key in self.unique_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.unique_keys:
-                    self.unique_keys[pk_key] = {}
-
-            for partition_key in self.searchable_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.searchable_keys:
-                    self.searchable_keys[pk_key] = defaultdict(list)
+            self.permissions = self._init_permissions()
+            self._init_keys()
         except BaseException as e:
             return Err(str(e))
 
         return Ok()
 
+    def _init_permissions(self) -> KeyValuePermissionIndex:
+        return KeyValuePermissionIndex(self.settings, self.store_config)
+
+    def _init_keys(self) -> None:
+        # each key column is a dict of value -> uid(s) in a backing store
+        self.unique_keys = self.store_config.backing_store(
+            "unique_keys", self.settings, self.store_config
+        )
+        self.searchable_keys = self.store_config.backing_store(
+            "searchable_keys", self.settings, self.store_config
+        )
+
+        for partition_key in self.unique_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.unique_keys:
+                self.unique_keys[pk_key] = {}
+
+        for partition_key in self.searchable_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.searchable_keys:
+                self.searchable_keys[pk_key] = defaultdict(list)
+
     def __len__(self) -> int:
         return len(self.data)
 
+    def _get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        readable = self._readable(uids, credentials)
+        objs = self._read_many(readable)
+
+        results = []
+        for uid in uids:
+            if uid in objs:
+                results.append(Ok(objs[uid]))
+            elif uid in readable:
+                results.append(Err(f"{uid} not in {type(self)}"))
+            else:
+                read_permission = ActionObjectREAD(uid=uid, credentials=credentials)
+                results.append(Err(f"Permission: {read_permission} denied"))
+        return Ok(results)
+
     def _get(self, uid: UID, credentials: SyftVerifyKey) -> Result[SyftObject, str]:
         # relative
         from ..service.action.action_store import ActionObjectREAD
@@ -151,10 +356,39 @@ class KeyValueStorePartition(StorePartition):
         read_permission = ActionObjectREAD(uid=uid, credentials=credentials)
 
         if self.has_permission(read_permission):
-            syft_object = self.data[uid]
+            syft_object = self._read_many([uid])[uid]
             return Ok(syft_object)
         return Err(f"Permission: {read_permission} denied")
 
+    def _read_many(self, uids: List[UID]) -> Dict[UID, SyftObject]:
+        """The objects of `uids` which are in the store, the cached ones are not
+        read from it."""
+        if self.cache is None:
+            return self.data.get_many(uids)
+
+        if self.data.changed():
+            self.cache.clear()
+
+        objs = {}
+        missing = []
+        for uid in uids:
+            obj = self.cache.get(uid)
+            if obj is None:
+                missing.append(uid)
+            else:
+                objs[uid] = obj
+
+        if len(missing) > 0:
+            stored = self.data.get_many(missing)
+            for uid, obj in stored.items():
+                self.cache.put(uid, obj)
+            objs.update(stored)
+        return objs
+
+    def _invalidate(self, uids: Iterable[UID]) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(uids)
+
     # Potentially thread-unsafe methods.
     # CAUTION:
     #       * Don't use self.lock here.
@@ -168,7 +402,25 @@ class KeyValueStorePartition(StorePartition):
         add_permissions: Optional[List[ActionObjectPermission]] = None,
         ignore_duplicates: bool = False,
     ) -> Result[SyftObject, str]:
-        try:
+        return self._set_many(
+            credentials,
+            [obj],
+            add_permissions=add_permissions,
+            ignore_duplicates=ignore_duplicates,
+        ).ok()[0]
+
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        # the objects and their permissions are written at once at the end
+        data: Dict[UID, SyftObject] = {}
+        permissions: List[Tuple[UID, List[str]]] = []
+
+        def set_keys(obj: SyftObject) -> Result[SyftObject, str]:
             if obj.id is None:
                 obj.id = UID()
             store_query_key = self.settings.store_key.with_obj(obj)
@@ -176,7 +428,7 @@ class KeyValueStorePartition(StorePartition):
             write_permission = ActionObjectWRITE(uid=uid, credentials=credentials)
             can_write = self.has_permission(write_permission)
             unique_query_keys = self.settings.unique_keys.with_obj(obj)
-            store_key_exists = store_query_key.value in self.data
+            store_key_exists = uid in data or uid in self.data
             searchable_query_keys = self.settings.searchable_keys.with_obj(obj)
 
             ck_check = self._check_partition_keys_unique(
@@ -194,28 +446,36 @@ class KeyValueStorePartition(StorePartition):
                 # we are also not writing though
                 return Ok(obj)
 
-            if can_write:
-                self._set_data_and_keys(
-                    store_query_key=store_query_key,
-                    unique_query_keys=unique_query_keys,
-                    searchable_query_keys=searchable_query_keys,
-                    obj=obj,
-                )
-                self.data[uid] = obj
-                if uid not in self.permissions:
-                    # create default permissions
-                    self.permissions[uid] = set()
-                permission = f"{credentials.verify}_READ"
-                permissions = self.permissions[uid]
-                permissions.add(permission)
-                if add_permissions is not None:
-                    permissions.update([x.permission_string for x in add_permissions])
-                self.permissions[uid] = permissions
-                return Ok(obj)
-            else:
+            if not can_write:
                 return Err(f"Permission: {write_permission} denied")
+
+            self._set_keys(
+                store_query_key=store_query_key,
+                unique_query_keys=unique_query_keys,
+                searchable_query_keys=searchable_query_keys,
+            )
+            obj_permissions = [f"{credentials.verify}_READ"]
+            if add_permissions is not None:
+                obj_permissions += [x.permission_string for x in add_permissions]
+            data[uid] = obj
+            permissions.append((uid, obj_permissions))
+            return Ok(obj)
+
+        # the keys of each object are set in its own savepoint, an object which
+        # fails doesn't undo the ones before it
+        results = self._each(objs, set_keys, error="Failed to write obj")
+
+        try:
+            self.data.update(data)
+            self.permissions.grant_strings(permissions)
         except Exception as e:
-            return Err(f"Failed to write obj {obj}. {e}")
+            for idx, obj in enumerate(objs):
+                if obj.id in data:
+                    results[idx] = Err(f"Failed to write obj {obj}. {e}")
+        finally:
+            self._invalidate(data.keys())
+
+        return Ok(results)
 
     def take_ownership(
         self, uid: UID, credentials: SyftVerifyKey
@@ -234,19 +494,27 @@ class KeyValueStorePartition(StorePartition):
         return Err(f"UID: {uid} already owned.")
 
     def add_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.add(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.grant([permission])
 
     def remove_permission(self, permission: ActionObjectPermission):
-        permissions = self.permissions[permission.uid]
-        permissions.remove(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.revoke([permission])
 
     def add_permissions(self, permissions: List[ActionObjectPermission]) -> None:
-        results = []
-        for permission in permissions:
-            results.append(self.add_permission(permission))
+        self.permissions.grant(permissions)
+
+    def remove_permissions(self, permissions: List[ActionObjectPermission]) -> None:
+        self.permissions.revoke(permissions)
+
+    def add_role_permission(
+        self, uids: List[UID], permission: ActionPermission, role: ServiceRole
+    ) -> None:
+        """Grants `permission` on `uids` to the users with `role` or a higher one"""
+        self.permissions.grant_role(uids, permission, role)
+
+    def remove_role_permission(
+        self, uids: List[UID], permission: ActionPermission, role: ServiceRole
+    ) -> None:
+        self.permissions.revoke_role(uids, permission, role)
 
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         if not isinstance(permission.permission, ActionPermission):
@@ -256,40 +524,96 @@ class KeyValueStorePartition(StorePartition):
         if self.root_verify_key.verify == permission.credentials.verify:
             return True
 
-        if (
-            permission.uid in self.permissions
-            and permission.permission_string in self.permissions[permission.uid]
-        ):
+        if self.permissions.has(permission):
             return True
 
-        # 🟡 TODO 14: add ALL_READ, ALL_EXECUTE etc
-        # third party
-        if permission.permission == ActionPermission.OWNER:
-            pass
-        elif (
-            permission.permission == ActionPermission.READ
-            and ActionObjectPermission(
-                permission.uid, ActionPermission.ALL_READ
-            ).permission_string
-            in self.permissions[permission.uid]
-        ):
-            return True
-        elif permission.permission == ActionPermission.WRITE:
-            pass
-        elif permission.permission == ActionPermission.EXECUTE:
-            pass
+        role = self._role(permission.credentials, permission.permission)
+        return role is not None and self.permissions.has(permission, role=role)
 
-        return False
+    def _caller_role(self, credentials: SyftVerifyKey) -> Optional[ServiceRole]:
+        if (
+            self.role_resolver is None
+            or self.root_verify_key.verify == credentials.verify
+            or not self.permissions.has_role_grants()
+        ):
+            return None
+        return resolve_role(self.role_resolver, credentials)
+
+    def _role(
+        self, credentials: SyftVerifyKey, permission: ActionPermission
+    ) -> Optional[ServiceRole]:
+        """The role of `credentials`, only looked up when `permission` is granted
+        to a role"""
+        if self.role_resolver is None or not self.permissions.has_role_grants(
+            permission
+        ):
+            return None
+        roles = locked_roles()
+        if roles is not None:
+            # looking up the user reads the User stash, holding the lock of the
+            # partition only the role of the caller is known
+            return roles.get(credentials.verify, None)
+        return resolve_role(self.role_resolver, credentials)
+
+    def _readable(self, uids: Iterable[UID], credentials: SyftVerifyKey) -> List[UID]:
+        """The uids readable with `credentials`, in order"""
+        if self.root_verify_key.verify == credentials.verify:
+            return list(uids)
+
+        # the uids readable by the user are looked up once instead of each object
+        # being checked
+        permission = ActionObjectREAD(uid=None, credentials=credentials)
+        readable = self.permissions.uids_with(
+            permission, role=self._role(credentials, permission.permission)
+        )
+        return [uid for uid in uids if uid in readable]
 
     def _all(
-        self, credentials: SyftVerifyKey, order_by: Optional[PartitionKey] = None
+        self,
+        credentials: SyftVerifyKey,
+        order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[BaseStash.object_type], str]:
-        # this checks permissions
-        res = [self._get(uid, credentials) for uid in self.data.keys()]
-        result = [x.ok() for x in res if x.is_ok()]
-        if order_by is not None:
-            result = sorted(result, key=lambda x: getattr(x, order_by.key, ""))
-        return Ok(result)
+        return Ok(
+            self._read_page(self.data.keys(), credentials, order_by, limit, offset)
+        )
+
+    def _read_page(
+        self,
+        uids: Iterable[UID],
+        credentials: SyftVerifyKey,
+        order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SyftObject]:
+        """The page of the objects of `uids` readable with `credentials`"""
+        readable = self._readable(uids, credentials)
+        if order_by is None:
+            # in store order only the objects of the page are read
+            page = paginate(readable, limit, offset)
+        else:
+            page = self._ordered_page(readable, order_by, limit, offset)
+
+        if page is None:
+            # without an ordered index all the objects are read and sorted
+            objs = self._read_many(list(readable))
+            matches = sorted(objs.values(), key=lambda x: getattr(x, order_by.key, ""))
+            return paginate(matches, limit, offset)
+
+        objs = self._read_many(page)
+        return [objs[uid] for uid in page if uid in objs]
+
+    def _ordered_page(
+        self,
+        uids: List[UID],
+        order_by: PartitionKey,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Optional[List[UID]]:
+        """The page of `uids` ordered by `order_by`, None when the partition can't
+        order them without reading the objects"""
+        return None
 
     def _remove_keys(
         self,
@@ -306,11 +630,11 @@ class KeyValueStorePartition(StorePartition):
 
         sqks = searchable_query_keys.all
         for qk in sqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.searchable_keys[pk_key]
-            if pk_value in ck_col and (store_key.value in ck_col[pk_value]):
-                ck_col[pk_value].remove(store_key.value)
-            self.searchable_keys[pk_key] = ck_col
+            ck_col = self.searchable_keys[qk.key]
+            for pk_value in self._search_values(qk):
+                if pk_value in ck_col and (store_key.value in ck_col[pk_value]):
+                    ck_col[pk_value].remove(store_key.value)
+            self.searchable_keys[qk.key] = ck_col
 
     def _find_index_or_search_keys(
         self,
@@ -318,39 +642,34 @@ class KeyValueStorePartition(StorePartition):
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[SyftObject], str]:
         ids: Optional[Set] = None
-        errors = []
-        # third party
-        if len(index_qks.all) > 0:
-            index_results = self._get_keys_index(qks=index_qks)
-            if index_results.is_ok():
-                if ids is None:
-                    ids = index_results.ok()
-                ids = ids.intersection(index_results.ok())
-            else:
-                errors.append(index_results.err())
-
-        search_results = None
-        if len(search_qks.all) > 0:
-            search_results = self._find_keys_search(qks=search_qks)
-
-            if search_results.is_ok():
-                if ids is None:
-                    ids = search_results.ok()
-                ids = ids.intersection(search_results.ok())
-            else:
-                errors.append(search_results.err())
-
-        if len(errors) > 0:
-            return Err(" ".join(errors))
+        # match AND, from the most selective key
+        for step in self.plan(index_qks, search_qks).steps:
+            result = self._find_uids(step.qk, step.unique, candidates=ids)
+            if result.is_err():
+                return result
+            matches = result.ok()
+            if matches is None:
+                continue
+
+            ids = matches if ids is None else ids.intersection(matches)
+            if len(ids) == 0:
+                # the following keys can't match any object
+                return Ok([])
 
         if ids is None:
             return Ok([])
 
         qks: QueryKeys = self.store_query_keys(ids)
         return self._get_all_from_store(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
         )
 
     def _update(
@@ -416,17 +735,11 @@ class KeyValueStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[SyftObject], str]:
-        matches = []
-        for qk in qks.all:
-            if qk.value in self.data:
-                if self.has_permission(
-                    ActionObjectREAD(uid=qk.value, credentials=credentials)
-                ):
-                    matches.append(self.data[qk.value])
-        if order_by is not None:
-            matches = sorted(matches, key=lambda x: getattr(x, order_by.key, ""))
-        return Ok(matches)
+        uids = (qk.value for qk in qks.all if qk.value in self.data)
+        return Ok(self._read_page(uids, credentials, order_by, limit, offset))
 
     def create(self, obj: SyftObject) -> Result[SyftObject, str]:
         pass
@@ -439,6 +752,7 @@ class KeyValueStorePartition(StorePartition):
                 ActionObjectWRITE(uid=qk.value, credentials=credentials)
             ):
                 _obj = self.data.pop(qk.value)
+                self._invalidate([qk.value])
                 self._delete_unique_keys_for(_obj)
                 self._delete_search_keys_for(_obj)
                 return Ok(SyftSuccess(message="Deleted"))
@@ -456,81 +770,83 @@ class KeyValueStorePartition(StorePartition):
         return Ok(SyftSuccess(message="Deleted"))
 
     def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        uid = self.settings.store_key.with_obj(obj).value
         for _search_ck in self.searchable_cks:
             qk = _search_ck.with_obj(obj)
-            self.searchable_keys[qk.key].pop(qk.value, None)
+            ck_col = self.searchable_keys[qk.key]
+            for pk_value in self._search_values(qk):
+                # the other objects with the same value keep it
+                if uid in ck_col.get(pk_value, []):
+                    ck_col[pk_value].remove(uid)
+            self.searchable_keys[qk.key] = ck_col
         return Ok(SyftSuccess(message="Deleted"))
 
-    def _get_keys_index(self, qks: QueryKeys) -> Result[Set[Any], str]:
-        try:
-            # match AND
-            subsets = []
-            for qk in qks.all:
-                subset = {}
-                pk_key, pk_value = qk.key, qk.value
-                if pk_key not in self.unique_keys:
-                    return Err(f"Failed to query index with {qk}")
-                ck_col = self.unique_keys[pk_key]
-                if pk_value not in ck_col.keys():
-                    # must be at least one in all query keys
-                    continue
-                store_value = ck_col[pk_value]
-                subsets.append({store_value})
-
-            if len(subsets) == 0:
-                return Ok(set())
-            # AND
-            subset = subsets.pop()
-            for s in subsets:
-                subset = subset.intersection(s)
-
-            return Ok(subset)
-        except Exception as e:
-            return Err(f"Failed to query with {qks}. {e}")
+    def _estimate(self, qk: QueryKey, unique: bool) -> int:
+        cols = self.unique_keys if unique else self.searchable_keys
+        if qk.key not in cols:
+            return 0
+        # each value of a unique key has one object, the values of a searchable
+        # key are assumed to share the objects evenly
+        distinct = max(len(cols[qk.key]), 1)
+        per_value = 1 if unique else -(-len(self.data) // distinct)
+
+        if qk.type_list:
+            return per_value * len(qk.value)
+        if qk.predicate is None:
+            return per_value
+        if isinstance(qk.predicate, InPredicate):
+            return per_value * len(qk.predicate.values)
+        # a range or a prefix scans all the values of the key
+        return len(self.data)
+
+    def _find_uids(
+        self,
+        qk: QueryKey,
+        unique: bool,
+        candidates: Optional[Set[UID]] = None,
+    ) -> Result[Optional[Set[UID]], str]:
+        """The uids of the objects matching `qk`, None if it doesn't restrict the
+        query. Backends can use the `candidates` of the previous steps to narrow
+        the lookup."""
+        cols = self.unique_keys if unique else self.searchable_keys
+        if qk.key not in cols:
+            if unique:
+                return Err(f"Failed to query index with {qk}")
+            return Err(f"Failed to search with {qk}")
 
-    def _find_keys_search(self, qks: QueryKeys) -> Result[Set[QueryKey], str]:
         try:
-            # match AND
-            subsets = []
-            for qk in qks.all:
-                subset = {}
-                pk_key, pk_value = qk.key, qk.value
-                if pk_key not in self.searchable_keys:
-                    return Err(f"Failed to search with {qk}")
-                ck_col = self.searchable_keys[pk_key]
-                if qk.type_list:
-                    # 🟡 TODO: change this hacky way to do on to many relationships
-                    # this is when you search a QueryKey which is a list of items
-                    # at the moment its mostly just a List[UID]
-                    # match OR against all keys for this col
-                    # the values of the list will be turned into strings in a single key
-                    matches = set()
-                    for item in pk_value:
-                        for col_key in ck_col.keys():
-                            if str(item) in col_key:
-                                store_values = ck_col[col_key]
-                                for value in store_values:
-                                    matches.add(value)
-                    if len(matches):
-                        subsets.append(matches)
-                else:
-                    # this is the normal path
-                    if pk_value not in ck_col.keys():
-                        # must be at least one in all query keys
-                        subsets.append(set())
-                        continue
-                    store_values = ck_col[pk_value]
-                    subsets.append(set(store_values))
-
-            if len(subsets) == 0:
-                return Ok(set())
-            # AND
-            subset = subsets.pop()
-            for s in subsets:
-                subset = subset.intersection(s)
-            return Ok(subset)
+            ck_col = cols[qk.key]
+            if qk.type_list:
+                values = self._search_values(qk)
+            elif qk.predicate is None:
+                values = [qk.value]
+            elif isinstance(qk.predicate, InPredicate):
+                values = qk.predicate.values
+            else:
+                values = [
+                    value for value in ck_col.keys() if qk.predicate.matches(value)
+                ]
+
+            matches = set()
+            for value in values:
+                if value in ck_col:
+                    store_values = [ck_col[value]] if unique else ck_col[value]
+                    matches.update(store_values)
+
+            # a list without any match doesn't restrict the search
+            if qk.type_list and len(matches) == 0:
+                return Ok(None)
+            return Ok(matches)
         except Exception as e:
-            return Err(f"Failed to query with {qks}. {e}")
+            return Err(f"Failed to query with {qk}. {e}")
+
+    @staticmethod
+    def _search_values(qk: QueryKey) -> List[Any]:
+        """The values of the searchable keys of `qk`, each item of a list is a key
+        of the objects listing it"""
+        if qk.type_list:
+            return [str(item) for item in qk.value]
+        return [qk.value]
 
     def _check_partition_keys_unique(
         self, unique_query_keys: QueryKeys
@@ -565,6 +881,22 @@ class KeyValueStorePartition(StorePartition):
         unique_query_keys: QueryKeys,
         searchable_query_keys: QueryKeys,
         obj: SyftObject,
+    ) -> None:
+        self._set_keys(
+            store_query_key=store_query_key,
+            unique_query_keys=unique_query_keys,
+            searchable_query_keys=searchable_query_keys,
+        )
+        try:
+            self.data[store_query_key.value] = obj
+        finally:
+            self._invalidate([store_query_key.value])
+
+    def _set_keys(
+        self,
+        store_query_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
     ) -> None:
         uqks = unique_query_keys.all
 
@@ -580,19 +912,13 @@ class KeyValueStorePartition(StorePartition):
 
         sqks = searchable_query_keys.all
         for qk in sqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.searchable_keys[pk_key]
-            if qk.type_list:
-                # coerce the list of objects to strings for a single key
-                pk_value = " ".join([str(obj) for obj in pk_value])
-
-            # check if key is present, then add to existing key
-            if pk_value in ck_col:
-                ck_col[pk_value].append(store_query_key.value)
-            else:
-                # else create the key with a list
-                ck_col[pk_value] = [store_query_key.value]
-
-            self.searchable_keys[pk_key] = ck_col
+            ck_col = self.searchable_keys[qk.key]
+            for pk_value in self._search_values(qk):
+                # check if key is present, then add to existing key
+                if pk_value in ck_col:
+                    ck_col[pk_value].append(store_query_key.value)
+                else:
+                    # else create the key with a list
+                    ck_col[pk_value] = [store_query_key.value]
 
-        self.data[store_query_key.value] = obj
+            self.searchable_keys[qk.key] = ck_col
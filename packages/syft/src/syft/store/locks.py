@@ -1,12 +1,31 @@
 # stdlib
 import datetime
 import json
+import math
+import os
 from pathlib import Path
+import sys
+import tempfile
 import threading
 import time
+import traceback
+from types import FrameType
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
 import uuid
+from weakref import WeakSet
+
+try:
+    # stdlib
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 # third party
 from pydantic import BaseModel
@@ -18,6 +37,8 @@ from sherlock.lock import RedisLock
 # relative
 from ..serde.serializable import serializable
 from ..util.logger import debug
+from ..util.logger import warning
+from ..util.telemetry import instrument
 
 
 @serializable()
@@ -86,15 +107,159 @@ class RedisLockingConfig(LockingConfig):
     client: RedisClientConfig = RedisClientConfig()
 
 
-class ThreadingLock(BaseLock):
+@serializable()
+class LockHolder(BaseModel):
+    """A thread holding a `SyftLock`
+
+    Args:
+        thread_id: int
+            Identifier of the thread, as in `threading.get_ident`
+        thread_name: str
+            Name of the thread
+        operation: Optional[str]
+            The operation the lock was acquired for, if given
+        shared: bool
+            If the lock is held shared
+        acquired_at: float
+            When the lock was acquired, as a timestamp
+        held_for: float
+            For how long the lock was held when reported, in seconds
+        stack: Optional[str]
+            The current stack of the thread, if requested
+    """
+
+    thread_id: int
+    thread_name: str
+    operation: Optional[str] = None
+    shared: bool = False
+    acquired_at: float
+    held_for: float
+    stack: Optional[str] = None
+
+
+@serializable()
+class LockReport(BaseModel):
+    """The holders of a `SyftLock` and its contention metrics, see
+    `SyftLock.metrics`"""
+
+    lock_name: str
+    namespace: Optional[str] = None
+    backend: str
+    holders: List[LockHolder] = []
+    metrics: Dict[str, float] = {}
+
+
+class SharedLock(BaseLock):
+    """
+    A lock which can also be held shared: any number of shared holders at once,
+    while no one holds it exclusively.
+    """
+
+    def _acquire_blocking(
+        self, timeout: Optional[float], retry_interval: float, shared: bool = False
+    ) -> bool:
+        """
+        Implementation of acquiring a lock, exclusive or shared, waiting up to
+        `timeout` seconds for it. A `timeout` of 0 doesn't wait.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        raise NotImplementedError("Must be implemented in the sub-class.")
+
+    def _release_shared(self) -> None:
+        """
+        Implementation of releasing a shared hold of the lock by this thread.
+        """
+        raise NotImplementedError("Must be implemented in the sub-class.")
+
+
+class _SharedHolds:
+    """The tokens of the shared holds of a lock by thread, a thread releases the
+    hold it acquired last."""
+
+    def __init__(self) -> None:
+        self._holds: Dict[int, List[Any]] = {}
+        self._mutex = threading.Lock()
+
+    def push(self, token: Any) -> None:
+        with self._mutex:
+            self._holds.setdefault(threading.get_ident(), []).append(token)
+
+    def held(self) -> bool:
+        """Whether this thread holds the lock shared"""
+        with self._mutex:
+            return threading.get_ident() in self._holds
+
+    def pop(self) -> Optional[Any]:
+        with self._mutex:
+            tokens = self._holds.get(threading.get_ident(), None)
+            if not tokens:
+                return None
+            token = tokens.pop()
+            if not tokens:
+                del self._holds[threading.get_ident()]
+            return token
+
+    def clear(self) -> List[Any]:
+        with self._mutex:
+            tokens = [token for tokens in self._holds.values() for token in tokens]
+            self._holds.clear()
+            return tokens
+
+
+class ThreadingLock(SharedLock):
     """
     Threading-based Lock. Used to provide the same API as the rest of the locks.
+
+    Blocked threads wait on a condition variable and are woken up by `release`.
+    While a thread waits for the exclusive lock, no new shared holder is let in so
+    that a stream of readers can't starve the writers. The threads already holding
+    it shared can take it again, the writer waits for them anyway.
     """
 
     def __init__(self, expire: int, **kwargs):
         self.expire = expire
-        self.locked_timestamp = 0
-        self.lock = threading.Lock()
+        self.locked_timestamp = 0.0
+        self.held = False
+        # thread id -> the acquisition times of its shared holds
+        self.readers: Dict[int, List[float]] = {}
+        self.writers_waiting = 0
+        self.condition = threading.Condition()
+
+    def _expired(self, timestamp: float) -> bool:
+        if self.expire is None or self.expire == -1:
+            return False
+        return time.time() - timestamp >= self.expire
+
+    def _drop_expired(self) -> None:
+        # must be called with `self.condition` held
+        if self.held and self._expired(self.locked_timestamp):
+            self.held = False
+        for ident, timestamps in list(self.readers.items()):
+            timestamps = [t for t in timestamps if not self._expired(t)]
+            if timestamps:
+                self.readers[ident] = timestamps
+            else:
+                del self.readers[ident]
+
+    def _try_acquire(self) -> bool:
+        # must be called with `self.condition` held
+        self._drop_expired()
+        if self.held or self.readers:
+            return False
+        self.held = True
+        self.locked_timestamp = time.time()
+        return True
+
+    def _try_acquire_shared(self) -> bool:
+        # must be called with `self.condition` held
+        self._drop_expired()
+        if self.held:
+            return False
+        if self.writers_waiting > 0 and threading.get_ident() not in self.readers:
+            return False
+        self.readers.setdefault(threading.get_ident(), []).append(time.time())
+        return True
 
     @property
     def _locked(self):
@@ -103,15 +268,9 @@ class ThreadingLock(BaseLock):
         :returns: if the lock is acquired or not
         :rtype: bool
         """
-        locked = self.lock.locked()
-        if (
-            locked
-            and time.time() - self.locked_timestamp >= self.expire
-            and self.expire != -1
-        ):
-            self._release()
-
-        return self.lock.locked()
+        with self.condition:
+            self._drop_expired()
+            return self.held or len(self.readers) > 0
 
     def _acquire(self):
         """
@@ -119,30 +278,57 @@ class ThreadingLock(BaseLock):
         :returns: if the lock was successfully acquired or not
         :rtype: bool
         """
-        locked = self.lock.locked()
-        if (
-            locked
-            and time.time() - self.locked_timestamp > self.expire
-            and self.expire != -1
-        ):
-            self._release()
+        with self.condition:
+            return self._try_acquire()
 
-        status = self.lock.acquire(
-            blocking=False
-        )  # timeout/retries handle in the `acquire` method
-        if status:
-            self.locked_timestamp = time.time()
-        return status
+    def _acquire_blocking(
+        self, timeout: Optional[float], retry_interval: float, shared: bool = False
+    ) -> bool:
+        """
+        Implementation of acquiring a lock, waiting up to `timeout` seconds for it.
+        A release wakes up a waiting thread right away, `retry_interval` only bounds
+        how long it waits before checking if the holder has expired.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        try_acquire = self._try_acquire_shared if shared else self._try_acquire
+        deadline = math.inf if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            if not shared:
+                self.writers_waiting += 1
+            try:
+                while not try_acquire():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    released = self.condition.wait(min(remaining, retry_interval))
+                    if not released and time.monotonic() >= deadline:
+                        return False
+                return True
+            finally:
+                if not shared:
+                    self.writers_waiting -= 1
+                    if self.writers_waiting == 0 and not self.held:
+                        # the readers held back by this writer can go on
+                        self.condition.notify_all()
 
     def _release(self):
         """
         Implementation of releasing an acquired lock.
         """
-
-        try:
-            return self.lock.release()
-        except RuntimeError:  # already unlocked
-            pass
+        with self.condition:
+            self.held = False
+            self.condition.notify_all()
+
+    def _release_shared(self) -> None:
+        with self.condition:
+            timestamps = self.readers.get(threading.get_ident(), None)
+            if timestamps:
+                timestamps.pop()
+                if not timestamps:
+                    del self.readers[threading.get_ident()]
+            if not self.readers:
+                self.condition.notify_all()
 
     def _renew(self) -> bool:
         """
@@ -151,6 +337,323 @@ class ThreadingLock(BaseLock):
         return True
 
 
+class _FlockWaiter(threading.Thread):
+    """Blocks on a `flock` of `fd` for a caller that waits with a timeout. If the
+    caller gives up first, the waiter closes `fd` once the lock is taken, which
+    releases it again."""
+
+    def __init__(self, fd: int, operation: int) -> None:
+        super().__init__(daemon=True)
+        self.fd = fd
+        self.operation = operation
+        self.done = threading.Event()
+        self.failed = False
+        self.abandoned = False
+        self.mutex = threading.Lock()
+
+    def run(self) -> None:
+        try:
+            fcntl.flock(self.fd, self.operation)
+        except OSError:
+            self.failed = True
+        with self.mutex:
+            if self.abandoned:
+                os.close(self.fd)
+            self.done.set()
+
+    def wait(self, timeout: float) -> bool:
+        self.done.wait(timeout)
+        with self.mutex:
+            if not self.done.is_set():
+                self.abandoned = True
+                return False
+        if self.failed:
+            os.close(self.fd)
+            return False
+        return True
+
+
+def _flock(fd: int, timeout: Optional[float], shared: bool = False) -> bool:
+    """Takes a `flock` of `fd`, shared or exclusive, waiting up to `timeout`
+    seconds for it. `fd` is closed if the lock is not taken."""
+    operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+    try:
+        fcntl.flock(fd, operation | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        pass
+    except BaseException:
+        os.close(fd)
+        raise
+
+    if timeout is not None and timeout <= 0:
+        os.close(fd)
+        return False
+
+    if timeout is None:
+        try:
+            fcntl.flock(fd, operation)
+        except BaseException:
+            os.close(fd)
+            raise
+        return True
+
+    # `flock` can't time out, the kernel wait happens in a separate thread
+    waiter = _FlockWaiter(fd, operation)
+    waiter.start()
+    return waiter.wait(timeout)
+
+
+class FcntlFileLock(SharedLock):
+    """
+    Implementation of lock with the file system as the backend for synchronization,
+    using an `fcntl.flock` of a lock file.
+
+    Waiting for the lock blocks in the kernel until the holder releases it, instead
+    of polling a lease file, and the OS drops the lock of a process which exits
+    without releasing it. A `flock` belongs to an open file, every acquisition opens
+    the lock file again so that the lock also excludes threads using another
+    `FcntlFileLock` of the same name. Shared holds use `LOCK_SH`, the kernel doesn't
+    hold back the readers of other processes while a writer waits.
+
+    Threads sharing this lock are serialized with a `ThreadingLock` first. `expire`
+    only applies to them: a thread can take over the lock of an expired holder in
+    the same process, a holder in another process keeps it until it releases it or
+    exits.
+    """
+
+    def __init__(self, lock_name: str, **kwargs) -> None:
+        super().__init__(lock_name, **kwargs)
+
+        if self.client is None:
+            self.client = Path(tempfile.gettempdir()) / "sherlock"
+        self.client = Path(self.client)
+        self.client.mkdir(parents=True, exist_ok=True)
+
+        self._lock_path = self.client / f"{self._key_name}.flock"
+        self._lock_py_thread = ThreadingLock(expire=self.expire)
+        # the open lock files of the exclusive and the shared holders
+        self._fd: Optional[int] = None
+        self._shared_fds = _SharedHolds()
+        self._fds_lock = threading.Lock()
+
+    @property
+    def _key_name(self) -> str:
+        if self.namespace is not None:
+            return f"{self.namespace}_{self.lock_name}"
+        return self.lock_name
+
+    def _open(self) -> int:
+        return os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @staticmethod
+    def _close(fd: int) -> None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    @property
+    def _locked(self) -> bool:
+        if self._lock_py_thread.locked():
+            return True
+
+        if self._fd is not None:
+            # the holder has expired, the next `acquire` takes the lock over
+            return False
+
+        fd = self._open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)
+        return False
+
+    def _acquire(self) -> bool:
+        return self._acquire_blocking(timeout=0, retry_interval=0)
+
+    def _acquire_blocking(
+        self, timeout: Optional[float], retry_interval: float, shared: bool = False
+    ) -> bool:
+        start = time.monotonic()
+        if not self._lock_py_thread._acquire_blocking(
+            timeout, retry_interval, shared=shared
+        ):
+            return False
+
+        try:
+            with self._fds_lock:
+                # the thread lock is ours, the lock files still open in this
+                # process belong to expired holders
+                stale = [] if shared else self._shared_fds.clear()
+                if shared and self._fd is not None:
+                    stale.append(self._fd)
+                    self._fd = None
+                for fd in stale:
+                    self._close(fd)
+                if not shared and self._fd is not None:
+                    # taken over from an expired holder, the file is still locked
+                    return True
+
+            remaining = None
+            if timeout is not None:
+                remaining = max(0.0, timeout - (time.monotonic() - start))
+            fd = self._open()
+            if _flock(fd, remaining, shared=shared):
+                if shared:
+                    self._shared_fds.push(fd)
+                else:
+                    self._fd = fd
+                return True
+        except BaseException:
+            self._release_thread_lock(shared)
+            raise
+
+        self._release_thread_lock(shared)
+        return False
+
+    def _release_thread_lock(self, shared: bool) -> None:
+        if shared:
+            self._lock_py_thread._release_shared()
+        else:
+            self._lock_py_thread._release()
+
+    def _release(self) -> None:
+        with self._fds_lock:
+            fd, self._fd = self._fd, None
+            if fd is not None:
+                self._close(fd)
+        self._lock_py_thread._release()
+
+    def _release_shared(self) -> None:
+        with self._fds_lock:
+            fd = self._shared_fds.pop()
+            if fd is not None:
+                self._close(fd)
+        self._lock_py_thread._release_shared()
+
+    def _renew(self) -> bool:
+        return self._fd is not None
+
+
+class RedisReadWriteLock(RedisLock, SharedLock):
+    """
+    Implementation of lock with Redis as the backend for synchronization, which can
+    also be held shared.
+
+    The shared holders are kept in a sorted set by expiry time next to the key of
+    the exclusive holder. A writer which finds readers holding the lock marks it as
+    wanted for a while, new readers are not let in until it got the lock. A thread
+    already holding it shared can take it again.
+    """
+
+    _acquire_script = """
+    local now = redis.call('TIME')
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+    if redis.call('ZCARD', KEYS[2]) == 0 and
+        redis.call('SETNX', KEYS[1], ARGV[1]) == 1 then
+        if tonumber(ARGV[2]) ~= -1 then
+            redis.call('EXPIRE', KEYS[1], ARGV[2])
+        end
+        redis.call('DEL', KEYS[3])
+        return 1
+    end
+    if tonumber(ARGV[3]) > 0 then
+        redis.call('SET', KEYS[3], ARGV[1], 'PX', ARGV[3])
+    end
+    return 0
+    """
+
+    _acquire_shared_script = """
+    local now = redis.call('TIME')
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return 0
+    end
+    if ARGV[3] == '0' and redis.call('EXISTS', KEYS[3]) == 1 then
+        return 0
+    end
+    if tonumber(ARGV[2]) == -1 then
+        redis.call('ZADD', KEYS[2], '+inf', ARGV[1])
+    else
+        redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), ARGV[1])
+    end
+    return 1
+    """
+
+    _release_shared_script = """
+    return redis.call('ZREM', KEYS[2], ARGV[1])
+    """
+
+    def __init__(self, lock_name: str, **kwargs) -> None:
+        super().__init__(lock_name, **kwargs)
+        self._acquire_shared_func = self.client.register_script(
+            self._acquire_shared_script
+        )
+        self._release_shared_func = self.client.register_script(
+            self._release_shared_script
+        )
+        self._shared_owners = _SharedHolds()
+
+    @property
+    def _keys(self) -> List[str]:
+        # the exclusive holder, the shared holders, the waiting writer mark
+        key = self._key_name
+        return [key, f"{key}:readers", f"{key}:writer"]
+
+    def _try_acquire(self, shared: bool, wait_mark: float) -> bool:
+        owner = str(uuid.uuid4())
+        expire = -1 if self.expire is None else self.expire
+        if shared:
+            nested = "1" if self._shared_owners.held() else "0"
+            args = [owner, expire, nested]
+            if self._acquire_shared_func(keys=self._keys, args=args) != 1:
+                return False
+            self._shared_owners.push(owner)
+            return True
+
+        # the waiting writer mark outlives the sleep between two attempts
+        mark_ms = int(wait_mark * 2000)
+        if self._acquire_func(keys=self._keys, args=[owner, expire, mark_ms]) != 1:
+            return False
+        self._owner = owner
+        return True
+
+    def _acquire(self) -> bool:
+        return self._try_acquire(shared=False, wait_mark=0)
+
+    def _acquire_blocking(
+        self, timeout: Optional[float], retry_interval: float, shared: bool = False
+    ) -> bool:
+        # Redis has no wake-up on release, the lock is polled
+        deadline = math.inf if timeout is None else time.monotonic() + timeout
+        wait_mark = retry_interval if timeout != 0 else 0
+        while not self._try_acquire(shared, wait_mark):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, retry_interval))
+            if time.monotonic() >= deadline:
+                return False
+        return True
+
+    def _release_shared(self) -> None:
+        owner = self._shared_owners.pop()
+        if owner is not None:
+            self._release_shared_func(keys=self._keys, args=[owner])
+
+    @property
+    def _locked(self) -> bool:
+        key, readers_key, _ = self._keys
+        if self.client.get(key) is not None:
+            return True
+        return self.client.zcount(readers_key, time.time(), "+inf") > 0
+
+
 class PatchedFileLock(FileLock):
     """
     Implementation of lock with the file system as the backend for synchronization.
@@ -161,6 +664,7 @@ class PatchedFileLock(FileLock):
     For different processes/OS threads, the file lock will work as expected.
     We need to patch the lock to handle Python threads too.
 
+    Used where `fcntl` is not available, `FcntlFileLock` is used everywhere else.
     """
 
     def __init__(self, *args, **kwargs) -> None:
@@ -300,10 +804,52 @@ class PatchedFileLock(FileLock):
                 self._owner = None
 
 
+class _Hold:
+    """A hold of a `SyftLock` by the current thread"""
+
+    __slots__ = ("thread_id", "thread_name", "operation", "shared", "acquired_at")
+
+    def __init__(self, operation: Optional[str], shared: bool) -> None:
+        thread = threading.current_thread()
+        self.thread_id = threading.get_ident()
+        self.thread_name = thread.name
+        self.operation = operation
+        self.shared = shared
+        self.acquired_at = time.time()
+
+    @property
+    def held_for(self) -> float:
+        return max(0.0, time.time() - self.acquired_at)
+
+    def holder(self, frames: Optional[Dict[int, FrameType]] = None) -> LockHolder:
+        stack = None
+        if frames is not None and self.thread_id in frames:
+            stack = "".join(traceback.format_stack(frames[self.thread_id]))
+        return LockHolder(
+            thread_id=self.thread_id,
+            thread_name=self.thread_name,
+            operation=self.operation,
+            shared=self.shared,
+            acquired_at=self.acquired_at,
+            held_for=self.held_for,
+            stack=stack,
+        )
+
+
+# the live locks of the process, checked by the watchdog
+SYFT_LOCKS: "WeakSet[SyftLock]" = WeakSet()
+_SYFT_LOCKS_MUTEX = threading.Lock()
+
+
+@instrument
 class SyftLock(BaseLock):
     """
     Syft Lock implementations.
 
+    Every acquisition records how long it waited and if it had to, every hold its
+    thread and operation until it is released. They are reported by `metrics` and
+    `report`.
+
     Params:
         config: Config specific to a locking strategy.
     """
@@ -321,6 +867,20 @@ class SyftLock(BaseLock):
 
         self._lock: Optional[BaseLock] = None
 
+        self._metrics_lock = threading.Lock()
+        self.acquisitions = 0
+        self.shared_acquisitions = 0
+        self.contended = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.holds = 0
+        self.hold_time = 0.0
+        self.max_hold_time = 0.0
+        self._exclusive_hold: Optional[_Hold] = None
+        # thread id -> its shared holds
+        self._shared_holds: Dict[int, List[_Hold]] = {}
+
         base_params = {
             "lock_name": config.lock_name,
             "namespace": config.namespace,
@@ -334,20 +894,25 @@ class SyftLock(BaseLock):
             self._lock = ThreadingLock(**base_params)
         elif isinstance(config, FileLockingConfig):
             client = config.client_path
-            self._lock = PatchedFileLock(
+            file_lock_type = FcntlFileLock if fcntl is not None else PatchedFileLock
+            self._lock = file_lock_type(
                 **base_params,
                 client=client,
             )
         elif isinstance(config, RedisLockingConfig):
             client = redis.StrictRedis(**config.client.dict())
 
-            self._lock = RedisLock(
+            self._lock = RedisReadWriteLock(
                 **base_params,
                 client=client,
             )
         else:
             raise ValueError("Unsupported config type")
 
+        if not self.passthrough:
+            with _SYFT_LOCKS_MUTEX:
+                SYFT_LOCKS.add(self)
+
     @property
     def _locked(self):
         """
@@ -361,34 +926,203 @@ class SyftLock(BaseLock):
 
         return self._lock.locked()
 
-    def acquire(self, blocking: bool = True) -> bool:
+    def acquire(self, blocking: bool = True, operation: Optional[str] = None) -> bool:
         """
         Acquire a lock, blocking or non-blocking.
         :param bool blocking: acquire a lock in a blocking or non-blocking
                               fashion. Defaults to True.
+        :param str operation: what the lock is acquired for, reported with the
+                              holder of the lock.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        return self._acquire_tracked(blocking, shared=False, operation=operation)
+
+    def acquire_shared(
+        self, blocking: bool = True, operation: Optional[str] = None
+    ) -> bool:
+        """
+        Acquire a shared hold of the lock, blocking or non-blocking. Any number of
+        shared holds can exist at once, while the lock is not held exclusively.
+        The locks which can't be shared are acquired exclusively instead.
+        :param bool blocking: acquire a lock in a blocking or non-blocking
+                              fashion. Defaults to True.
+        :param str operation: what the lock is acquired for, reported with the
+                              holder of the lock.
         :returns: if the lock was successfully acquired or not
         :rtype: bool
         """
+        if not isinstance(self._lock, SharedLock):
+            return self.acquire(blocking=blocking, operation=operation)
+        return self._acquire_tracked(blocking, shared=True, operation=operation)
+
+    def release_shared(self) -> None:
+        """
+        Release the shared hold of the lock acquired last by this thread.
+        """
+        if not isinstance(self._lock, SharedLock):
+            return self.release()
+
+        with self._metrics_lock:
+            holds = self._shared_holds.get(threading.get_ident(), None)
+            hold = holds.pop() if holds else None
+            if holds == []:
+                del self._shared_holds[threading.get_ident()]
+
+        try:
+            self._lock._release_shared()
+        except BaseException:
+            pass
+        self._record_hold(hold)
+
+    def _acquire_tracked(
+        self, blocking: bool, shared: bool, operation: Optional[str]
+    ) -> bool:
+        if self.passthrough:
+            return True
 
-        if not blocking:
+        start_time = time.monotonic()
+        acquired = self._try_acquire(shared)
+        contended = not acquired
+        if contended and blocking:
+            acquired = self._acquire_blocking(shared)
+        wait_time = time.monotonic() - start_time
+
+        if acquired:
+            hold = _Hold(operation, shared)
+        with self._metrics_lock:
+            if acquired and shared:
+                self.shared_acquisitions += 1
+                self._shared_holds.setdefault(hold.thread_id, []).append(hold)
+            elif acquired:
+                self.acquisitions += 1
+                self._exclusive_hold = hold
+            elif blocking:
+                self.timeouts += 1
+            self.contended += contended
+            if blocking:
+                self.wait_time += wait_time
+                self.max_wait_time = max(self.max_wait_time, wait_time)
+
+        if blocking and not acquired:
+            debug(
+                "Timeout elapsed after %s seconds "
+                "while trying to acquiring "
+                "lock." % self.timeout
+            )
+        return acquired
+
+    def _try_acquire(self, shared: bool) -> bool:
+        if not shared:
             return self._acquire()
+        try:
+            return self._lock._acquire_blocking(0, self.retry_interval, shared=True)
+        except BaseException:
+            return False
+
+    def _acquire_blocking(self, shared: bool = False) -> bool:
+        """
+        Implementation of acquiring a lock, waiting up to `timeout` seconds for it.
+        The threading and file locks wake up as soon as the lock is released, the
+        other locks are retried every `retry_interval` seconds.
 
-        timeout = self.timeout
-        start_time = time.time()
-        elapsed = 0
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        if self.passthrough:
+            return True
+
+        if isinstance(self._lock, SharedLock):
+            try:
+                return self._lock._acquire_blocking(
+                    self.timeout, self.retry_interval, shared=shared
+                )
+            except BaseException:
+                return False
+
+        timeout = math.inf if self.timeout is None else self.timeout
+        start_time = time.monotonic()
+        elapsed = 0.0
         while timeout >= elapsed:
             if not self._acquire():
                 time.sleep(self.retry_interval)
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
             else:
                 return True
-        debug(
-            "Timeout elapsed after %s seconds "
-            "while trying to acquiring "
-            "lock." % self.timeout
-        )
         return False
 
+    def _record_hold(self, hold: Optional[_Hold]) -> None:
+        if hold is None:
+            return
+        held_for = hold.held_for
+        with self._metrics_lock:
+            self.holds += 1
+            self.hold_time += held_for
+            self.max_hold_time = max(self.max_hold_time, held_for)
+
+    @property
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        """Counts of the acquisitions of the lock, of those which found it held
+        and of the blocking ones which timed out, with the time in seconds spent
+        waiting for it and holding it"""
+        with self._metrics_lock:
+            waits = self.acquisitions + self.shared_acquisitions + self.timeouts
+            return {
+                "acquisitions": self.acquisitions,
+                "shared_acquisitions": self.shared_acquisitions,
+                "contended": self.contended,
+                "timeouts": self.timeouts,
+                "wait_time": self.wait_time,
+                "max_wait_time": self.max_wait_time,
+                "mean_wait_time": self.wait_time / waits if waits else 0.0,
+                "holds": self.holds,
+                "hold_time": self.hold_time,
+                "max_hold_time": self.max_hold_time,
+                "mean_hold_time": self.hold_time / self.holds if self.holds else 0.0,
+            }
+
+    @property
+    def hold_limit(self) -> Optional[float]:
+        """How long the lock can be held before its waiters time out, in seconds"""
+        if self.timeout is not None:
+            return self.timeout
+        if self.expire is not None and self.expire != -1:
+            return self.expire
+        return None
+
+    def _current_holds(self) -> List[_Hold]:
+        with self._metrics_lock:
+            holds = [hold for holds in self._shared_holds.values() for hold in holds]
+            if self._exclusive_hold is not None:
+                holds.insert(0, self._exclusive_hold)
+        return holds
+
+    def holders(self, include_stacks: bool = False) -> List[LockHolder]:
+        """The threads holding the lock in this process, with their current stack
+        if `include_stacks`"""
+        frames = sys._current_frames() if include_stacks else None
+        return [hold.holder(frames) for hold in self._current_holds()]
+
+    def overdue_holders(self, include_stacks: bool = False) -> List[LockHolder]:
+        """The threads holding the lock for longer than its `hold_limit`"""
+        limit = self.hold_limit
+        if limit is None:
+            return []
+        return [
+            holder
+            for holder in self.holders(include_stacks=include_stacks)
+            if holder.held_for > limit
+        ]
+
+    def report(self, include_stacks: bool = False) -> LockReport:
+        return LockReport(
+            lock_name=self.lock_name,
+            namespace=self.namespace,
+            backend="NoLock" if self.passthrough else type(self._lock).__name__,
+            holders=self.holders(include_stacks=include_stacks),
+            metrics=self.metrics,
+        )
+
     def _acquire(self) -> bool:
         """
         Implementation of acquiring a lock in a non-blocking fashion.
@@ -412,10 +1146,14 @@ class SyftLock(BaseLock):
         if self.passthrough:
             return
 
+        with self._metrics_lock:
+            hold, self._exclusive_hold = self._exclusive_hold, None
+
         try:
-            return self._lock._release()
+            self._lock._release()
         except BaseException:
             pass
+        self._record_hold(hold)
 
     def _renew(self) -> bool:
         """
@@ -425,3 +1163,77 @@ class SyftLock(BaseLock):
             return True
 
         return self._lock._renew()
+
+
+class LockWatchdog:
+    """
+    Checks the holders of the `SyftLock`s of the process every `interval` seconds,
+    and logs the stack of the threads holding a lock for longer than its
+    `hold_limit`, once per hold.
+
+    Params:
+        interval: float
+            Seconds between two checks.
+    """
+
+    def __init__(self, interval: float = 5.0) -> None:
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # (lock, thread id, acquired at) of the overdue holds already logged
+        self._reported: Set[Tuple[int, int, float]] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="syft-lock-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                debug(f"Lock watchdog check failed: {e}")
+
+    def check(self) -> List[LockReport]:
+        """The locks with overdue holders, the stacks of the holders which were not
+        reported before are logged."""
+        with _SYFT_LOCKS_MUTEX:
+            locks = list(SYFT_LOCKS)
+
+        reports = []
+        reported = set()
+        for lock in locks:
+            overdue = lock.overdue_holders(include_stacks=True)
+            if len(overdue) == 0:
+                continue
+            reports.append(lock.report(include_stacks=True))
+            for holder in overdue:
+                key = (id(lock), holder.thread_id, holder.acquired_at)
+                reported.add(key)
+                if key not in self._reported:
+                    warning(
+                        f"Lock {lock.lock_name} held for {holder.held_for:.1f}s by "
+                        f"thread {holder.thread_name} ({holder.thread_id}) "
+                        f"in {holder.operation}, over its {lock.hold_limit}s "
+                        f"limit:\n{holder.stack}"
+                    )
+        self._reported = reported
+        return reports
+
+
+LOCK_WATCHDOG = LockWatchdog()
@@ -1,15 +1,23 @@
 # stdlib
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Type
 
 # third party
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from pymongo import ASCENDING
+from pymongo import UpdateOne
 from pymongo import WriteConcern
+from pymongo.client_session import ClientSession
 from pymongo.collection import Collection as MongoCollection
+from pymongo.cursor import Cursor as MongoCursor
+from pymongo.errors import BulkWriteError
 from pymongo.errors import DuplicateKeyError
+from pymongo.errors import OperationFailure
 from result import Err
 from result import Ok
 from result import Result
@@ -18,11 +26,16 @@ from typing_extensions import Self
 # relative
 from ..node.credentials import SyftVerifyKey
 from ..serde.deserialize import _deserialize
+from ..serde.recursive import lazy_deserialization
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..service.action.action_permissions import ActionObjectEXECUTE
+from ..service.action.action_permissions import ActionObjectOWNER
 from ..service.action.action_permissions import ActionObjectPermission
 from ..service.action.action_permissions import ActionObjectREAD
 from ..service.action.action_permissions import ActionObjectWRITE
+from ..service.action.action_permissions import ActionPermission
+from ..service.action.action_permissions import COMPOUND_PERMISSIONS
 from ..service.response import SyftSuccess
 from ..types.syft_object import StorableObjectType
 from ..types.syft_object import SyftBaseObject
@@ -30,16 +43,19 @@ from ..types.syft_object import SyftObject
 from ..types.transforms import TransformContext
 from ..types.transforms import transform
 from ..types.transforms import transform_method
+from ..types.uid import UID
 from .document_store import DocumentStore
 from .document_store import PartitionKey
 from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
 from .document_store import StorePartition
+from .document_store import StoreSnapshot
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .mongo_client import MongoClient
 from .mongo_client import MongoStoreClientConfig
+from .object_cache import CacheConfig
 
 
 @serializable()
@@ -63,6 +79,40 @@ class MongoBsonObject(StorableObjectType, dict):
     pass
 
 
+# the code of the errors of writes violating a unique index
+DUPLICATE_KEY_ERROR = 11000
+
+# the indexed array of the permission strings of each document
+PERMISSIONS_FIELD = "_permissions"
+
+# the documents written before the permissions were stored have no owner, they
+# keep the access everyone had to them: read, write and execute, not ownership
+LEGACY_PERMISSIONS = [
+    ActionPermission.ALL_READ.name,
+    ActionPermission.ALL_WRITE.name,
+    ActionPermission.ALL_EXECUTE.name,
+]
+
+# the permissions granted to everyone which imply the one of a user on a document,
+# ALL_WRITE and ALL_EXECUTE are only granted to the documents of LEGACY_PERMISSIONS
+DOCUMENT_COMPOUND_PERMISSIONS = {
+    **COMPOUND_PERMISSIONS,
+    ActionPermission.WRITE: ActionPermission.ALL_WRITE,
+    ActionPermission.EXECUTE: ActionPermission.ALL_EXECUTE,
+}
+
+# a new token on each write of a document, a cached object is only used while the
+# document keeps the revision it was read with
+REVISION_FIELD = "_rev"
+
+# the documents of a snapshot are kept as they are stored
+RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+# the documents are only decoded from their blob
+BLOB_PROJECTION = {"__blob__": 1}
+REVISION_PROJECTION = {REVISION_FIELD: 1}
+
+
 def _repr_debug_(value: Any) -> str:
     if hasattr(value, "_repr_debug_"):
         return value._repr_debug_()
@@ -102,7 +152,9 @@ def syft_obj_to_mongo():
 def from_mongo(
     storage_obj: Dict, context: Optional[TransformContext] = None
 ) -> SyftObject:
-    return _deserialize(storage_obj["__blob__"], from_bytes=True)
+    # large fields are only decoded when they are accessed
+    with lazy_deserialization():
+        return _deserialize(storage_obj["__blob__"], from_bytes=True)
 
 
 @serializable(attrs=["storage_type"])
@@ -132,7 +184,11 @@ class MongoStorePartition(StorePartition):
 
         self._collection = collection_status.ok()
 
-        return self._create_update_index()
+        index_status = self._create_update_index()
+        if index_status.is_err():
+            return index_status
+
+        return self._create_permissions_index()
 
     # Potentially thread-unsafe methods.
     # CAUTION:
@@ -193,6 +249,25 @@ class MongoStorePartition(StorePartition):
 
         return Ok()
 
+    def _create_permissions_index(self) -> Result[Ok, Err]:
+        """Index the permissions of the documents, which filter every query"""
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        try:
+            collection.create_index(PERMISSIONS_FIELD)
+            # documents written before the permissions were stored
+            collection.update_many(
+                filter={PERMISSIONS_FIELD: {"$exists": False}},
+                update={"$set": {PERMISSIONS_FIELD: LEGACY_PERMISSIONS}},
+            )
+        except Exception as e:
+            return Err(f"Failed to create the permissions index. {e}")
+
+        return Ok()
+
     @property
     def collection(self) -> Result[MongoCollection, Err]:
         if not hasattr(self, "_collection"):
@@ -209,28 +284,221 @@ class MongoStorePartition(StorePartition):
         add_permissions: Optional[List[ActionObjectPermission]] = None,
         ignore_duplicates: bool = False,
     ) -> Result[SyftObject, str]:
-        write_permission = ActionObjectWRITE(uid=obj.id, credentials=credentials)
-        can_write = self.has_permission(write_permission)
-        if can_write:
-            storage_obj = obj.to(self.storage_type)
-
-            collection_status = self.collection
-            if collection_status.is_err():
-                return collection_status
-            collection = collection_status.ok()
-
-            if ignore_duplicates:
-                collection = collection.with_options(write_concern=WriteConcern(w=0))
-            try:
-                collection.insert_one(storage_obj)
-            except DuplicateKeyError as e:
-                return Err(f"Duplicate Key Error for {obj}: {e}")
-            if add_permissions is not None:
-                pass
-                # TODO: update permissions
-            return Ok(obj)
-        else:
-            return Err(f"No permission to write object with id {obj.id}")
+        # a new document is owned by the user writing it, an existing one is a
+        # duplicate key error so no permission is needed
+        storage_obj = self._to_storage(obj)
+        storage_obj[PERMISSIONS_FIELD] = self._owner_permissions(
+            obj.id, credentials, add_permissions
+        )
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        if ignore_duplicates:
+            collection = collection.with_options(write_concern=WriteConcern(w=0))
+        try:
+            collection.insert_one(storage_obj)
+        except DuplicateKeyError as e:
+            return Err(f"Duplicate Key Error for {obj}: {e}")
+        return Ok(obj)
+
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        results: List[Result[SyftObject, str]] = [Ok(obj) for obj in objs]
+        storage_objs = []
+        for obj in objs:
+            storage_obj = self._to_storage(obj)
+            storage_obj[PERMISSIONS_FIELD] = self._owner_permissions(
+                obj.id, credentials, add_permissions
+            )
+            storage_objs.append(storage_obj)
+
+        if len(storage_objs) == 0:
+            return Ok(results)
+
+        try:
+            # unordered, a failed insert doesn't stop the following ones
+            collection.insert_many(storage_objs, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details["writeErrors"]:
+                idx = error["index"]
+                if error["code"] != DUPLICATE_KEY_ERROR:
+                    results[idx] = Err(
+                        f"Failed to write obj {objs[idx]}. {error['errmsg']}"
+                    )
+                elif not ignore_duplicates:
+                    results[idx] = Err(
+                        f"Duplicate Key Error for {objs[idx]}: {error['errmsg']}"
+                    )
+        return Ok(results)
+
+    def _get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        read_filter = self._permission_filter(credentials, ActionPermission.READ)
+        syft_objs = self._find(collection, {"_id": {"$in": uids}, **read_filter})
+        objs = {syft_obj.id: syft_obj for syft_obj in syft_objs}
+
+        existing = self._existing_ids(collection, uids) if len(objs) < len(uids) else []
+        results = []
+        for uid in uids:
+            if uid in objs:
+                results.append(Ok(objs[uid]))
+            elif uid in existing:
+                read_permission = ActionObjectREAD(uid=uid, credentials=credentials)
+                results.append(Err(f"Permission: {read_permission} denied"))
+            else:
+                results.append(Err(f"{uid} not in {type(self)}"))
+        return Ok(results)
+
+    def _existing_ids(
+        self,
+        collection: MongoCollection,
+        uids: List[UID],
+        permission_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[UID]:
+        permission_filter = {} if permission_filter is None else permission_filter
+        storage_objs = collection.find(
+            filter={"_id": {"$in": uids}, **permission_filter}, projection={"_id": 1}
+        )
+        return [storage_obj["_id"] for storage_obj in storage_objs]
+
+    def _find(
+        self,
+        collection: MongoCollection,
+        filter: Dict[str, Any],
+        sort_key: str = "_id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SyftObject]:
+        """The objects of the documents matching `filter`, the cached ones are not
+        sent by the server."""
+
+        def find(projection: Dict[str, Any]) -> MongoCursor:
+            return (
+                collection.find(filter=filter, projection=projection)
+                .sort(sort_key)
+                .skip(offset)
+                # a limit of 0 is no limit
+                .limit(limit or 0)
+            )
+
+        if self.cache is None:
+            return self._to_syft(find(BLOB_PROJECTION))
+
+        revisions = {
+            storage_obj["_id"]: storage_obj.get(REVISION_FIELD, None)
+            for storage_obj in find(REVISION_PROJECTION)
+        }
+        objs = {}
+        for uid, revision in revisions.items():
+            obj = self.cache.get(uid, revision)
+            if obj is not None:
+                objs[uid] = obj
+
+        missing = [uid for uid in revisions if uid not in objs]
+        if len(missing) > 0:
+            storage_objs = collection.find(
+                filter={"_id": {"$in": missing}},
+                projection={**BLOB_PROJECTION, **REVISION_PROJECTION},
+            )
+            for storage_obj in storage_objs:
+                obj = self._to_syft([storage_obj])[0]
+                self.cache.put(obj.id, obj, storage_obj.get(REVISION_FIELD, None))
+                objs[obj.id] = obj
+        return [objs[uid] for uid in revisions if uid in objs]
+
+    def _to_storage(self, obj: SyftObject) -> MongoBsonObject:
+        storage_obj = obj.to(self.storage_type)
+        storage_obj[REVISION_FIELD] = UID().no_dash
+        return storage_obj
+
+    def _invalidate(self, uids: Iterable[UID]) -> None:
+        # the revisions keep stale objects from being read, the cache only
+        # frees them early
+        if self.cache is not None:
+            self.cache.invalidate(uids)
+
+    def _to_syft(self, storage_objs: Iterable[Dict]) -> List[SyftObject]:
+        syft_objs = []
+        for storage_obj in storage_objs:
+            obj = self.storage_type(storage_obj)
+            transform_context = TransformContext(output={}, obj=obj)
+            syft_objs.append(obj.to(self.settings.object_type, transform_context))
+        return syft_objs
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[List[Result[SyftObject, str]], str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        uids = [obj.id for obj in objs]
+        existing = self._existing_ids(collection, uids)
+        writable = (
+            existing
+            if has_permission
+            else self._existing_ids(
+                collection,
+                uids,
+                self._permission_filter(credentials, ActionPermission.WRITE),
+            )
+        )
+        results: List[Result[SyftObject, str]] = []
+        requests = []
+        # the positions in `results` of the updated objects
+        updated = []
+        for obj in objs:
+            if obj.id not in existing:
+                results.append(Err(f"No object exists with id: {obj.id}"))
+            elif obj.id in writable:
+                storage_obj = self._to_storage(obj)
+                requests.append(
+                    UpdateOne(filter={"_id": obj.id}, update={"$set": storage_obj})
+                )
+                updated.append(len(results))
+                results.append(Ok(obj))
+            else:
+                results.append(
+                    Err(f"Failed to update obj {obj}, you have no permission")
+                )
+
+        if len(requests) == 0:
+            return Ok(results)
+
+        try:
+            collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details["writeErrors"]:
+                idx = updated[error["index"]]
+                results[idx] = Err(
+                    f"Failed to update obj: {objs[idx]}. Error: {error['errmsg']}"
+                )
+        finally:
+            self._invalidate(objs[idx].id for idx in updated)
+        return Ok(results)
 
     def _update(
         self,
@@ -266,7 +534,7 @@ class MongoStorePartition(StorePartition):
             obj.id = prev_obj["id"]
 
             # Create the Mongo object
-            storage_obj = obj.to(self.storage_type)
+            storage_obj = self._to_storage(obj)
 
             # revert the ID
             obj.id = obj_id
@@ -277,6 +545,8 @@ class MongoStorePartition(StorePartition):
                 )
             except Exception as e:
                 return Err(f"Failed to update obj: {obj} with qk: {qk}. Error: {e}")
+            finally:
+                self._invalidate([prev_obj.id])
 
             return Ok(obj)
         else:
@@ -288,41 +558,54 @@ class MongoStorePartition(StorePartition):
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[SyftObject], str]:
         # TODO: pass index as hint to find method
         qks = QueryKeys(qks=(index_qks.all + search_qks.all))
         return self._get_all_from_store(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
         )
 
+    def _explain(self, index_qks: QueryKeys, search_qks: QueryKeys) -> Result[str, str]:
+        # the predicates are evaluated by the server, with its own query planner
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        qks = QueryKeys(qks=(index_qks.all + search_qks.all))
+        try:
+            plan = collection.find(filter=qks.as_dict_mongo).explain()
+        except Exception as e:
+            return Err(f"Failed to explain the query with {qks}. {e}")
+        winning_plan = plan.get("queryPlanner", {}).get("winningPlan", {})
+        return Ok(f"filter: {qks.as_dict_mongo}\nwinning plan: {winning_plan}")
+
     def _get_all_from_store(
         self,
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Result[List[SyftObject], str]:
         collection_status = self.collection
         if collection_status.is_err():
             return collection_status
         collection = collection_status.ok()
 
-        if order_by is not None:
-            storage_objs = collection.find(filter=qks.as_dict_mongo).sort(order_by.key)
-        else:
-            _default_key = "_id"
-            storage_objs = collection.find(filter=qks.as_dict_mongo).sort(_default_key)
-        syft_objs = []
-        for storage_obj in storage_objs:
-            obj = self.storage_type(storage_obj)
-            transform_context = TransformContext(output={}, obj=obj)
-            syft_objs.append(obj.to(self.settings.object_type, transform_context))
-
-        # TODO: maybe do this in loop before this
-        res = []
-        for s in syft_objs:
-            if self.has_permission(ActionObjectREAD(uid=s.id, credentials=credentials)):
-                res.append(s)
-        return Ok(res)
+        # only the documents the user can read are sent by the server
+        qks_filter = {
+            **qks.as_dict_mongo,
+            **self._permission_filter(credentials, ActionPermission.READ),
+        }
+        sort_key = order_by.key if order_by is not None else "_id"
+        return Ok(self._find(collection, qks_filter, sort_key, limit, offset))
 
     def _delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
@@ -337,20 +620,153 @@ class MongoStorePartition(StorePartition):
         ):
             qks = QueryKeys(qks=qk)
             result = collection.delete_one(filter=qks.as_dict_mongo)
+            if qk.key == self.settings.store_key.key:
+                self._invalidate([qk.value])
 
             if result.deleted_count == 1:
                 return Ok(SyftSuccess(message="Deleted"))
 
         return Err(f"Failed to delete object with qk: {qk}")
 
+    def _delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: List[QueryKey],
+        has_permission: bool = False,
+    ) -> Result[List[Result[SyftSuccess, str]], str]:
+        if any(qk.key != self.settings.store_key.key for qk in qks):
+            # only the objects matched by their id are deleted at once
+            return super()._delete_many(credentials, qks, has_permission=has_permission)
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        uids = [qk.value for qk in qks]
+        writable = self._existing_ids(
+            collection,
+            uids,
+            None
+            if has_permission
+            else self._permission_filter(credentials, ActionPermission.WRITE),
+        )
+        results: List[Result[SyftSuccess, str]] = []
+        deleted = []
+        for qk in qks:
+            if qk.value in writable:
+                deleted.append(qk.value)
+                results.append(Ok(SyftSuccess(message="Deleted")))
+            else:
+                results.append(Err(f"Failed to delete object with qk: {qk}"))
+
+        if len(deleted) > 0:
+            collection.delete_many(filter={"_id": {"$in": deleted}})
+            self._invalidate(deleted)
+        return Ok(results)
+
+    def _owner_permissions(
+        self,
+        uid: UID,
+        credentials: SyftVerifyKey,
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+    ) -> List[str]:
+        permissions = [
+            ActionObjectOWNER(uid=uid, credentials=credentials),
+            ActionObjectWRITE(uid=uid, credentials=credentials),
+            ActionObjectREAD(uid=uid, credentials=credentials),
+            ActionObjectEXECUTE(uid=uid, credentials=credentials),
+        ]
+        if add_permissions is not None:
+            permissions.extend(add_permissions)
+        return list({permission.permission_string for permission in permissions})
+
+    def _permission_filter(
+        self, credentials: Optional[SyftVerifyKey], permission: ActionPermission
+    ) -> Dict[str, Any]:
+        """The filter of the documents on which `credentials` have `permission`"""
+        # TODO: fix for other admins
+        if (
+            credentials is not None
+            and self.root_verify_key.verify == credentials.verify
+        ):
+            return {}
+
+        permissions = [
+            ActionObjectPermission(
+                uid=None, permission=permission, credentials=credentials
+            ).permission_string
+        ]
+        if permission in DOCUMENT_COMPOUND_PERMISSIONS:
+            permissions.append(DOCUMENT_COMPOUND_PERMISSIONS[permission].name)
+        return {PERMISSIONS_FIELD: {"$in": permissions}}
+
     def has_permission(self, permission: ActionObjectPermission) -> bool:
-        # TODO: implement
-        return True
+        if not isinstance(permission.permission, ActionPermission):
+            raise Exception(f"ObjectPermission type: {permission.permission} not valid")
 
-    def _all(self, credentials: SyftVerifyKey, order_by: Optional[PartitionKey] = None):
+        permission_filter = self._permission_filter(
+            permission.credentials, permission.permission
+        )
+        if len(permission_filter) == 0:
+            return True
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return False
+        collection = collection_status.ok()
+
+        return (
+            collection.count_documents(
+                filter={"_id": permission.uid, **permission_filter}, limit=1
+            )
+            > 0
+        )
+
+    def add_permission(self, permission: ActionObjectPermission) -> None:
+        self.add_permissions([permission])
+
+    def add_permissions(self, permissions: List[ActionObjectPermission]) -> None:
+        collection_status = self.collection
+        if collection_status.is_err():
+            raise Exception(collection_status.err())
+        collection = collection_status.ok()
+
+        requests = [
+            UpdateOne(
+                filter={"_id": permission.uid},
+                update={"$addToSet": {PERMISSIONS_FIELD: permission.permission_string}},
+            )
+            for permission in permissions
+        ]
+        if len(requests) > 0:
+            collection.bulk_write(requests)
+
+    def remove_permission(self, permission: ActionObjectPermission) -> None:
+        collection_status = self.collection
+        if collection_status.is_err():
+            raise Exception(collection_status.err())
+        collection = collection_status.ok()
+
+        collection.update_one(
+            filter={"_id": permission.uid},
+            update={"$pull": {PERMISSIONS_FIELD: permission.permission_string}},
+        )
+
+    def _all(
+        self,
+        credentials: SyftVerifyKey,
+        order_by: Optional[PartitionKey] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ):
         qks = QueryKeys(qks=())
         return self._get_all_from_store(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
         )
 
     def __len__(self):
@@ -361,6 +777,18 @@ class MongoStorePartition(StorePartition):
         return collection.count_documents(filter={})
 
 
+class MongoStoreSnapshot(StoreSnapshot):
+    """Mongo snapshot, a dump of the collections of the database
+
+    Parameters:
+        `collections`: Dict[str, List[RawBSONDocument]]
+            The documents of each collection, as they are stored
+    """
+
+    def __init__(self, collections: Dict[str, List[RawBSONDocument]]) -> None:
+        self.collections = collections
+
+
 @serializable()
 class MongoDocumentStore(DocumentStore):
     """Mongo Document Store
@@ -372,6 +800,64 @@ class MongoDocumentStore(DocumentStore):
 
     partition_type = MongoStorePartition
 
+    def snapshot(self) -> Result[MongoStoreSnapshot, str]:
+        client = MongoClient(config=self.store_config.client_config)
+        db_status = client.with_db(db_name=self.store_config.db_name)
+        if db_status.is_err():
+            return db_status
+        db = db_status.ok()
+
+        def dump(
+            session: Optional[ClientSession],
+        ) -> Dict[str, List[RawBSONDocument]]:
+            return {
+                name: list(
+                    db.get_collection(name, codec_options=RAW_CODEC_OPTIONS).find(
+                        filter={}, session=session
+                    )
+                )
+                for name in names
+            }
+
+        try:
+            names = db.list_collection_names()
+        except Exception as e:
+            return Err(f"Failed to snapshot {self.store_config.db_name}. {e}")
+
+        try:
+            # the collections are read at the same cluster time
+            with client.client.start_session(snapshot=True) as session:
+                collections = dump(session)
+        except OperationFailure:
+            # a standalone server has no snapshot reads, each collection is read
+            # at its own point in time
+            collections = dump(None)
+        except Exception as e:
+            return Err(f"Failed to snapshot {self.store_config.db_name}. {e}")
+        return Ok(MongoStoreSnapshot(collections=collections))
+
+    def restore(self, snapshot: MongoStoreSnapshot) -> Result[SyftSuccess, str]:
+        client = MongoClient(config=self.store_config.client_config)
+        db_status = client.with_db(db_name=self.store_config.db_name)
+        if db_status.is_err():
+            return db_status
+        db = db_status.ok()
+
+        try:
+            names = set(db.list_collection_names()) | set(snapshot.collections)
+            for name in names:
+                # the indexes of the collections are kept
+                collection = db.get_collection(name, codec_options=RAW_CODEC_OPTIONS)
+                collection.delete_many(filter={})
+                documents = snapshot.collections.get(name, [])
+                if len(documents) > 0:
+                    collection.insert_many(documents)
+        except Exception as e:
+            return Err(f"Failed to restore {self.store_config.db_name}. {e}")
+        finally:
+            self._clear_caches()
+        return Ok(SyftSuccess(message=f"Restored {self.store_config.db_name}"))
+
 
 @serializable()
 class MongoStoreConfig(StoreConfig):
@@ -391,6 +877,10 @@ class MongoStoreConfig(StoreConfig):
                 * FileLockingConfig: file based locking, ideal for same-device different-processes/threads stores.
                 * RedisLockingConfig: Redis-based locking, ideal for multi-device stores.
             Defaults to NoLockingConfig.
+        cache_config: Optional[CacheConfig]
+            The config of the cache of the deserialized objects of each partition,
+            a cached object is validated against the revision of its document.
+            Defaults to CacheConfig().
     """
 
     client_config: MongoStoreClientConfig
@@ -398,3 +888,4 @@ class MongoStoreConfig(StoreConfig):
     db_name: str = "app"
     # TODO: should use a distributed lock, with RedisLockingConfig
     locking_config: LockingConfig = NoLockingConfig()
+    cache_config: Optional[CacheConfig] = CacheConfig()
@@ -0,0 +1,141 @@
+# stdlib
+from collections import OrderedDict
+from copy import copy
+import sys
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+# third party
+from pydantic import BaseModel
+
+# relative
+from ..serde.serializable import serializable
+from ..types.syft_object import SyftObject
+from ..types.uid import UID
+
+
+@serializable()
+class CacheConfig(BaseModel):
+    """
+    Object cache config
+
+    Args:
+        max_objects: int
+            The number of objects kept in the cache of a partition.
+        max_bytes: int
+            The estimated size of the objects kept in the cache of a partition,
+            an object larger than it is never cached.
+    """
+
+    max_objects: int = 10_000
+    max_bytes: int = 64 * 1024 * 1024
+
+
+def estimated_size(obj: Any) -> int:
+    """The size of `obj` and of its fields, the fields which are not deserialized
+    yet count as their serialized size."""
+    size = sys.getsizeof(obj)
+    fields = getattr(obj, "__dict__", {})
+    size += sum(sys.getsizeof(value) for value in fields.values())
+    lazy_fields = getattr(obj, "_syft_lazy_fields", None) or {}
+    size += sum(
+        len(lazy_field.blob)
+        for name, lazy_field in lazy_fields.items()
+        if name not in fields
+    )
+    return size
+
+
+def _copy(obj: Any) -> Any:
+    # the callers set the fields of the objects they read, the cached ones are
+    # never handed out
+    if isinstance(obj, SyftObject):
+        return obj._syft_shallow_copy()
+    return copy(obj)
+
+
+class ObjectCache:
+    """A bounded LRU cache of the deserialized objects of a partition, by UID.
+
+    An object can be cached with the version of the store it was read from, it is
+    then only returned for the same version. The cache keeps and returns copies of
+    the objects, with their own fields.
+
+    Parameters:
+        config: CacheConfig
+            The bounds of the cache
+    """
+
+    def __init__(self, config: CacheConfig) -> None:
+        self.config = config
+        # uid -> (obj, version, size), from the least to the most recently used
+        self._entries: OrderedDict[UID, Tuple[Any, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, uid: UID, version: Any = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(uid, None)
+            if entry is None or entry[1] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(uid)
+            self.hits += 1
+            return _copy(entry[0])
+
+    def put(self, uid: UID, obj: Any, version: Any = None) -> None:
+        size = estimated_size(obj)
+        with self._lock:
+            self._pop(uid)
+            if size > self.config.max_bytes or self.config.max_objects <= 0:
+                return
+            self._entries[uid] = (_copy(obj), version, size)
+            self.size += size
+            while (
+                len(self._entries) > self.config.max_objects
+                or self.size > self.config.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, uids: Iterable[UID]) -> None:
+        with self._lock:
+            for uid in uids:
+                if self._pop(uid):
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, uid: UID) -> bool:
+        entry = self._entries.pop(uid, None)
+        if entry is None:
+            return False
+        self.size -= entry[2]
+        return True
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "objects": len(self._entries),
+            "bytes": self.size,
+        }
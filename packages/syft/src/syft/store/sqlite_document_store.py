@@ -2,16 +2,24 @@
 from __future__ import annotations
 
 # stdlib
-from copy import deepcopy
+from contextlib import contextmanager
+from io import BytesIO
 from pathlib import Path
 import sqlite3
 import tempfile
 from typing import Any
+from typing import ContextManager
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import MutableMapping
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
+from weakref import WeakValueDictionary
 
 # third party
 from pydantic import Field
@@ -22,19 +30,168 @@ from result import Result
 from typing_extensions import Self
 
 # relative
+from ..serde.compression import CompressionTransport
+from ..serde.compression import compression_transport
 from ..serde.deserialize import _deserialize
+from ..serde.recursive import lazy_deserialization
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..serde.stream import iter_serialized
+from ..service.action.action_permissions import ActionObjectPermission
+from ..service.action.action_permissions import ActionPermission
+from ..service.action.action_permissions import granting_permission_strings
+from ..service.action.action_permissions import role_permission_string
+from ..service.response import SyftSuccess
+from ..service.user.user_roles import ServiceRole
+from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from ..util.util import thread_ident
+from .document_store import BasePartitionSettings
 from .document_store import DocumentStore
+from .document_store import InPredicate
+from .document_store import PartitionKey
 from .document_store import PartitionSettings
+from .document_store import PrefixPredicate
+from .document_store import QueryKey
+from .document_store import QueryKeys
+from .document_store import RangePredicate
 from .document_store import StoreClientConfig
 from .document_store import StoreConfig
+from .document_store import StoreSnapshot
+from .document_store import paginate
 from .kv_document_store import KeyValueBackingStore
+from .kv_document_store import KeyValuePermissionIndex
 from .kv_document_store import KeyValueStorePartition
+from .kv_document_store import UniqueKeyCheck
 from .locks import FileLockingConfig
 from .locks import LockingConfig
+from .object_cache import CacheConfig
+
+# incremental blob I/O (python >= 3.11) lets values be streamed in and out of the
+# database instead of passing through a single bytes object
+SQLITE_BLOB_STREAMING = hasattr(sqlite3.Connection, "blobopen")
+
+# the default limit of parameters of a statement before SQLite 3.32
+SQLITE_MAX_VARIABLES = 999
+
+# the values of the index which are also stored with their SQLite type, which
+# orders them for the range and prefix predicates
+SQLITE_NATIVE_TYPES = (str, int, float)
+
+SQLITE_RANGE_OPERATORS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+# the current version of each data table, shared by every connection to the
+# database
+SQLITE_VERSIONS_TABLE = "table_versions"
+
+# the pages copied by each step of a snapshot, the writers of a database which
+# isn't in WAL mode are only blocked during a step
+SQLITE_SNAPSHOT_PAGES = 1024
+
+
+class SQLiteConnection:
+    """A connection to the database of a SQLite store, shared by all the tables of
+    the database in a thread so a write to several of them can be committed as one
+    transaction.
+
+    Parameters:
+        `client_config`: SQLiteStoreClientConfig
+            SQLite connection configuration
+    """
+
+    def __init__(self, client_config: SQLiteStoreClientConfig) -> None:
+        self.db = sqlite3.connect(
+            client_config.file_path,
+            timeout=client_config.timeout,
+            check_same_thread=client_config.check_same_thread,
+        )
+        self.db.execute(f"pragma journal_mode={client_config.journal_mode}")  # nosec
+        self.db.execute(f"pragma synchronous={client_config.synchronous}")  # nosec
+        # the depth of the nested `transaction` blocks, the statements executed
+        # inside them are only committed when the outermost one exits
+        self.transaction_depth = 0
+        self.rolled_back = False
+        # the open savepoints, innermost last, and the ones rolled back
+        self.savepoints: List[str] = []
+        self.failed_savepoints: Set[str] = set()
+
+    def commit(self) -> None:
+        if self.transaction_depth == 0:
+            self.db.commit()
+
+    def rollback(self) -> None:
+        if len(self.savepoints) > 0:
+            # only the statements of the innermost savepoint are undone
+            self.failed_savepoints.add(self.savepoints[-1])
+            self._rollback_to(self.savepoints[-1])
+            return
+
+        self.db.rollback()
+        if self.transaction_depth > 0:
+            # the statements executed earlier in the transaction are gone, discard
+            # the following ones as well
+            self.rolled_back = True
+
+    def _rollback_to(self, savepoint: str) -> None:
+        try:
+            self.db.execute(f"rollback to {savepoint}")  # nosec
+        except sqlite3.Error:
+            # some errors abort the whole transaction, with its savepoints
+            self.rolled_back = True
+
+    def _end_transaction(self) -> None:
+        if self.rolled_back:
+            self.db.rollback()
+        else:
+            self.db.commit()
+        self.rolled_back = False
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        self.transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self.rolled_back = True
+            raise
+        finally:
+            self.transaction_depth -= 1
+            if self.transaction_depth == 0:
+                self._end_transaction()
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """A nested transaction: the statements of the block are undone if it
+        raises or one of them fails, the rest of the transaction goes on."""
+        name = f"syft_savepoint_{len(self.savepoints)}"
+        self.transaction_depth += 1
+        if not self.db.in_transaction:
+            # releasing a savepoint which began the transaction would commit it.
+            # The write lock is taken now, the reads of the block can't be of an
+            # older version of the database than its writes.
+            self.db.execute("begin immediate")
+        self.db.execute(f"savepoint {name}")  # nosec
+        self.savepoints.append(name)
+        failed = True
+        try:
+            yield
+            failed = name in self.failed_savepoints
+        finally:
+            self.savepoints.pop()
+            self.failed_savepoints.discard(name)
+            if failed and not self.rolled_back:
+                self._rollback_to(name)
+            if not self.rolled_back:
+                self.db.execute(f"release {name}")  # nosec
+            self.transaction_depth -= 1
+            if self.transaction_depth == 0:
+                self._end_transaction()
+
+
+# the open connections by database file and thread
+SQLITE_CONNECTIONS: MutableMapping[
+    Tuple[str, int], SQLiteConnection
+] = WeakValueDictionary()
 
 
 def _repr_debug_(value: Any) -> str:
@@ -43,74 +200,54 @@ def _repr_debug_(value: Any) -> str:
     return repr(value)
 
 
-@serializable(attrs=["index_name", "settings", "store_config"])
-class SQLiteBackingStore(KeyValueBackingStore):
-    """Core Store logic for the SQLite stores.
+class SQLiteTable:
+    """A table in the database of a SQLite store, each thread gets its own
+    connection to the database which is shared with the other tables.
 
     Parameters:
-        `index_name`: str
-            Index name
         `settings`: PartitionSettings
             Syft specific settings
         `store_config`: SQLiteStoreConfig
             Connection Configuration
-        `ddtype`: Type
-            Class used as fallback on `get` errors
     """
 
-    def __init__(
-        self,
-        index_name: str,
-        settings: PartitionSettings,
-        store_config: StoreConfig,
-        ddtype: Optional[type] = None,
-    ) -> None:
-        self.index_name = index_name
+    def __init__(self, settings: PartitionSettings, store_config: StoreConfig) -> None:
         self.settings = settings
         self.store_config = store_config
-        self._ddtype = ddtype
-        self._db: Dict[int, sqlite3.Connection] = {}
+        self._connections: Dict[int, SQLiteConnection] = {}
         self._cur: Dict[int, sqlite3.Cursor] = {}
         self.create_table()
 
     @property
     def table_name(self) -> str:
-        return f"{self.settings.name}_{self.index_name}"
+        raise NotImplementedError
+
+    def create_table(self) -> None:
+        raise NotImplementedError
 
     def _connect(self) -> None:
         # SQLite is not thread safe by default so we ensure that each connection
         # comes from a different thread. In cases of Uvicorn and other AWSGI servers
         # there will be many threads handling incoming requests so we need to ensure
         # that different connections are used in each thread. By using a dict for the
-        # _db and _cur we can ensure they are never shared
+        # _connections and _cur we can ensure they are never shared between threads
         self.file_path = self.store_config.client_config.file_path
-        self._db[thread_ident()] = sqlite3.connect(
-            self.file_path,
-            timeout=self.store_config.client_config.timeout,
-            check_same_thread=self.store_config.client_config.check_same_thread,
-        )
-
-        # TODO: Review OSX compatibility.
-        # Set journal mode to WAL.
-        # self._db[thread_ident()].execute("pragma journal_mode=wal")
+        key = (str(self.file_path), thread_ident())
+        connection = SQLITE_CONNECTIONS.get(key, None)
+        if connection is None:
+            connection = SQLiteConnection(self.store_config.client_config)
+            SQLITE_CONNECTIONS[key] = connection
+        self._connections[thread_ident()] = connection
 
-    def create_table(self):
-        try:
-            self.cur.execute(
-                f"create table {self.table_name} (uid VARCHAR(32) NOT NULL PRIMARY KEY, "  # nosec
-                + "repr TEXT NOT NULL, value BLOB NOT NULL, "  # nosec
-                + "sqltime TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL)"  # nosec
-            )
-            self.db.commit()
-        except sqlite3.OperationalError as e:
-            if f"table {self.table_name} already exists" not in str(e):
-                raise e
+    @property
+    def connection(self) -> SQLiteConnection:
+        if thread_ident() not in self._connections:
+            self._connect()
+        return self._connections[thread_ident()]
 
     @property
     def db(self) -> sqlite3.Connection:
-        if thread_ident() not in self._db:
-            self._connect()
-        return self._db[thread_ident()]
+        return self.connection.db
 
     @property
     def cur(self) -> sqlite3.Cursor:
@@ -120,11 +257,26 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return self._cur[thread_ident()]
 
     def _close(self) -> None:
+        # the connection is closed when no table of the thread uses it anymore
         self._commit()
-        self.db.close()
+        self._cur.pop(thread_ident(), None)
+        self._connections.pop(thread_ident(), None)
 
     def _commit(self) -> None:
-        self.db.commit()
+        self.connection.commit()
+
+    def _rollback(self) -> None:
+        self.connection.rollback()
+
+    def transaction(self) -> ContextManager[None]:
+        """Commits the statements executed on the database by this thread in the
+        block at once, or rolls all of them back if one of them fails."""
+        return self.connection.transaction()
+
+    def savepoint(self) -> ContextManager[None]:
+        """Rolls back the statements executed by this thread in the block if one
+        of them fails, without the rest of the enclosing transaction."""
+        return self.connection.savepoint()
 
     def _execute(
         self, sql: str, *args: Optional[List[Any]]
@@ -134,37 +286,179 @@ class SQLiteBackingStore(KeyValueBackingStore):
         try:
             cursor = self.cur.execute(sql, *args)
         except BaseException as e:
-            self.db.rollback()  # Roll back all changes if an exception occurs.
+            self._rollback()  # Roll back all changes if an exception occurs.
             err = Err(str(e))
         else:
-            self.db.commit()  # Commit if everything went ok
+            self._commit()  # Commit if everything went ok
 
         if err is not None:
             return err
 
         return Ok(cursor)
 
-    def _set(self, key: UID, value: Any) -> None:
-        if self._exists(key):
-            self._update(key, value)
+    def __del__(self):
+        try:
+            self._commit()
+        except BaseException:
+            pass
+
+
+@serializable(attrs=["index_name", "settings", "store_config"])
+class SQLiteBackingStore(SQLiteTable, KeyValueBackingStore):
+    """Core Store logic for the SQLite stores.
+
+    Parameters:
+        `index_name`: str
+            Index name
+        `settings`: PartitionSettings
+            Syft specific settings
+        `store_config`: SQLiteStoreConfig
+            Connection Configuration
+        `ddtype`: Type
+            Class used as fallback on `get` errors
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        ddtype: Optional[type] = None,
+    ) -> None:
+        self.index_name = index_name
+        self._ddtype = ddtype
+        # the version of the table when it was last read, by any thread
+        self._version: Optional[str] = None
+        super().__init__(settings, store_config)
+
+    @property
+    def table_name(self) -> str:
+        return f"{self.settings.name}_{self.index_name}"
+
+    def create_table(self):
+        try:
+            self.cur.execute(
+                f"create table {self.table_name} (uid VARCHAR(32) NOT NULL PRIMARY KEY, "  # nosec
+                + "repr TEXT NOT NULL, value BLOB NOT NULL, "  # nosec
+                + "sqltime TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL)"  # nosec
+            )
+            self._commit()
+        except sqlite3.OperationalError as e:
+            if f"table {self.table_name} already exists" not in str(e):
+                raise e
+        self.cur.execute(
+            f"create table if not exists {SQLITE_VERSIONS_TABLE} "  # nosec
+            + "(name TEXT NOT NULL PRIMARY KEY, version TEXT NOT NULL)"
+        )
+        self._commit()
+
+    def _new_version(self) -> None:
+        # each write gives the table a new random version in its transaction, the
+        # readers of every thread and process see it changed
+        row = self.cur.execute(
+            f"select version from {SQLITE_VERSIONS_TABLE} where name = ?",  # nosec
+            [self.table_name],
+        ).fetchone()
+        version = UID().no_dash
+        self.cur.execute(
+            f"insert into {SQLITE_VERSIONS_TABLE} (name, version) VALUES (?, ?) "  # nosec
+            + "on conflict(name) do update set version = excluded.version",
+            [self.table_name, version],
+        )
+        if self._version == (None if row is None else row[0]):
+            # no one else wrote to the table since it was read
+            self._version = version
+
+    def _modify(self, sql: str, params: Optional[List[Any]] = None) -> None:
+        try:
+            self.cur.execute(sql, params or [])
+            self._new_version()
+        except BaseException as e:
+            self._rollback()  # Roll back all changes if an exception occurs.
+            raise ValueError(str(e))
         else:
-            insert_sql = f"insert into {self.table_name} (uid, repr, value) VALUES (?, ?, ?)"  # nosec
-            data = _serialize(value, to_bytes=True)
-            res = self._execute(insert_sql, [str(key), _repr_debug_(value), data])
-            if res.is_err():
-                raise ValueError(res.err())
+            self._commit()
+
+    @property
+    def _value_column(self) -> str:
+        # when streaming only the rowid is selected, the value is read with `_load`
+        return "rowid" if SQLITE_BLOB_STREAMING else "value"
+
+    def _load(self, stored: Union[int, bytes]) -> Any:
+        # large fields are only decoded when they are accessed
+        with lazy_deserialization():
+            if SQLITE_BLOB_STREAMING:
+                with self.db.blobopen(
+                    self.table_name, "value", stored, readonly=True
+                ) as blob:
+                    return _deserialize(blob, from_stream=True)
+            return _deserialize(BytesIO(stored), from_stream=True)
+
+    def _write(self, sql: str, values: Dict[UID, Any]) -> None:
+        # values are stored as syft streams, the chunks point into the memory of
+        # the object so it is never materialized as a single blob when streaming
+        rows = []
+        with compression_transport(CompressionTransport.SQLITE):
+            for key, value in values.items():
+                params = {"uid": str(key), "repr": _repr_debug_(value)}
+                rows.append((params, list(iter_serialized(value))))
+        try:
+            if SQLITE_BLOB_STREAMING:
+                self.cur.executemany(
+                    sql,
+                    [
+                        dict(params, value=sum(len(chunk) for chunk in chunks))
+                        for params, chunks in rows
+                    ],
+                )
+                for params, chunks in rows:
+                    rowid = self.cur.execute(
+                        f"select rowid from {self.table_name} where uid = ?",  # nosec
+                        [params["uid"]],
+                    ).fetchone()[0]
+                    with self.db.blobopen(self.table_name, "value", rowid) as blob:
+                        for chunk in chunks:
+                            blob.write(chunk)
+            else:
+                self.cur.executemany(
+                    sql,
+                    [dict(params, value=b"".join(chunks)) for params, chunks in rows],
+                )
+            self._new_version()
+        except BaseException as e:
+            self._rollback()  # Roll back all changes if an exception occurs.
+            raise ValueError(str(e))
+        else:
+            self._commit()
+
+    @property
+    def _value_placeholder(self) -> str:
+        return "zeroblob(:value)" if SQLITE_BLOB_STREAMING else ":value"
+
+    @property
+    def _upsert_sql(self) -> str:
+        return (
+            f"insert into {self.table_name} (uid, repr, value) "  # nosec
+            + f"VALUES (:uid, :repr, {self._value_placeholder}) "  # nosec
+            + "on conflict(uid) do update set repr = excluded.repr, value = excluded.value"  # nosec
+        )
+
+    def _set(self, key: UID, value: Any) -> None:
+        self._write(self._upsert_sql, {key: value})
+
+    def _set_many(self, values: Dict[UID, Any]) -> None:
+        if len(values) > 0:
+            self._write(self._upsert_sql, values)
 
     def _update(self, key: UID, value: Any) -> None:
-        insert_sql = f"update {self.table_name} set uid = ?, repr = ?, value = ? where uid = ?"  # nosec
-        data = _serialize(value, to_bytes=True)
-        res = self._execute(insert_sql, [str(key), _repr_debug_(value), data, str(key)])
-        if res.is_err():
-            raise ValueError(res.err())
+        update_sql = (
+            f"update {self.table_name} set repr = :repr, "  # nosec
+            + f"value = {self._value_placeholder} where uid = :uid"  # nosec
+        )
+        self._write(update_sql, {key: value})
 
     def _get(self, key: UID) -> Any:
-        select_sql = (
-            f"select * from {self.table_name} where uid = ? order by sqltime"  # nosec
-        )
+        select_sql = f"select uid, {self._value_column} from {self.table_name} where uid = ? order by sqltime"  # nosec
         res = self._execute(select_sql, [str(key)])
         if res.is_err():
             raise KeyError(f"Query {select_sql} failed")
@@ -173,8 +467,24 @@ class SQLiteBackingStore(KeyValueBackingStore):
         row = cursor.fetchone()
         if row is None or len(row) == 0:
             raise KeyError(f"{key} not in {type(self)}")
-        data = row[2]
-        return _deserialize(data, from_bytes=True)
+        return self._load(row[1])
+
+    def _get_many(self, keys: List[UID]) -> Dict[UID, Any]:
+        values = {}
+        for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+            stop = start + SQLITE_MAX_VARIABLES
+            chunk = {str(key): key for key in keys[start:stop]}
+            select_sql = (
+                f"select uid, {self._value_column} from {self.table_name} "  # nosec
+                + f"where uid in ({', '.join(['?'] * len(chunk))})"  # nosec
+            )
+            res = self._execute(select_sql, list(chunk))
+            if res.is_err():
+                raise KeyError(f"Query {select_sql} failed")
+
+            for uid, stored in res.ok().fetchall():
+                values[chunk[uid]] = self._load(stored)
+        return values
 
     def _exists(self, key: UID) -> bool:
         select_sql = f"select uid from {self.table_name} where uid = ?"  # nosec
@@ -191,7 +501,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return bool(row)
 
     def _get_all(self) -> Any:
-        select_sql = f"select * from {self.table_name} order by sqltime"  # nosec
+        select_sql = f"select uid, {self._value_column} from {self.table_name} order by sqltime, rowid"  # nosec
         keys = []
         data = []
 
@@ -206,11 +516,13 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
         for row in rows:
             keys.append(UID(row[0]))
-            data.append(_deserialize(row[2], from_bytes=True))
+            data.append(self._load(row[1]))
         return dict(zip(keys, data))
 
     def _get_all_keys(self) -> Any:
-        select_sql = f"select uid from {self.table_name} order by sqltime"  # nosec
+        select_sql = (
+            f"select uid from {self.table_name} order by sqltime, rowid"  # nosec
+        )
         keys = []
 
         res = self._execute(select_sql)
@@ -228,15 +540,11 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
     def _delete(self, key: UID) -> None:
         select_sql = f"delete from {self.table_name} where uid = ?"  # nosec
-        res = self._execute(select_sql, [str(key)])
-        if res.is_err():
-            raise ValueError(res.err())
+        self._modify(select_sql, [str(key)])
 
     def _delete_all(self) -> None:
         select_sql = f"delete from {self.table_name}"  # nosec
-        res = self._execute(select_sql)
-        if res.is_err():
-            raise ValueError(res.err())
+        self._modify(select_sql)
 
     def _len(self) -> int:
         select_sql = f"select count(uid) from {self.table_name}"  # nosec
@@ -250,6 +558,26 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def __setitem__(self, key: Any, value: Any) -> None:
         self._set(key, value)
 
+    def update(self, values: Dict[Any, Any]) -> None:
+        self._set_many(values)
+
+    def get_many(self, keys: List[Any]) -> Dict[Any, Any]:
+        return self._get_many(keys)
+
+    def changed(self) -> bool:
+        # the version is only changed by the writes of the other partitions and
+        # processes, the partition keeps up with its own
+        res = self._execute(
+            f"select version from {SQLITE_VERSIONS_TABLE} where name = ?",  # nosec
+            [self.table_name],
+        )
+        if res.is_err():
+            return True
+        row = res.ok().fetchone()
+        version = None if row is None else row[0]
+        previous, self._version = self._version, version
+        return previous != version
+
     def __getitem__(self, key: Any) -> Self:
         try:
             return self._get(key)
@@ -270,8 +598,9 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def clear(self) -> Self:
         self._delete_all()
 
-    def copy(self) -> Self:
-        return deepcopy(self)
+    def copy(self) -> Dict[Any, Any]:
+        # the connections can't be copied, only the values
+        return dict(self._get_all())
 
     def keys(self) -> Any:
         return self._get_all_keys()
@@ -294,11 +623,439 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def __iter__(self) -> Any:
         return iter(self.keys())
 
-    def __del__(self):
+
+class SQLiteStoreSnapshot(StoreSnapshot):
+    """SQLite snapshot, a copy of the database file
+
+    Parameters:
+        `file_path`: Path
+            The path of the copy
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        self.file_path = file_path
+
+
+def _backup(
+    source_path: Path, target_path: Path, pages: int, timeout: float = 5
+) -> None:
+    """Copies the database at `source_path` into the one at `target_path` with
+    the sqlite3 backup API, `pages` pages at a time."""
+    source = sqlite3.connect(source_path, timeout=timeout, isolation_level=None)
+    target = sqlite3.connect(target_path, timeout=timeout)
+    try:
+        journal_mode = source.execute("pragma journal_mode").fetchone()[0]
+        if journal_mode.lower() == "wal":
+            # the steps run in a single read transaction, so the copy is taken at
+            # one point in time without restarting on every write, which a
+            # reader doesn't block in WAL mode
+            source.execute("begin")
+            source.execute("select count(*) from sqlite_master").fetchone()
+        source.backup(target, pages=pages)
+    finally:
+        if source.in_transaction:
+            source.execute("rollback")
+        source.close()
+        target.close()
+
+
+def snapshot_database(
+    client_config: SQLiteStoreClientConfig, path: Optional[Union[str, Path]] = None
+) -> Result[SQLiteStoreSnapshot, str]:
+    """A copy of the database of `client_config` at `path`, by default next to
+    the database"""
+    file_path = client_config.file_path
+    if file_path is None:
+        return Err("The store has no database file")
+    if path is None:
+        path = file_path.parent / f"{file_path.stem}.{UID().no_dash}.snapshot"
+
+    try:
+        _backup(file_path, Path(path), SQLITE_SNAPSHOT_PAGES, client_config.timeout)
+    except sqlite3.Error as e:
+        return Err(f"Failed to snapshot {file_path}. {e}")
+    return Ok(SQLiteStoreSnapshot(file_path=Path(path)))
+
+
+def restore_database(
+    client_config: SQLiteStoreClientConfig, snapshot: SQLiteStoreSnapshot
+) -> Result[SyftSuccess, str]:
+    """Replaces the database of `client_config` with `snapshot`"""
+    file_path = client_config.file_path
+    if file_path is None:
+        return Err("The store has no database file")
+
+    try:
+        # the database is replaced at once, not by steps
+        _backup(snapshot.file_path, file_path, -1, client_config.timeout)
+    except sqlite3.Error as e:
+        return Err(f"Failed to restore {file_path}. {e}")
+    return Ok(SyftSuccess(message=f"Restored {file_path}"))
+
+
+class SQLiteIndexStore(SQLiteTable):
+    """The unique or searchable keys of the SQLite partitions, one indexed row of
+    (partition, key, value, uid) for each key of every object.
+
+    Parameters:
+        `index_name`: str
+            Index name, "unique_keys" or "searchable_keys"
+        `settings`: PartitionSettings
+            Syft specific settings
+        `store_config`: SQLiteStoreConfig
+            Connection Configuration
+        `unique`: bool
+            If True a (partition, key, value) can only map to a single uid
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        unique: bool = False,
+    ) -> None:
+        self.index_name = index_name
+        self.unique = unique
+        super().__init__(settings, store_config)
+
+    @property
+    def table_name(self) -> str:
+        # shared by all the partitions of the database
+        return f"{self.index_name}_index"
+
+    def create_table(self) -> None:
+        constraint = (
+            "partition, key, value" if self.unique else "partition, key, value, uid"
+        )
+        # `sort_value` holds the values of the native SQLite types, for the range
+        # and prefix predicates
+        self.cur.execute(
+            f"create table if not exists {self.table_name} (partition TEXT NOT NULL, "  # nosec
+            + "key TEXT NOT NULL, value BLOB NOT NULL, uid VARCHAR(32) NOT NULL, "  # nosec
+            + f"sort_value, UNIQUE ({constraint}))"  # nosec
+        )
+        self.cur.execute(
+            f"create index if not exists {self.table_name}_uid "  # nosec
+            + f"on {self.table_name} (partition, uid)"  # nosec
+        )
+        self.cur.execute(
+            f"create index if not exists {self.table_name}_sort_value "  # nosec
+            + f"on {self.table_name} (partition, key, sort_value)"  # nosec
+        )
+        self._commit()
+
+    @staticmethod
+    def _value(value: Any) -> bytes:
+        # equal values have the same bytes
+        return _serialize(value, to_bytes=True, for_hashing=True)
+
+    @staticmethod
+    def _rows(qk: QueryKey) -> List[Tuple[Union[str, bytes], Any]]:
+        """The (value, sort_value) rows of `qk`, one for each item of a list"""
+        if qk.type_list:
+            return [(str(item), str(item)) for item in qk.value]
+        sort_value = qk.value if isinstance(qk.value, SQLITE_NATIVE_TYPES) else None
+        return [(SQLiteIndexStore._value(qk.value), sort_value)]
+
+    def add(self, uid: UID, qks: List[QueryKey]) -> None:
+        # a unique value is claimed by the latest uid
+        conflict = "replace" if self.unique else "ignore"
+        insert_sql = (
+            f"insert or {conflict} into {self.table_name} "  # nosec
+            + "(partition, key, value, uid, sort_value) VALUES (?, ?, ?, ?, ?)"  # nosec
+        )
+        rows = [
+            (self.settings.name, qk.key, value, str(uid), sort_value)
+            for qk in qks
+            for value, sort_value in self._rows(qk)
+        ]
         try:
-            self._close()
-        except BaseException:
-            pass
+            self.cur.executemany(insert_sql, rows)
+        except BaseException as e:
+            self._rollback()  # Roll back all changes if an exception occurs.
+            raise ValueError(str(e))
+        else:
+            self._commit()
+
+    def remove(self, uid: UID) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} where partition = ? and uid = ?"  # nosec
+        )
+        res = self._execute(delete_sql, [self.settings.name, str(uid)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    @staticmethod
+    def _condition(qk: QueryKey) -> Tuple[str, List[Any]]:
+        """The where clause matching the rows of `qk` with its parameters"""
+        predicate = qk.predicate
+        if qk.type_list or isinstance(predicate, InPredicate):
+            # match OR against the items of the list
+            if qk.type_list:
+                values = [value for value, _ in SQLiteIndexStore._rows(qk)]
+            else:
+                values = [SQLiteIndexStore._value(value) for value in predicate.values]
+            if len(values) == 0:
+                return "0", []
+            return f"value in ({', '.join(['?'] * len(values))})", values
+
+        if predicate is None:
+            return "value = ?", [SQLiteIndexStore._value(qk.value)]
+
+        if isinstance(predicate, PrefixPredicate):
+            # the strings starting with the prefix sort between it and the prefix
+            # with its last character incremented
+            if predicate.prefix == "":
+                return "typeof(sort_value) = 'text'", []
+            stop = predicate.prefix[:-1] + chr(ord(predicate.prefix[-1]) + 1)
+            return "sort_value >= ? and sort_value < ?", [predicate.prefix, stop]
+
+        if isinstance(predicate, RangePredicate):
+            bounds = predicate.bounds
+            if not all(isinstance(b, SQLITE_NATIVE_TYPES) for b in bounds.values()):
+                raise ValueError(
+                    f"Range on {qk.key} only supports str, int or float bounds"
+                )
+            clauses = [f"sort_value {SQLITE_RANGE_OPERATORS[op]} ?" for op in bounds]
+            # a range without bounds matches the values which can be compared
+            clauses = clauses or ["sort_value is not null"]
+            return " and ".join(clauses), list(bounds.values())
+
+        raise ValueError(f"Unsupported predicate: {predicate}")
+
+    def find(self, qk: QueryKey, candidates: Optional[Set[UID]] = None) -> Set[UID]:
+        condition, params = self._condition(qk)
+        select_sql = (
+            f"select distinct uid from {self.table_name} "  # nosec
+            + f"where partition = ? and key = ? and ({condition})"  # nosec
+        )
+        params = [self.settings.name, qk.key] + params
+        if candidates is not None and len(params) + len(candidates) <= (
+            SQLITE_MAX_VARIABLES
+        ):
+            # only the objects matched by the previous keys
+            select_sql += f" and uid in ({', '.join(['?'] * len(candidates))})"
+            params += [str(uid) for uid in candidates]
+
+        res = self._execute(select_sql, params)
+        if res.is_err():
+            raise ValueError(res.err())
+        return {UID(row[0]) for row in res.ok().fetchall()}
+
+    def count(self, qk: QueryKey) -> int:
+        """The number of objects matching `qk`, from the index only"""
+        condition, params = self._condition(qk)
+        select_sql = (
+            f"select count(distinct uid) from {self.table_name} "  # nosec
+            + f"where partition = ? and key = ? and ({condition})"  # nosec
+        )
+        res = self._execute(select_sql, [self.settings.name, qk.key] + params)
+        if res.is_err():
+            raise ValueError(res.err())
+        return res.ok().fetchone()[0]
+
+    def ordered(
+        self,
+        key: str,
+        uids: List[UID],
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Optional[List[UID]]:
+        """The page of `uids` ordered by their values of `key`, from the index only.
+        None when some of them have no value SQLite can order."""
+        where_sql = "partition = ? and key = ? and sort_value is not null"
+        params: List[Any] = [self.settings.name, key]
+        if len(params) + len(uids) + 2 > SQLITE_MAX_VARIABLES:
+            # too many uids for a statement, only the uids are ordered by SQLite
+            res = self._execute(
+                f"select uid from {self.table_name} where {where_sql} "  # nosec
+                + "order by sort_value, rowid",
+                params,
+            )
+            if res.is_err():
+                raise ValueError(res.err())
+            wanted = set(uids)
+            matches = [UID(row[0]) for row in res.ok().fetchall()]
+            matches = [uid for uid in matches if uid in wanted]
+            if len(matches) != len(wanted):
+                return None
+            return paginate(matches, limit, offset)
+
+        where_sql += f" and uid in ({', '.join(['?'] * len(uids))})"
+        params += [str(uid) for uid in uids]
+        res = self._execute(
+            f"select count(*) from {self.table_name} where {where_sql}",  # nosec
+            params,
+        )
+        if res.is_err():
+            raise ValueError(res.err())
+        if res.ok().fetchone()[0] != len(set(uids)):
+            return None
+
+        res = self._execute(
+            f"select uid from {self.table_name} where {where_sql} "  # nosec
+            + "order by sort_value, rowid limit ? offset ?",
+            params + [-1 if limit is None else limit, offset],
+        )
+        if res.is_err():
+            raise ValueError(res.err())
+        return [UID(row[0]) for row in res.ok().fetchall()]
+
+    def __len__(self) -> int:
+        select_sql = (
+            f"select count(*) from {self.table_name} where partition = ?"  # nosec
+        )
+        res = self._execute(select_sql, [self.settings.name])
+        if res.is_err():
+            raise ValueError(res.err())
+        return res.ok().fetchone()[0]
+
+
+@serializable(attrs=["settings", "store_config"], inherit=False)
+class SQLitePermissionIndex(SQLiteTable, KeyValuePermissionIndex):
+    """The permissions of the SQLite stores, one indexed row of (partition, uid,
+    permission string) for each permission granted on an object.
+
+    Parameters:
+        `settings`: BasePartitionSettings
+            Syft specific settings
+        `store_config`: SQLiteStoreConfig
+            Connection Configuration
+    """
+
+    def __init__(
+        self, settings: BasePartitionSettings, store_config: StoreConfig
+    ) -> None:
+        SQLiteTable.__init__(self, settings, store_config)
+        if len(self) == 0:
+            self._import_permissions_table()
+
+    @property
+    def table_name(self) -> str:
+        # shared by all the partitions of the database
+        return "permissions_index"
+
+    def create_table(self) -> None:
+        self.cur.execute(
+            f"create table if not exists {self.table_name} (partition TEXT NOT NULL, "  # nosec
+            + "uid VARCHAR(32) NOT NULL, permission TEXT NOT NULL, "  # nosec
+            + "UNIQUE (partition, uid, permission))"  # nosec
+        )
+        self.cur.execute(
+            f"create index if not exists {self.table_name}_permission "  # nosec
+            + f"on {self.table_name} (partition, permission, uid)"  # nosec
+        )
+        self._commit()
+
+    def _import_permissions_table(self) -> None:
+        # a database written before the permission index existed, with a set of
+        # permission strings per uid
+        legacy_name = f"{self.settings.name}_permissions"
+        res = self._execute(
+            "select name from sqlite_master where type = 'table' and name = ?",
+            [legacy_name],
+        )
+        if res.is_err() or res.ok().fetchone() is None:
+            return
+        legacy = SQLiteBackingStore(
+            "permissions", self.settings, self.store_config, ddtype=set
+        )
+        self.grant_strings(legacy.items())
+
+    def _executemany(self, sql: str, rows: List[Tuple[Any, ...]]) -> None:
+        try:
+            self.cur.executemany(sql, rows)
+        except BaseException as e:
+            self._rollback()  # Roll back all changes if an exception occurs.
+            raise ValueError(str(e))
+        else:
+            self._commit()
+
+    def _select(self, sql: str, params: List[Any]) -> List[Tuple[Any, ...]]:
+        res = self._execute(sql, params)
+        if res.is_err():
+            raise ValueError(res.err())
+        return res.ok().fetchall()
+
+    def __contains__(self, uid: UID) -> bool:
+        select_sql = (
+            f"select 1 from {self.table_name} "  # nosec
+            "where partition = ? and uid = ? limit 1"
+        )
+        return len(self._select(select_sql, [self.settings.name, str(uid)])) > 0
+
+    def __len__(self) -> int:
+        select_sql = (
+            f"select count(*) from {self.table_name} where partition = ?"  # nosec
+        )
+        return self._select(select_sql, [self.settings.name])[0][0]
+
+    def grant_strings(self, grants: Iterable[Tuple[UID, Iterable[str]]]) -> None:
+        insert_sql = (
+            f"insert or ignore into {self.table_name} "  # nosec
+            + "(partition, uid, permission) VALUES (?, ?, ?)"  # nosec
+        )
+        rows = [
+            (self.settings.name, str(uid), string)
+            for uid, strings in grants
+            for string in strings
+        ]
+        self._executemany(insert_sql, rows)
+
+    def revoke_strings(self, grants: Iterable[Tuple[UID, Iterable[str]]]) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} "  # nosec
+            + "where partition = ? and uid = ? and permission = ?"  # nosec
+        )
+        rows = [
+            (self.settings.name, str(uid), string)
+            for uid, strings in grants
+            for string in strings
+        ]
+        self._executemany(delete_sql, rows)
+
+    def revoke_all(self, uids: Iterable[UID]) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} where partition = ? and uid = ?"  # nosec
+        )
+        self._executemany(delete_sql, [(self.settings.name, str(uid)) for uid in uids])
+
+    def _any(self, uid: Optional[UID], strings: List[str]) -> bool:
+        select_sql = (
+            f"select 1 from {self.table_name} where partition = ? "  # nosec
+            + f"and permission in ({', '.join(['?'] * len(strings))})"  # nosec
+        )
+        params = [self.settings.name] + strings
+        if uid is not None:
+            select_sql += " and uid = ?"
+            params.append(str(uid))
+        return len(self._select(select_sql + " limit 1", params)) > 0
+
+    def has(
+        self, permission: ActionObjectPermission, role: Optional[ServiceRole] = None
+    ) -> bool:
+        return self._any(permission.uid, granting_permission_strings(permission, role))
+
+    def uids_with(
+        self, permission: ActionObjectPermission, role: Optional[ServiceRole] = None
+    ) -> Set[UID]:
+        strings = granting_permission_strings(permission, role)
+        select_sql = (
+            f"select distinct uid from {self.table_name} where partition = ? "  # nosec
+            + f"and permission in ({', '.join(['?'] * len(strings))})"  # nosec
+        )
+        rows = self._select(select_sql, [self.settings.name] + strings)
+        return {UID(row[0]) for row in rows}
+
+    def has_role_grants(self, permission: Optional[ActionPermission] = None) -> bool:
+        permissions = list(ActionPermission) if permission is None else [permission]
+        strings = [
+            role_permission_string(permission, role)
+            for permission in permissions
+            for role in ServiceRole
+        ]
+        return self._any(None, strings)
 
 
 @serializable()
@@ -312,10 +1069,141 @@ class SQLiteStorePartition(KeyValueStorePartition):
             SQLite specific configuration
     """
 
+    def _init_permissions(self) -> SQLitePermissionIndex:
+        return SQLitePermissionIndex(self.settings, self.store_config)
+
+    def _init_keys(self) -> None:
+        # the keys are rows of indexed tables instead of a single blob per key,
+        # so writing or querying a key doesn't depend on the size of the partition
+        self.unique_keys = SQLiteIndexStore(
+            "unique_keys", self.settings, self.store_config, unique=True
+        )
+        self.searchable_keys = SQLiteIndexStore(
+            "searchable_keys", self.settings, self.store_config
+        )
+
+        if len(self.unique_keys) == 0 and len(self.data) > 0:
+            # a database written before the index tables existed
+            for obj in self.data.values():
+                self._set_keys(
+                    self.settings.store_key.with_obj(obj),
+                    self.settings.unique_keys.with_obj(obj),
+                    self.settings.searchable_keys.with_obj(obj),
+                )
+
+    def _set_keys(
+        self,
+        store_query_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        uid = store_query_key.value
+        self.unique_keys.add(uid, unique_query_keys.all)
+        self.searchable_keys.add(uid, searchable_query_keys.all)
+
+    def _remove_keys(
+        self,
+        store_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        self.unique_keys.remove(store_key.value)
+        self.searchable_keys.remove(store_key.value)
+
+    def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        self.unique_keys.remove(self.settings.store_key.with_obj(obj).value)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        self.searchable_keys.remove(self.settings.store_key.with_obj(obj).value)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _check_partition_keys_unique(
+        self, unique_query_keys: QueryKeys
+    ) -> UniqueKeyCheck:
+        # dont check the store key
+        qks = [
+            x
+            for x in unique_query_keys.all
+            if x.partition_key != self.settings.store_key
+        ]
+        matches = [qk.key for qk in qks if len(self.unique_keys.find(qk)) > 0]
+
+        if len(matches) == 0:
+            return UniqueKeyCheck.EMPTY
+        elif len(matches) == len(qks):
+            return UniqueKeyCheck.MATCHES
+
+        return UniqueKeyCheck.ERROR
+
+    def _estimate(self, qk: QueryKey, unique: bool) -> int:
+        try:
+            # an indexed count of the matching rows
+            keys = self.unique_keys if unique else self.searchable_keys
+            return keys.count(qk)
+        except Exception:
+            return len(self.data)
+
+    def _find_uids(
+        self,
+        qk: QueryKey,
+        unique: bool,
+        candidates: Optional[Set[UID]] = None,
+    ) -> Result[Optional[Set[UID]], str]:
+        cks = self.unique_cks if unique else self.searchable_cks
+        if qk.key not in [partition_key.key for partition_key in cks]:
+            if unique:
+                return Err(f"Failed to query index with {qk}")
+            return Err(f"Failed to search with {qk}")
+
+        try:
+            keys = self.unique_keys if unique else self.searchable_keys
+            matches = keys.find(qk, candidates=candidates)
+        except Exception as e:
+            return Err(f"Failed to query with {qk}. {e}")
+
+        # a list without any match doesn't restrict the search
+        if qk.type_list and len(matches) == 0:
+            return Ok(None)
+        return Ok(matches)
+
+    def _ordered_page(
+        self,
+        uids: List[UID],
+        order_by: PartitionKey,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Optional[List[UID]]:
+        for unique, cks in ((True, self.unique_cks), (False, self.searchable_cks)):
+            partition_key = next((pk for pk in cks if pk.key == order_by.key), None)
+            if partition_key is None:
+                continue
+            if partition_key.type_list:
+                # a row for each item of the list
+                return None
+            keys = self.unique_keys if unique else self.searchable_keys
+            try:
+                return keys.ordered(order_by.key, uids, limit=limit, offset=offset)
+            except Exception:
+                return None
+        return None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # the data, keys and permissions of the partition share a connection
+        with self.data.transaction():
+            yield
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        with self.data.savepoint():
+            yield
+
     def close(self) -> None:
         self.lock.acquire()
         try:
             self.data._close()
+            self.permissions._close()
             self.unique_keys._close()
             self.searchable_keys._close()
         except BaseException:
@@ -326,6 +1214,7 @@ class SQLiteStorePartition(KeyValueStorePartition):
         self.lock.acquire()
         try:
             self.data._commit()
+            self.permissions._commit()
             self.unique_keys._commit()
             self.searchable_keys._commit()
         except BaseException:
@@ -345,6 +1234,16 @@ class SQLiteDocumentStore(DocumentStore):
 
     partition_type = SQLiteStorePartition
 
+    def snapshot(
+        self, path: Optional[Union[str, Path]] = None
+    ) -> Result[SQLiteStoreSnapshot, str]:
+        return snapshot_database(self.store_config.client_config, path)
+
+    def restore(self, snapshot: SQLiteStoreSnapshot) -> Result[SyftSuccess, str]:
+        res = restore_database(self.store_config.client_config, snapshot)
+        self._clear_caches()
+        return res
+
 
 @serializable()
 class SQLiteStoreClientConfig(StoreClientConfig):
@@ -364,12 +1263,21 @@ class SQLiteStoreClientConfig(StoreClientConfig):
             How many seconds the connection should wait before raising an exception, if the database
             is locked by another connection. If another connection opens a transaction to modify the
             database, it will be locked until that transaction is committed. Default five seconds.
+        `journal_mode`: str
+            The SQLite journal mode. Default WAL, readers don't block the writer and a commit
+            only appends to the write-ahead log.
+        `synchronous`: str
+            When SQLite waits for the writes to reach the disk. Default NORMAL, which only
+            syncs the write-ahead log on checkpoints: the database can't be corrupted but the
+            last transactions might be rolled back after a power loss. FULL syncs every commit.
     """
 
     filename: Optional[str] = None
     path: Union[str, Path] = Field(default_factory=tempfile.gettempdir)
     check_same_thread: bool = True
     timeout: int = 5
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
 
     # We need this in addition to Field(default_factory=...)
     # so users can still do SQLiteStoreClientConfig(path=None)
@@ -402,9 +1310,14 @@ class SQLiteStoreConfig(StoreConfig):
                 * FileLockingConfig: file based locking, ideal for same-device different-processes/threads stores.
                 * RedisLockingConfig: Redis-based locking, ideal for multi-device stores.
             Defaults to FileLockingConfig.
+        cache_config: Optional[CacheConfig]
+            The config of the cache of the deserialized objects of each partition,
+            it is cleared when another connection writes to the table.
+            Defaults to None, no cache.
     """
 
     client_config: SQLiteStoreClientConfig
     store_type: Type[DocumentStore] = SQLiteDocumentStore
     backing_store: Type[KeyValueBackingStore] = SQLiteBackingStore
     locking_config: LockingConfig = FileLockingConfig()
+    cache_config: Optional[CacheConfig] = None
@@ -1,18 +1,18 @@
 # stdlib
 from datetime import datetime
+import struct
 from typing import Optional
 
 # third party
 from typing_extensions import Self
 
 # relative
-from ..serde.serializable import serializable
+from ..serde.recursive import recursive_serde_register
 from .syft_object import SYFT_OBJECT_VERSION_1
 from .syft_object import SyftObject
 from .uid import UID
 
 
-@serializable()
 class DateTime(SyftObject):
     __canonical_name__ = "DateTime"
     __version__ = SYFT_OBJECT_VERSION_1
@@ -39,3 +39,25 @@ class DateTime(SyftObject):
 
     def __gt__(self, other: Self) -> bool:
         return self.utc_timestamp > other.utc_timestamp
+
+
+def serialize_datetime(x: DateTime) -> bytes:
+    # the float64 timestamp, followed by the id if there is one
+    blob = struct.pack("<d", x.utc_timestamp)
+    return blob if x.id is None else blob + x.id.value.bytes
+
+
+def deserialize_datetime(blob: bytes) -> DateTime:
+    utc_timestamp = struct.unpack("<d", blob[:8])[0]
+    uid = UID(blob[8:]) if len(blob) > 8 else None
+    # the values were validated when the DateTime was created
+    return DateTime.construct(id=uid, utc_timestamp=utc_timestamp)
+
+
+# timestamps sit on most objects, a fixed width codec instead of one field per
+# message keeps them cheap to serialize
+recursive_serde_register(
+    DateTime,
+    serialize=serialize_datetime,
+    deserialize=deserialize_datetime,
+)
@@ -25,6 +25,7 @@ import pandas as pd
 import pydantic
 from pydantic import BaseModel
 from pydantic import EmailStr
+from pydantic import PrivateAttr
 from pydantic.fields import Undefined
 from result import OkErr
 from typeguard import check_type
@@ -206,6 +207,9 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
     ] = {}  # List of attributes names which require a serde override.
     __owner__: str
 
+    # fields kept serialized until their first access, see `lazy_deserialization`
+    _syft_lazy_fields: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     __repr_attrs__: ClassVar[List[str]] = []  # show these in html repr collections
     __attr_custom_repr__: ClassVar[
         List[str]
@@ -312,10 +316,12 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
 
     # allows splatting with **
     def keys(self) -> KeysView[str]:
+        self._syft_load_lazy_fields()
         return self.__dict__.keys()
 
     # allows splatting with **
     def __getitem__(self, key: str) -> Any:
+        self._syft_load_lazy_fields()
         return self.__dict__.__getitem__(key)
 
     def _upgrade_version(self, latest: bool = True) -> "SyftObject":
@@ -415,6 +421,87 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
         self._syft_set_validate_private_attrs_(**kwargs)
         self.__post_init__()
 
+    @classmethod
+    def _syft_supports_lazy_fields(cls) -> bool:
+        # classes which intercept attribute access or validate assignments see
+        # fields missing from __dict__
+        return (
+            cls.__getattribute__ is object.__getattribute__
+            and cls.__getattr__ is SyftObject.__getattr__
+            and not cls.__config__.validate_assignment
+        )
+
+    @classmethod
+    def _syft_lazy_construct(
+        cls, values: Dict[str, Any], lazy_fields: Dict[str, Any]
+    ) -> "SyftObject":
+        # like BaseModel.construct, the stored values were validated when set
+        for name, field in cls.__fields__.items():
+            if name not in values and name not in lazy_fields and not field.required:
+                values[name] = field.get_default()
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "__dict__", values)
+        object.__setattr__(obj, "__fields_set__", set(values) | set(lazy_fields))
+        obj._init_private_attributes()
+        object.__setattr__(obj, "_syft_lazy_fields", lazy_fields)
+        obj.__post_init__()
+        return obj
+
+    def _syft_pending_lazy_fields(self) -> Optional[Dict[str, Any]]:
+        try:
+            return object.__getattribute__(self, "_syft_lazy_fields")
+        except AttributeError:
+            return None
+
+    def _syft_load_lazy_field(self, name: str, lazy_fields: Dict[str, Any]) -> Any:
+        value = lazy_fields[name].load()
+        # an attribute set in the meantime wins over the stored one
+        value = self.__dict__.setdefault(name, value)
+        lazy_fields.pop(name, None)
+        return value
+
+    def _syft_load_lazy_fields(self) -> None:
+        lazy_fields = self._syft_pending_lazy_fields()
+        if lazy_fields:
+            for name in list(lazy_fields.keys()):
+                if name in lazy_fields:
+                    self._syft_load_lazy_field(name, lazy_fields)
+            object.__setattr__(self, "_syft_lazy_fields", None)
+
+    def _syft_shallow_copy(self) -> "SyftObject":
+        """A copy whose fields can be set without changing this object, the values
+        of the fields are shared. Unlike copy(), the lazy fields stay lazy."""
+        values = dict(object.__getattribute__(self, "__dict__"))
+        clone = self._copy_and_set_values(values, set(self.__fields_set__), deep=False)
+        lazy_fields = self._syft_pending_lazy_fields()
+        object.__setattr__(
+            clone, "_syft_lazy_fields", None if not lazy_fields else dict(lazy_fields)
+        )
+        return clone
+
+    def __getattr__(self, name: str) -> Any:
+        # only called when the normal lookup fails, e.g. for lazy fields
+        lazy_fields = self._syft_pending_lazy_fields()
+        if lazy_fields is not None:
+            try:
+                return self._syft_load_lazy_field(name, lazy_fields)
+            except KeyError:
+                # loaded by another thread
+                if name in self.__dict__:
+                    return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        # dict(), copy(), json() and == read __dict__ directly
+        self._syft_load_lazy_fields()
+        return super()._iter(*args, **kwargs)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._syft_load_lazy_fields()
+        return super().__getstate__()
+
     # TODO: Check why Pydantic is removing the __hash__ method during inheritance
     def __hash__(self) -> int:
         return int.from_bytes(self.__sha256__(), byteorder="big")
@@ -1,3 +1,17 @@
+# stdlib
+from io import BytesIO
+
+# syft absolute
+import syft as sy
+from syft.client import client as client_module
+from syft.client.api import SyftAPICall
+from syft.client.client import HTTPConnection
+from syft.serde.stream import STREAM_MEDIA_TYPE
+from syft.serde.stream import deserialize_frames
+from syft.serde.stream import iter_serialized
+from syft.serde.stream import read_buffer_frames
+
+
 def test_client_logged_in_user(worker):
     guest_client = worker.guest_client
     assert guest_client.logged_in_user == ""
@@ -12,3 +26,50 @@ def test_client_logged_in_user(worker):
     guest_client.login(email="sheldon@caltech.edu", password="bazinga")
 
     assert guest_client.logged_in_user == "sheldon@caltech.edu"
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, content_type: str) -> None:
+        self.status_code = 200
+        self.headers = {"content-type": content_type}
+        self.content = content
+        self.raw = BytesIO(content)
+
+
+def test_http_connection_negotiates_streamed_calls(worker, monkeypatch):
+    sent = []
+
+    def post(url, data, headers, stream):
+        # a node which reads streamed calls answers with a stream when accepted
+        sent.append(headers["Content-Type"])
+        if headers["Content-Type"] == STREAM_MEDIA_TYPE:
+            call = deserialize_frames(read_buffer_frames(b"".join(data)))
+        else:
+            call = sy.deserialize(data, from_bytes=True)
+        result = worker.handle_api_call(call)
+        if reads_streams and STREAM_MEDIA_TYPE in headers["Accept"]:
+            body = b"".join(bytes(chunk) for chunk in iter_serialized(result))
+            return FakeResponse(body, STREAM_MEDIA_TYPE)
+        return FakeResponse(
+            sy.serialize(result, to_bytes=True), "application/octet-stream"
+        )
+
+    monkeypatch.setattr(client_module.requests, "post", post)
+    api_call = SyftAPICall(node_uid=worker.id, path="metadata", args=[], kwargs={})
+    signed_call = api_call.sign(worker.signing_key)
+
+    # the first call is sent as bytes, the later ones are streamed
+    reads_streams = True
+    connection = HTTPConnection(url="http://localhost:8080")
+    for _ in range(2):
+        result = connection.make_call(signed_call).message.data
+        assert result.id == worker.id
+    assert sent == ["application/octet-stream", STREAM_MEDIA_TYPE]
+
+    # nodes which don't read streamed calls keep getting bytes
+    sent.clear()
+    reads_streams = False
+    connection = HTTPConnection(url="http://localhost:8080")
+    for _ in range(2):
+        assert connection.make_call(signed_call).message.data.id == worker.id
+    assert sent == ["application/octet-stream"] * 2
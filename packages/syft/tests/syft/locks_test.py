@@ -5,7 +5,10 @@ import random
 import string
 import sys
 import tempfile
+import threading
+from threading import Barrier
 from threading import Thread
+from threading import Timer
 import time
 
 # third party
@@ -16,6 +19,7 @@ from pytest_mock_resources import create_redis_fixture
 
 # syft absolute
 from syft.store.locks import FileLockingConfig
+from syft.store.locks import LockWatchdog
 from syft.store.locks import LockingConfig
 from syft.store.locks import NoLockingConfig
 from syft.store.locks import RedisLockingConfig
@@ -345,6 +349,218 @@ def test_acquire_same_name_diff_namespace(config: LockingConfig):
     lock1.release()
 
 
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
+    ],
+)
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl is not available on Windows")
+def test_acquire_wakes_up_on_release(config: LockingConfig):
+    config.timeout = 5
+    config.expire = 10
+    config.retry_interval = 3
+    lock = SyftLock(config)
+
+    assert lock.acquire(blocking=True)
+    releaser = Timer(0.2, lock.release)
+    releaser.start()
+
+    start = time.monotonic()
+    assert lock.acquire(blocking=True)
+    waited = time.monotonic() - start
+    lock.release()
+    releaser.join()
+
+    # woken up by the release, not after `retry_interval`
+    assert waited < config.retry_interval
+    assert lock.metrics["acquisitions"] == 2
+    assert lock.metrics["timeouts"] == 0
+    assert lock.metrics["max_wait_time"] >= 0.1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl is not available on Windows")
+def test_file_lock_wakes_up_other_instance(locks_file_config: LockingConfig):
+    locks_file_config.timeout = 5
+    locks_file_config.retry_interval = 3
+    lock1 = SyftLock(locks_file_config)
+    lock2 = SyftLock(locks_file_config)
+
+    assert lock1.acquire(blocking=True)
+    assert not lock2.acquire(blocking=False)
+
+    releaser = Timer(0.2, lock1.release)
+    releaser.start()
+
+    start = time.monotonic()
+    assert lock2.acquire(blocking=True)
+    waited = time.monotonic() - start
+    lock2.release()
+    releaser.join()
+
+    assert waited < locks_file_config.retry_interval
+    assert not lock1.locked()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl is not available on Windows")
+def test_file_lock_timeout(locks_file_config: LockingConfig):
+    locks_file_config.timeout = 1
+    lock1 = SyftLock(locks_file_config)
+    lock2 = SyftLock(locks_file_config)
+
+    assert lock1.acquire(blocking=True)
+    assert not lock2.acquire(blocking=True)
+    lock1.release()
+
+    # the abandoned wait does not keep the lock
+    assert lock2.acquire(blocking=True)
+    lock2.release()
+    assert lock2.metrics["timeouts"] == 1
+    assert lock2.metrics["acquisitions"] == 1
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
+        pytest.lazy_fixture("locks_redis_config"),
+    ],
+)
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="pytest_mock_resources + docker issues on Windows"
+)
+def test_acquire_shared(config: LockingConfig):
+    config.timeout = 5
+    lock = SyftLock(config)
+
+    # the shared holds of several threads coexist
+    barrier = Barrier(2, timeout=5)
+    results = []
+
+    def _read() -> None:
+        acquired = lock.acquire_shared()
+        try:
+            barrier.wait()
+            results.append(acquired)
+        finally:
+            lock.release_shared()
+
+    threads = [Thread(target=_read) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True, True]
+
+    # and exclude the exclusive ones
+    assert lock.acquire_shared(blocking=False)
+    assert lock.locked()
+    assert not lock.acquire(blocking=False)
+    lock.release_shared()
+
+    assert lock.acquire(blocking=False)
+    assert not lock.acquire_shared(blocking=False)
+    lock.release()
+    assert not lock.locked()
+
+
+def test_acquire_shared_writer_first(locks_threading_config: LockingConfig):
+    locks_threading_config.timeout = 5
+    lock = SyftLock(locks_threading_config)
+    assert lock.acquire_shared()
+
+    writer = Thread(target=lambda: lock.acquire() and lock.release())
+    writer.start()
+    time.sleep(0.2)
+
+    # a waiting writer holds back the new readers
+    results = []
+    reader = Thread(target=lambda: results.append(lock.acquire_shared(blocking=False)))
+    reader.start()
+    reader.join()
+    assert results == [False]
+    # but not the threads already holding the lock shared
+    assert lock.acquire_shared(blocking=False)
+    lock.release_shared()
+    lock.release_shared()
+    writer.join()
+
+    assert lock.acquire_shared(blocking=False)
+    lock.release_shared()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
+    ],
+)
+def test_lock_holders(config: LockingConfig):
+    config.timeout = 5
+    lock = SyftLock(config)
+    assert lock.holders() == []
+
+    assert lock.acquire(operation="set")
+    (holder,) = lock.holders(include_stacks=True)
+    assert holder.thread_id == threading.get_ident()
+    assert holder.operation == "set"
+    assert not holder.shared
+    assert "test_lock_holders" in holder.stack
+
+    # a second thread finds the lock held
+    holders = []
+
+    def _read() -> None:
+        assert lock.acquire_shared(operation="get")
+        holders.extend(lock.report().holders)
+        lock.release_shared()
+
+    reader = Thread(target=_read)
+    reader.start()
+    time.sleep(0.2)
+    lock.release()
+    reader.join()
+
+    (holder,) = holders
+    assert holder.shared
+    assert holder.operation == "get"
+    assert holder.thread_id == reader.ident
+    assert lock.holders() == []
+
+    metrics = lock.metrics
+    assert metrics["acquisitions"] == 1
+    assert metrics["shared_acquisitions"] == 1
+    assert metrics["contended"] == 1
+    assert metrics["holds"] == 2
+    assert metrics["max_hold_time"] >= 0.1
+    assert metrics["max_wait_time"] >= 0.1
+
+
+def test_lock_watchdog(locks_threading_config: LockingConfig):
+    locks_threading_config.timeout = 0.1
+    locks_threading_config.expire = 10
+    lock = SyftLock(locks_threading_config)
+    watchdog = LockWatchdog()
+
+    assert lock.acquire(operation="update")
+    assert lock.overdue_holders() == []
+    time.sleep(0.2)
+
+    (holder,) = lock.overdue_holders()
+    assert holder.operation == "update"
+    reports = [
+        report for report in watchdog.check() if report.lock_name == lock.lock_name
+    ]
+    assert len(reports) == 1
+    assert reports[0].holders[0].stack is not None
+
+    lock.release()
+    assert lock.overdue_holders() == []
+
+
 @pytest.mark.skip(reason="The tests are highly flaky, delaying progress on PR's")
 @pytest.mark.parametrize(
     "config",
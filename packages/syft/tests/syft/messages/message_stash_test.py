@@ -409,13 +409,14 @@ def test_messagestash_delete_all_for_verify_key_error_on_delete_by_uid(
         root_verify_key, test_stash, test_verify_key, random_verify_key
     )
 
-    def mock_delete_by_uid(root_verify_key, uid=mock_message.id) -> Err:
+    def mock_delete_many_by_uid(root_verify_key, uids=None) -> Err:
+        uids = [mock_message.id] if uids is None else uids
         return Err(None)
 
     monkeypatch.setattr(
         test_stash,
-        "delete_by_uid",
-        mock_delete_by_uid,
+        "delete_many_by_uid",
+        mock_delete_many_by_uid,
     )
 
     response = test_stash.delete_all_for_verify_key(
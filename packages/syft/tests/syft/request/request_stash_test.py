@@ -117,6 +117,8 @@ def test_requeststash_get_all_for_verify_key_find_index_fail(
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: Optional[PartitionKey],
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Err:
         return Err(mock_error_message)
 
@@ -0,0 +1,58 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import numpyutf8toarray
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array(["a", "bc", "", "def"]),
+        np.array([["héllo", "wörld"], ["😀", "ascii"]]),
+        np.array([b"ab", b"", b"\x00c"]),
+        np.array([], dtype="S3"),
+        np.array(["x", "yy", None], dtype=object),
+        np.array("scalar"),
+        np.array([], dtype="U3"),
+        np.array(["ab", "cde"] * 6).reshape(2, 3, 2),
+    ],
+)
+def test_string_array_roundtrip(array: np.ndarray) -> None:
+    result = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert (result == array).all()
+
+
+def test_string_array_real_size() -> None:
+    array = np.array([f"word{i}" for i in range(10_000)], dtype="U32")
+    blob = sy.serialize(array, to_bytes=True)
+
+    # offsets and utf-8 data instead of fixed width UCS4 characters
+    assert len(blob) < array.nbytes // 4
+
+
+def test_string_array_legacy_format() -> None:
+    # "ab", "c" as utf-8 bytes, end offsets, offset count, shape, shape length
+    legacy = np.array([97, 98, 99, 2, 3, 2, 2, 1], dtype=np.uint64)
+
+    assert (numpyutf8toarray(legacy) == np.array(["ab", "c"])).all()
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array(["2020-01-01", "2021-02-03T04:05", "NaT"], dtype="datetime64[s]"),
+        np.array([[1, 2], [3, 4]], dtype="timedelta64[ms]").T,
+        np.array([], dtype="datetime64[ns]"),
+    ],
+)
+def test_temporal_array_roundtrip(array: np.ndarray) -> None:
+    result = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+
+    assert result.dtype == array.dtype
+    assert (result.view(np.int64) == array.view(np.int64)).all()
@@ -0,0 +1,86 @@
+# third party
+import numpy as np
+import pyarrow as pa
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import arrow_deserialize
+from syft.serde.arrow import numpy_serialize
+from syft.serde.compression import CompressionPolicy
+from syft.serde.compression import CompressionTransport
+from syft.serde.compression import compression_transport
+from syft.util.experimental_flags import ApacheArrowCompression
+from syft.util.experimental_flags import flags
+
+
+def payload_codec(array: np.ndarray) -> str:
+    # the header of the payload records the codec
+    return sy.deserialize(numpy_serialize(array), from_bytes=True)[3]
+
+
+def test_compressible_payload() -> None:
+    assert payload_codec(np.zeros(100_000)) == "ZSTD"
+
+
+def test_small_payload_not_compressed() -> None:
+    assert payload_codec(np.zeros(10)) == "NONE"
+
+
+def test_noise_not_compressed() -> None:
+    assert payload_codec(np.random.rand(100_000)) == "NONE"
+
+
+@pytest.mark.parametrize(
+    "transport,codec",
+    [
+        (CompressionTransport.PYTHON, "NONE"),
+        (CompressionTransport.HTTP, "ZSTD"),
+        (CompressionTransport.SQLITE, "ZSTD"),
+    ],
+)
+def test_transport_policies(transport: CompressionTransport, codec: str) -> None:
+    array = np.zeros(100_000)
+    with compression_transport(transport):
+        assert payload_codec(array) == codec
+        result = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+    assert (result == array).all()
+
+
+def test_global_flag_disables_compression() -> None:
+    flags.APACHE_ARROW_COMPRESSION = ApacheArrowCompression.NONE
+    try:
+        assert payload_codec(np.zeros(100_000)) == "NONE"
+    finally:
+        flags.APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+
+
+def test_dtype_codecs() -> None:
+    policy = CompressionPolicy(dtype_codecs={"i": ApacheArrowCompression.LZ4})
+    data = np.zeros(100_000, dtype=np.int64).tobytes()
+
+    _, codec = policy.compress(data, np.dtype(np.int64))
+    assert codec is ApacheArrowCompression.LZ4
+    _, codec = policy.compress(data, np.dtype(np.float64))
+    assert codec is ApacheArrowCompression.ZSTD
+
+
+def test_legacy_payload() -> None:
+    # payloads without a codec in the header use the global flag
+    array = np.arange(1000)
+    sink = pa.BufferOutputStream()
+    pa.ipc.write_tensor(pa.Tensor.from_numpy(array), sink)
+    buffer = sink.getvalue()
+    numpy_bytes = pa.compress(buffer, asbytes=True, codec="zstd")
+
+    result = arrow_deserialize(numpy_bytes, buffer.size, array.dtype.name)
+    assert (result == array).all()
+
+
+def test_hash_independent_of_transport() -> None:
+    obj = {"zeros": np.zeros(100_000), "values": np.arange(100_000)}
+    serialized = set()
+    for transport in CompressionTransport:
+        with compression_transport(transport):
+            serialized.add(sy.serialize(obj, to_bytes=True, for_hashing=True))
+    assert len(serialized) == 1
@@ -0,0 +1,82 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import LAZY_FIELD_MIN_SIZE
+from syft.serde.recursive import lazy_deserialization
+from syft.serde.recursive_primitives import iterable_schema
+from syft.service.response import SyftError
+from syft.service.user.user import User
+from syft.types.uid import UID
+
+
+def roundtrip(obj, **kwargs):
+    blob = sy.serialize(obj, to_bytes=True, **kwargs)
+    return sy.deserialize(blob, from_bytes=True, **kwargs)
+
+
+def batch_fqn(obj) -> str:
+    # the fully qualified name of the batched elements, empty if not batched
+    proto = sy.serialize(obj)
+    with iterable_schema.from_bytes(b"".join(proto.nonrecursiveBlob)) as msg:
+        return msg.fullyQualifiedName
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        [UID(), UID(), UID()],
+        ("a", "b"),
+        {1, 2, 3},
+        [[1], [2, 3]],
+        [SyftError(message="a"), SyftError(message="b")],
+        [User(email="a@openmined.org"), User(email="b@openmined.org", name="b")],
+    ],
+)
+def test_batch_roundtrip(obj) -> None:
+    assert batch_fqn(obj) != ""
+
+    result = roundtrip(obj)
+    assert type(result) is type(obj)
+    assert result == obj
+
+
+@pytest.mark.parametrize("obj", [[1, "a", None], [UID()], [True, 1], [int, str]])
+def test_not_batched(obj) -> None:
+    assert batch_fqn(obj) == ""
+    assert roundtrip(obj) == obj
+
+
+def test_batch_is_smaller() -> None:
+    uids = [UID() for _ in range(100)]
+    blob = sy.serialize(uids, to_bytes=True)
+
+    assert len(blob) < sum(len(sy.serialize(uid, to_bytes=True)) for uid in uids) / 2
+
+
+def test_batch_with_oob_buffers() -> None:
+    arrays = [np.random.rand(10_000), np.random.rand(10_000)]
+    buffers = []
+
+    result = roundtrip(arrays, buffers=buffers)
+    assert len(buffers) == 2
+    assert all((a == b).all() for a, b in zip(result, arrays))
+
+
+def test_batch_with_lazy_fields() -> None:
+    users = [
+        User(email=f"{i}@openmined.org", name="x" * LAZY_FIELD_MIN_SIZE)
+        for i in range(3)
+    ]
+    with lazy_deserialization():
+        lazy_users = [
+            sy.deserialize(sy.serialize(user, to_bytes=True), from_bytes=True)
+            for user in users
+        ]
+
+    # the fields which were never accessed are written back unchanged
+    result = roundtrip(lazy_users)
+    assert all("name" in user._syft_lazy_fields for user in lazy_users)
+    assert result == users
@@ -0,0 +1,75 @@
+# third party
+import numpy as np
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import LAZY_FIELD_MIN_SIZE
+from syft.serde.recursive import lazy_deserialization
+from syft.service.user.user import User
+
+
+def lazy_roundtrip(obj, **kwargs):
+    blob = sy.serialize(obj, to_bytes=True, **kwargs)
+    with lazy_deserialization():
+        return sy.deserialize(blob, from_bytes=True), blob
+
+
+def test_lazy_fields_decoded_on_access() -> None:
+    user = User(email="info@openmined.org", name="x" * LAZY_FIELD_MIN_SIZE)
+    result, _ = lazy_roundtrip(user)
+
+    # small fields are decoded eagerly
+    assert set(result._syft_lazy_fields) == {"name"}
+    assert result.email == user.email
+    assert "name" not in result.__dict__
+
+    assert result.name == user.name
+    assert result._syft_lazy_fields == {}
+
+
+def test_lazy_fields_written_back_unchanged() -> None:
+    user = User(email="info@openmined.org", name="x" * LAZY_FIELD_MIN_SIZE)
+    result, blob = lazy_roundtrip(user)
+
+    assert sy.serialize(result, to_bytes=True) == blob
+    assert "name" in result._syft_lazy_fields
+
+
+def test_lazy_fields_set_before_access() -> None:
+    user = User(email="info@openmined.org", name="x" * LAZY_FIELD_MIN_SIZE)
+    result, _ = lazy_roundtrip(user)
+
+    result.name = "new"
+    assert result.name == "new"
+    assert result.dict()["name"] == "new"
+    assert (
+        sy.deserialize(sy.serialize(result, to_bytes=True), from_bytes=True).name
+        == "new"
+    )
+
+
+def test_lazy_fields_materialized() -> None:
+    user = User(email="info@openmined.org", name="x" * LAZY_FIELD_MIN_SIZE)
+    result, _ = lazy_roundtrip(user)
+
+    assert result == user
+    assert result._syft_lazy_fields is None
+    assert result.__dict__["name"] == user.name
+
+
+def test_lazy_fields_with_oob_buffers() -> None:
+    user = User(email="info@openmined.org", name="x" * 2**16)
+    buffers = []
+    blob = sy.serialize(user, to_bytes=True, buffers=buffers)
+
+    with lazy_deserialization():
+        result = sy.deserialize(blob, from_bytes=True, buffers=buffers)
+    assert "name" in result._syft_lazy_fields
+    assert result.name == user.name
+
+
+def test_action_object_not_lazy() -> None:
+    action_object = sy.ActionObject.from_obj(np.random.rand(128, 128))
+    result, _ = lazy_roundtrip(action_object)
+
+    assert (result.syft_action_data == action_object.syft_action_data).all()
@@ -0,0 +1,70 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import OOB_BUFFER_MIN_SIZE
+
+
+def test_oob_buffers_roundtrip() -> None:
+    array = np.random.rand(256, 256)
+    payload = b"x" * OOB_BUFFER_MIN_SIZE
+    obj = {"nested": [array, payload], "small": b"abc"}
+
+    buffers = []
+    blob = sy.serialize(obj, to_bytes=True, buffers=buffers)
+
+    # only the large payloads are moved out-of-band
+    assert len(buffers) == 2
+    assert all(isinstance(buffer, memoryview) for buffer in buffers)
+    assert len(blob) < OOB_BUFFER_MIN_SIZE
+    assert len(blob) + sum(len(b) for b in buffers) <= len(
+        sy.serialize(obj, to_bytes=True)
+    )
+
+    result = sy.deserialize(blob, from_bytes=True, buffers=buffers)
+    assert (result["nested"][0] == array).all()
+    assert result["nested"][1] == payload
+    assert result["small"] == b"abc"
+
+
+def test_oob_buffers_action_object() -> None:
+    array = np.random.rand(256, 256)
+    action_object = sy.ActionObject.from_obj(array)
+
+    buffers = []
+    blob = sy.serialize(action_object, to_bytes=True, buffers=buffers)
+    assert len(buffers) == 1
+
+    result = sy.deserialize(blob, from_bytes=True, buffers=buffers)
+    assert (result.syft_action_data == array).all()
+
+
+def test_oob_buffers_small_payloads_inline() -> None:
+    obj = [1, "two", b"three", np.arange(10)]
+
+    buffers = []
+    blob = sy.serialize(obj, to_bytes=True, buffers=buffers)
+
+    assert buffers == []
+    assert blob == sy.serialize(obj, to_bytes=True)
+
+
+def test_oob_buffers_missing() -> None:
+    buffers = []
+    blob = sy.serialize(b"x" * OOB_BUFFER_MIN_SIZE, to_bytes=True, buffers=buffers)
+
+    with pytest.raises(Exception):
+        sy.deserialize(blob, from_bytes=True)
+
+
+def test_oob_buffers_not_used_for_hashing() -> None:
+    obj = {"data": b"x" * OOB_BUFFER_MIN_SIZE}
+
+    inline = sy.serialize(obj, to_bytes=True, for_hashing=True)
+    buffers = []
+    blob = sy.serialize(obj, to_bytes=True, for_hashing=True, buffers=buffers)
+
+    assert buffers == []
+    assert blob == inline
@@ -0,0 +1,104 @@
+# stdlib
+import asyncio
+from io import BytesIO
+import socket
+import threading
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import combine_bytes
+from syft.serde.stream import STREAM_CHUNK_SIZE
+from syft.serde.stream import async_read_frames
+from syft.serde.stream import deserialize_frames
+from syft.serde.stream import iter_serialized
+
+
+def test_stream_roundtrip() -> None:
+    array = np.random.rand(512, 512)
+    obj = {"array": array, "bytes": b"x" * 100_000, "text": "abc"}
+
+    stream = BytesIO()
+    written = sy.serialize(obj, to_stream=stream)
+    assert written == len(stream.getvalue())
+
+    stream.seek(0)
+    result = sy.deserialize(stream, from_stream=True)
+    assert (result["array"] == array).all()
+    assert result["bytes"] == obj["bytes"]
+    assert result["text"] == "abc"
+
+
+def test_stream_chunks_are_bounded() -> None:
+    obj = sy.ActionObject.from_obj(np.random.rand(1024, 512))
+    assert all(len(chunk) <= STREAM_CHUNK_SIZE for chunk in iter_serialized(obj))
+
+
+def test_stream_reads_plain_bytes() -> None:
+    obj = [1, "two", {"three": 3.0}]
+    blob = sy.serialize(obj, to_bytes=True)
+    assert sy.deserialize(BytesIO(blob), from_stream=True) == obj
+
+
+def test_stream_truncated() -> None:
+    stream = BytesIO()
+    sy.serialize(b"x" * 100_000, to_stream=stream)
+
+    with pytest.raises(EOFError):
+        sy.deserialize(BytesIO(stream.getvalue()[:-10]), from_stream=True)
+
+
+def test_stream_file(tmp_path) -> None:
+    array = np.random.rand(512, 512)
+    path = tmp_path / "array.stream"
+    with open(path, "wb") as stream:
+        sy.serialize(array, to_stream=stream)
+
+    # the frames are read from the memory-mapped file
+    result = sy.deserialize(path, from_stream=True)
+    assert (result == array).all()
+
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(EOFError):
+        sy.deserialize(path, from_stream=True)
+
+
+def test_stream_socket() -> None:
+    array = np.random.rand(256, 256)
+    left, right = socket.socketpair()
+
+    def send() -> None:
+        with left.makefile("wb") as stream:
+            sy.serialize(array, to_stream=stream)
+        left.close()
+
+    sender = threading.Thread(target=send)
+    sender.start()
+    with right.makefile("rb") as stream:
+        result = sy.deserialize(stream, from_stream=True)
+    sender.join()
+    right.close()
+
+    assert (result == array).all()
+
+
+def test_stream_async_frames() -> None:
+    array = np.random.rand(256, 256)
+    data = b"".join(bytes(chunk) for chunk in iter_serialized(array))
+
+    async def chunks():
+        # odd sized chunks, like an http body
+        for start in range(0, len(data), 1000):
+            yield data[start : start + 1000]  # noqa: E203
+
+    frames = asyncio.run(async_read_frames(chunks()))
+    assert (deserialize_frames(frames) == array).all()
+
+
+def test_combine_bytes() -> None:
+    assert combine_bytes([b"ab", b"cd", b""]) == b"abcd"
+    assert combine_bytes([b"abcd"]) == b"abcd"
+    assert combine_bytes([]) == b""
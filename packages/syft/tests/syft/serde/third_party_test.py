@@ -0,0 +1,138 @@
+# stdlib
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.third_party import deserialize_datetime
+from syft.serde.third_party import deserialize_series
+
+
+def roundtrip(obj):
+    return sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series(np.arange(10.0)),
+        pd.Series([1, 2, None], index=["x", "y", "z"], name=("t", 1), dtype="Int64"),
+        pd.Series(pd.date_range("2020-01-01", periods=3, tz="UTC"), name="when"),
+        pd.Series(["a", "b", "a"], dtype="category", name=0),
+    ],
+)
+def test_series_roundtrip(series: pd.Series) -> None:
+    result = roundtrip(series)
+
+    assert result.name == series.name
+    assert result.dtype == series.dtype
+    pd.testing.assert_series_equal(result, series)
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.RangeIndex(5),
+        pd.Index(["a", "b"], name="name"),
+        pd.Index([1.5, 2.5]),
+        pd.MultiIndex.from_product([[1, 2], ["x", "y"]], names=["a", "b"]),
+        pd.DatetimeIndex(["2020-01-01", "2020-01-02"]),
+        pd.CategoricalIndex(["a", "b", "a"]),
+    ],
+)
+def test_index_roundtrip(index: pd.Index) -> None:
+    result = roundtrip(index)
+
+    assert type(result) == type(index)
+    pd.testing.assert_index_equal(result, index)
+
+
+def test_categorical_roundtrip() -> None:
+    categorical = pd.Categorical(["a", "b", "a"], categories=["b", "a"], ordered=True)
+    result = roundtrip(categorical)
+
+    assert isinstance(result, pd.Categorical)
+    assert result.ordered
+    assert result.equals(categorical)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        pd.Series([1, "a"]),
+        pd.Series([1, "a", None], index=[2, "b", 3.5], name="mixed"),
+        pd.Series([1, "a", 1], dtype="category"),
+        pd.Index([1, "a"], name="mixed"),
+        pd.MultiIndex.from_tuples([(1, "a"), ("b", 2)], names=["x", "y"]),
+    ],
+)
+def test_mixed_type_roundtrip(obj) -> None:
+    # arrow can't convert mixed type objects, they are serialized as values
+    result = roundtrip(obj)
+
+    if isinstance(obj, pd.Series):
+        pd.testing.assert_series_equal(result, obj)
+    else:
+        pd.testing.assert_index_equal(result, obj)
+
+
+def test_series_legacy_format() -> None:
+    series = pd.Series([1, 2, 3], name="legacy")
+    blob = sy.serialize(pd.DataFrame(series).to_dict(), to_bytes=True)
+
+    pd.testing.assert_series_equal(deserialize_series(blob), series)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2023, 5, 6, 7, 8, 9, 123456),
+        datetime(1900, 1, 1, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+        datetime.max.replace(tzinfo=timezone.utc),
+        datetime.min,
+        date(1, 1, 1),
+        date(2023, 5, 6),
+        time(23, 59, 59, 999999),
+        time(1, 2, tzinfo=timezone(timedelta(hours=2))),
+    ],
+)
+def test_temporal_roundtrip(value) -> None:
+    result = roundtrip(value)
+
+    assert type(result) is type(value)
+    assert result == value
+    assert getattr(result, "tzinfo", None) == getattr(value, "tzinfo", None)
+
+
+def test_temporal_fixed_width() -> None:
+    naive = sy.serialize(datetime(2023, 5, 6), to_bytes=True)
+    aware = sy.serialize(datetime(2023, 5, 6, tzinfo=timezone.utc), to_bytes=True)
+
+    assert len(aware) - len(naive) == 8
+
+
+def test_datetime_legacy_format() -> None:
+    blob = sy.serialize("2023-05-06T07:08:09.123456+02:00", to_bytes=True)
+
+    assert deserialize_datetime(blob) == datetime(
+        2023, 5, 6, 7, 8, 9, 123456, tzinfo=timezone(timedelta(hours=2))
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [np.datetime64("2020-01-01T01:02:03", "s"), np.timedelta64(5, "D")],
+)
+def test_numpy_temporal_scalar_roundtrip(value) -> None:
+    result = roundtrip(value)
+
+    assert result.dtype == value.dtype
+    assert result == value
@@ -8,7 +8,12 @@ from pydantic import BaseModel
 
 # syft absolute
 import syft as sy
+from syft.serde.recursive import CODEC_BANK
+from syft.serde.recursive import _CLASS_BY_FQN
+from syft.serde.recursive import _CODEC_BY_CLASS
+from syft.serde.recursive import recursive_serde_register
 from syft.serde.serializable import serializable
+from syft.types.datetime import DateTime
 
 
 def get_fqn_for_class(cls):
@@ -306,3 +311,66 @@ def test_pydantic_derived_only():
     assert (data.uid, data.value, data.flag) != (de.uid, de.value, de.flag)
     assert (de.uid, de.value, de.flag) == (None, None, None)
     assert (data.source, data.target) == (de.source, de.target)
+
+
+# ------------------------------ Codecs ------------------------------
+
+
+def test_codec_fields_are_precompiled():
+    codec = CODEC_BANK[get_fqn_for_class(DerivedWithoutAttrs)]
+
+    assert [name for name, _ in codec.fields] == ["status", "value"]
+    assert codec.fields_for(DerivedWithoutAttrs("a", 1, 2), False) is codec.fields
+
+
+def test_codec_class_resolution_is_cached():
+    data = Derived(uid=str(time()), value=2, status=1)
+    fqn = get_fqn_for_class(Derived)
+
+    sy.deserialize(sy.serialize(data, to_bytes=True), from_bytes=True)
+    assert _CLASS_BY_FQN[fqn] is Derived
+    assert _CODEC_BY_CLASS[Derived] is CODEC_BANK[fqn]
+
+
+def test_codec_reregister():
+    @serializable(attrs=["uid"])
+    class Reregistered(AbstractBase):
+        def __init__(self, uid: str) -> None:
+            self.uid = uid
+
+    sy.serialize(Reregistered("a"), to_bytes=True)
+
+    serializable(attrs=["uid", "value"])(Reregistered)
+    data = Reregistered("a")
+    data.value = 1
+
+    de = sy.deserialize(sy.serialize(data, to_bytes=True), from_bytes=True)
+    assert (de.uid, de.value) == ("a", 1)
+
+
+def test_nonrecursive_codec_reads_fields():
+    @serializable(attrs=["uid"])
+    class Recoded(AbstractBase):
+        def __init__(self, uid: str) -> None:
+            self.uid = uid
+
+    blob = sy.serialize(Recoded("a"), to_bytes=True)
+
+    # blobs written field by field stay readable with a nonrecursive codec
+    recursive_serde_register(
+        Recoded,
+        serialize=lambda x: x.uid.encode(),
+        deserialize=lambda x: Recoded(x.decode()),
+    )
+    assert sy.deserialize(blob, from_bytes=True).uid == "a"
+    assert sy.deserialize(sy.serialize(Recoded("b")), from_bytes=False).uid == "b"
+
+
+def test_datetime_fixed_width():
+    timestamp = DateTime.now()
+    blob = sy.serialize(timestamp, to_bytes=True)
+
+    de = sy.deserialize(blob, from_bytes=True)
+    assert de == timestamp
+    assert de.id is None
+    assert len(blob) < 128
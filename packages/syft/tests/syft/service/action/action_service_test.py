@@ -1,10 +1,22 @@
 # stdlib
+import os
+import time
 
 # third party
+import numpy as np
 
 # syft absolute
+from syft.serde.stream import iter_serialized
 from syft.service.action.action_object import ActionObject
+from syft.service.action.action_upload import ChunkedUploads
+from syft.service.action.action_upload import chunk_digest
+from syft.service.action.action_upload import iter_chunks
+from syft.service.action.action_upload import upload_action_object
 from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftError
+from syft.service.response import SyftSuccess
+from syft.types.twin_object import TwinObject
+from syft.types.uid import UID
 
 # TODO: Improve ActionService testing
 
@@ -23,3 +35,111 @@ def test_action_service_sanity(worker):
     assert len(service.store.data) == 1
     res = pointer.capitalize()
     assert res[0] == "A"
+
+
+def test_iter_chunks():
+    parts = [b"abcd", memoryview(b"e"), b"", b"fghijkl"]
+    chunks = list(iter_chunks(parts, chunk_size=3))
+    assert chunks == [b"abc", b"def", b"ghi", b"jkl"]
+    assert list(iter_chunks(parts, chunk_size=5)) == [b"abcde", b"fghij", b"kl"]
+
+
+def test_action_service_resume_upload(worker):
+    service = worker.get_service("actionservice")
+    context = get_auth_ctx(worker)
+
+    data = np.random.rand(10_000)
+    obj = ActionObject.from_obj(data)
+    chunks = list(iter_chunks(iter_serialized(obj), chunk_size=16 * 1024))
+    assert len(chunks) > 2
+
+    status = service.upload_init(context, obj.id)
+    assert status.chunks == {}
+    digest = chunk_digest(chunks[0])
+    res = service.upload_chunk(context, obj.id, 0, chunks[0], digest)
+    assert isinstance(res, SyftSuccess)
+    # corrupted chunks are refused
+    res = service.upload_chunk(context, obj.id, 1, chunks[1], digest)
+    assert isinstance(res, SyftError)
+
+    # the interrupted upload is resumed from the chunks received
+    status = service.upload_init(context, obj.id)
+    assert status.chunks == {0: digest}
+    res = service.upload_commit(context, obj.id, len(chunks))
+    assert isinstance(res, SyftError)
+
+    for index, chunk in enumerate(chunks[1:], start=1):
+        res = service.upload_chunk(context, obj.id, index, chunk, chunk_digest(chunk))
+        assert isinstance(res, SyftSuccess)
+    assert service.upload_commit(context, obj.id, len(chunks)).is_ok()
+
+    stored = service.get(context, obj.id).ok()
+    assert np.array_equal(stored.syft_action_data, data)
+    # the chunks are removed once the object is saved
+    assert service.upload_init(context, obj.id).chunks == {}
+
+
+def test_chunked_uploads_max_bytes(tmp_path, worker):
+    credentials = worker.signing_key.verify_key
+    uploads = ChunkedUploads(tmp_path, max_bytes=100)
+    first, second = UID(), UID()
+    assert uploads.start(first, credentials).is_ok()
+    assert uploads.start(second, credentials).is_ok()
+
+    chunk = b"x" * 60
+    assert uploads.append(first, credentials, 0, chunk, chunk_digest(chunk)).is_ok()
+    # the cap holds for all the uploads in progress together
+    res = uploads.append(second, credentials, 0, chunk, chunk_digest(chunk))
+    assert res.is_err()
+    uploads.delete(first)
+    assert uploads.append(second, credentials, 0, chunk, chunk_digest(chunk)).is_ok()
+
+
+def test_chunked_uploads_expiry(tmp_path, worker):
+    credentials = worker.signing_key.verify_key
+    uploads = ChunkedUploads(tmp_path, expiry=60)
+    stale, fresh = UID(), UID()
+    uploads.start(stale, credentials)
+    chunk = b"abc"
+    uploads.append(stale, credentials, 0, chunk, chunk_digest(chunk))
+    past = time.time() - 120
+    os.utime(tmp_path / stale.no_dash, (past, past))
+
+    # starting an upload deletes the ones without a chunk for too long
+    assert uploads.start(fresh, credentials).is_ok()
+    assert not (tmp_path / stale.no_dash).exists()
+    assert uploads.start(stale, credentials).ok().chunks == {}
+
+
+def test_action_service_chunked_upload_client(worker):
+    root_client = worker.root_client
+    private = np.random.rand(10_000)
+    twin = TwinObject(private_obj=private, mock_obj=np.zeros(10_000))
+
+    action = root_client.api.services.action
+    pointer = upload_action_object(action, twin, chunk_size=16 * 1024)
+    assert not isinstance(pointer, SyftError)
+    assert pointer.id == twin.id
+
+    service = worker.get_service("actionservice")
+    stored = service.get(get_auth_ctx(worker), twin.id).ok()
+    assert np.array_equal(stored.syft_action_data, private)
+
+
+def test_action_service_get_slice_client(worker):
+    root_client = worker.root_client
+    data = np.random.rand(1000, 4)
+    pointer = root_client.api.services.action.set(ActionObject.from_obj(data))
+
+    action = root_client.api.services.action
+    part = action.get_slice(pointer.id, slices=(slice(100, 150), slice(1, 3)))
+    assert np.array_equal(part.syft_action_data, data[100:150, 1:3])
+
+    batches = []
+    start = 0
+    while start < len(data):
+        batch = action.get_slice(pointer.id, slices=slice(start, start + 300))
+        batches.append(batch.syft_action_data)
+        start += 300
+    assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+    assert np.array_equal(np.concatenate(batches), data)
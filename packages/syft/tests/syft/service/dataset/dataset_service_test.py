@@ -5,6 +5,7 @@ from uuid import uuid4
 
 # third party
 import numpy as np
+import pandas as pd
 from pydantic import ValidationError
 import pytest
 
@@ -216,3 +217,34 @@ def test_domain_client_cannot_upload_dataset_with_non_mock(worker: Worker) -> No
         root_domain_client.upload_dataset(dataset)
 
     assert _ASSET_WITH_NONE_MOCK_ERROR_MESSAGE in str(excinfo.value)
+
+
+def test_asset_iter_data(worker: Worker) -> None:
+    root_client = worker.root_client
+    private, mock = np.arange(1000), np.zeros(1000)
+    df = pd.DataFrame({"a": np.arange(10), "b": np.arange(10) / 2})
+    dataset = Dataset(
+        name=random_hash(),
+        asset_list=[
+            Asset(name="array", data=private, mock=mock),
+            Asset(name="scalar", data=np.array(5), mock=np.array(0)),
+            Asset(name="frame", data=df, mock=df * 0),
+        ],
+    )
+    root_client.upload_dataset(dataset)
+    array, scalar, frame = root_client.datasets[0].asset_list
+
+    batches = list(array.iter_data(batch_size=300))
+    assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+    assert np.array_equal(np.concatenate(batches), private)
+    batches = list(array.iter_data(batch_size=300, mock=True))
+    assert np.array_equal(np.concatenate(batches), mock)
+    assert np.array_equal(array.get_slice(slice(10, 20), mock=True), mock[10:20])
+    assert np.array_equal(array.get_data(mock=True), mock)
+
+    # a 0-d array is a single batch
+    assert list(scalar.iter_data()) == [5]
+    assert list(scalar.iter_data(mock=True)) == [0]
+
+    batches = list(frame.iter_data(batch_size=4, columns=["b"]))
+    pd.testing.assert_frame_equal(pd.concat(batches), df[["b"]])
@@ -0,0 +1,27 @@
+# syft absolute
+from syft.service.context import AuthedServiceContext
+from syft.service.diagnostics.diagnostics_service import DiagnosticsService
+
+
+def get_auth_ctx(worker):
+    return AuthedServiceContext(node=worker, credentials=worker.signing_key.verify_key)
+
+
+def test_diagnostics_locks(worker):
+    service = worker.get_service(DiagnosticsService)
+    partitions = worker.document_store.partitions
+
+    reports = service.locks(get_auth_ctx(worker))
+    assert {report.lock_name for report in reports} == {
+        partition.lock.lock_name for partition in partitions.values()
+    }
+    assert all(report.holders == [] for report in reports)
+
+    # the users were read and written while setting up the worker
+    (users,) = [report for report in reports if report.lock_name == "User"]
+    assert users.metrics["acquisitions"] > 0
+
+
+def test_diagnostics_locks_client(worker):
+    reports = worker.root_client.api.services.diagnostics.locks()
+    assert len(reports) == len(worker.document_store.partitions)
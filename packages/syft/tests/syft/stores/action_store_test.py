@@ -1,15 +1,28 @@
 # stdlib
+from pathlib import Path
 from typing import Any
 
 # third party
+import numpy as np
+import pandas as pd
 import pytest
 
 # syft absolute
 from syft.node.credentials import SyftVerifyKey
+from syft.service.action.action_object import ActionObject
+from syft.service.action.action_object import TwinMode
 from syft.service.action.action_store import ActionObjectEXECUTE
 from syft.service.action.action_store import ActionObjectOWNER
 from syft.service.action.action_store import ActionObjectREAD
 from syft.service.action.action_store import ActionObjectWRITE
+from syft.service.action.action_store import DictActionStore
+from syft.service.action.action_store import SQLiteActionStore
+from syft.store.blob_storage import BlobFile
+from syft.store.blob_storage import BlobStorageConfig
+from syft.store.dict_document_store import DictStoreConfig
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
+from syft.types.twin_object import TwinObject
 from syft.types.uid import UID
 
 # relative
@@ -137,3 +150,220 @@ def test_action_store_test_data_set_get(store: Any):
     assert res.is_ok()
     res = store.delete(data_uid, client_key)
     assert res.is_err()
+
+
+@pytest.mark.parametrize(
+    "store",
+    [
+        pytest.lazy_fixture("dict_action_store"),
+        pytest.lazy_fixture("sqlite_action_store"),
+    ],
+)
+def test_action_store_snapshot_restore(store: Any):
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+
+    data_uid = UID()
+    obj = MockSyftObject(data=1)
+    assert store.set(data_uid, client_key, obj, has_result_read_permission=True).is_ok()
+
+    res = store.snapshot()
+    assert res.is_ok()
+    snapshot = res.ok()
+
+    assert store.delete(data_uid, client_key).is_ok()
+    assert not store.exists(data_uid)
+
+    assert store.restore(snapshot).is_ok()
+    assert store.exists(data_uid)
+    assert store.get(data_uid, client_key).ok() == obj
+
+
+@pytest.mark.parametrize("store_type", [DictActionStore, SQLiteActionStore])
+def test_action_store_blob_storage(store_type: type, tmp_path: Path):
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    root_key = SyftVerifyKey.from_string(test_verify_key_string_root)
+    blob_storage_config = BlobStorageConfig(path=tmp_path / "blobs", min_size=1024)
+    if store_type is SQLiteActionStore:
+        client_config = SQLiteStoreClientConfig(filename="blobs.sqlite", path=tmp_path)
+        store_config = SQLiteStoreConfig(
+            client_config=client_config, blob_storage_config=blob_storage_config
+        )
+    else:
+        store_config = DictStoreConfig(blob_storage_config=blob_storage_config)
+    store = store_type(store_config=store_config, root_verify_key=root_key)
+
+    # large arrays are written to memory-mapped .npy files
+    array = np.arange(10_000, dtype=np.float64)
+    obj = ActionObject.from_obj(array)
+    data = obj.syft_action_data
+    assert store.set(obj.id, client_key, obj, has_result_read_permission=True).is_ok()
+    # the stored copy holds the reference to the file, not the object set
+    assert obj.syft_action_data is data
+    assert isinstance(store.data[obj.id].syft_action_data, BlobFile)
+    assert [path.name for path in store.blob_storage.files(obj.id)] == [
+        f"{obj.id.no_dash}.data.npy"
+    ]
+
+    loaded = store.get(obj.id, client_key).ok().syft_action_data
+    assert isinstance(loaded.base, np.memmap)
+    assert np.array_equal(loaded, array)
+    # the loaded arrays are copy-on-write
+    loaded[0] = -1
+    assert store.get(obj.id, client_key).ok().syft_action_data[0] == 0
+
+    # large DataFrames are written to Arrow IPC files, small payloads stay inline
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) / 2})
+    twin = TwinObject(private_obj=df, mock_obj=df.head())
+    assert store.set(twin.id, client_key, twin).is_ok()
+    stored = store.data[twin.id]
+    assert isinstance(stored.private_obj.syft_action_data, BlobFile)
+    assert isinstance(stored.mock_obj.syft_action_data, pd.DataFrame)
+
+    loaded = store.get(twin.id, root_key).ok()
+    pd.testing.assert_frame_equal(loaded.private_obj.syft_action_data, df)
+    pd.testing.assert_frame_equal(loaded.mock_obj.syft_action_data, df.head())
+
+    # writing a payload inline removes its file
+    small = ActionObject.from_obj(np.arange(3))
+    small.id = obj.id
+    assert store.set(obj.id, client_key, small).is_ok()
+    assert store.blob_storage.files(obj.id) == []
+
+    assert store.delete(twin.id, root_key).is_ok()
+    assert store.blob_storage.files(twin.id) == []
+
+
+@pytest.mark.parametrize("store_type", [DictActionStore, SQLiteActionStore])
+def test_action_store_blob_snapshot_restore(store_type: type, tmp_path: Path):
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    root_key = SyftVerifyKey.from_string(test_verify_key_string_root)
+    blob_storage_config = BlobStorageConfig(path=tmp_path / "blobs", min_size=1024)
+    if store_type is SQLiteActionStore:
+        client_config = SQLiteStoreClientConfig(filename="blobs.sqlite", path=tmp_path)
+        store_config = SQLiteStoreConfig(
+            client_config=client_config, blob_storage_config=blob_storage_config
+        )
+    else:
+        store_config = DictStoreConfig(blob_storage_config=blob_storage_config)
+    store = store_type(store_config=store_config, root_verify_key=root_key)
+
+    array = np.arange(10_000, dtype=np.float64)
+    obj = ActionObject.from_obj(array)
+    assert store.set(obj.id, client_key, obj, has_result_read_permission=True).is_ok()
+    other = ActionObject.from_obj(array * 2)
+    assert store.set(other.id, client_key, other).is_ok()
+    snapshot = store.snapshot().ok()
+
+    # the files of the store are replaced and deleted after the snapshot
+    update = ActionObject.from_obj(array + 1)
+    update.id = obj.id
+    assert store.set(obj.id, client_key, update).is_ok()
+    assert store.delete(other.id, root_key).is_ok()
+    new = ActionObject.from_obj(array + 2)
+    assert store.set(new.id, client_key, new).is_ok()
+
+    assert store.restore(snapshot).is_ok()
+    loaded = store.get(obj.id, client_key).ok().syft_action_data
+    assert np.array_equal(loaded, array)
+    loaded = store.get(other.id, root_key).ok().syft_action_data
+    assert np.array_equal(loaded, array * 2)
+    assert store.blob_storage.files(new.id) == []
+
+
+def test_action_store_blob_storage_path() -> None:
+    root_key = SyftVerifyKey.from_string(test_verify_key_string_root)
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    store_config = DictStoreConfig(blob_storage_config=BlobStorageConfig())
+
+    # the nodes of a host have their own blob files
+    paths = {
+        DictActionStore(
+            store_config=store_config, root_verify_key=key
+        ).blob_storage.path
+        for key in [root_key, client_key]
+    }
+    assert len(paths) == 2
+
+
+def test_action_store_upload_path(tmp_path: Path) -> None:
+    root_key = SyftVerifyKey.from_string(test_verify_key_string_root)
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+
+    paths = {
+        DictActionStore(root_verify_key=key).upload_path()
+        for key in [root_key, client_key]
+    }
+    assert len(paths) == 2
+
+    # next to the database of the node
+    client_config = SQLiteStoreClientConfig(filename="node.sqlite", path=tmp_path)
+    store = SQLiteActionStore(
+        store_config=SQLiteStoreConfig(client_config=client_config),
+        root_verify_key=root_key,
+    )
+    assert store.upload_path() == tmp_path / "node_uploads"
+
+
+@pytest.mark.parametrize("store_type", [DictActionStore, SQLiteActionStore])
+@pytest.mark.parametrize("blob_storage", [False, True])
+def test_action_store_get_slice(store_type: type, blob_storage: bool, tmp_path: Path):
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    hacker_key = SyftVerifyKey.from_string(test_verify_key_string_hacker)
+    root_key = SyftVerifyKey.from_string(test_verify_key_string_root)
+    blob_storage_config = (
+        BlobStorageConfig(path=tmp_path / "blobs", min_size=1024)
+        if blob_storage
+        else None
+    )
+    if store_type is SQLiteActionStore:
+        client_config = SQLiteStoreClientConfig(filename="slice.sqlite", path=tmp_path)
+        store_config = SQLiteStoreConfig(
+            client_config=client_config, blob_storage_config=blob_storage_config
+        )
+    else:
+        store_config = DictStoreConfig(blob_storage_config=blob_storage_config)
+    store = store_type(store_config=store_config, root_verify_key=root_key)
+
+    array = np.arange(20_000, dtype=np.float64).reshape(2000, 10)
+    obj = ActionObject.from_obj(array)
+    assert store.set(obj.id, client_key, obj, has_result_read_permission=True).is_ok()
+
+    rows = store.get_slice(obj.id, client_key, slice(100, 200)).ok()
+    assert np.array_equal(rows.syft_action_data, array[100:200])
+    part = store.get_slice(obj.id, client_key, (slice(10, 20), 3)).ok()
+    assert np.array_equal(part.syft_action_data, array[10:20, 3])
+    strided = store.get_slice(obj.id, client_key, slice(None, None, 500)).ok()
+    assert np.array_equal(strided.syft_action_data, array[::500])
+    assert store.get_slice(obj.id, client_key, (5, 5)).ok().syft_action_data == 55
+    assert store.get_slice(obj.id, client_key, columns=["a"]).is_err()
+    assert store.get_slice(obj.id, hacker_key, slice(0, 10)).is_err()
+
+    df = pd.DataFrame(
+        {"a": np.arange(1000), "b": np.arange(1000) / 2, "c": ["x", "y"] * 500},
+        index=pd.RangeIndex(5, 5005, 5, name="row"),
+    )
+    twin = TwinObject(private_obj=df, mock_obj=df.head())
+    assert store.set(twin.id, client_key, twin).is_ok()
+
+    # the index of the rows is kept
+    part = store.get_slice(twin.id, root_key, slice(300, 310), columns=["b"]).ok()
+    pd.testing.assert_frame_equal(part.syft_action_data, df[["b"]].iloc[300:310])
+    part = store.get_slice(twin.id, root_key, [1, 3], columns=["c", "a"]).ok()
+    pd.testing.assert_frame_equal(part.syft_action_data, df[["c", "a"]].iloc[[1, 3]])
+    past_end = store.get_slice(twin.id, root_key, slice(990, 1200)).ok()
+    pd.testing.assert_frame_equal(past_end.syft_action_data, df.iloc[990:])
+
+    mock = store.get_slice(twin.id, root_key, slice(0, 100), twin_mode=TwinMode.MOCK)
+    pd.testing.assert_frame_equal(mock.ok().syft_action_data, df.head())
+    # the mock of a twin can be read without permission, its private data can't
+    mock = store.get_slice(twin.id, hacker_key, slice(0, 2), twin_mode=TwinMode.MOCK)
+    pd.testing.assert_frame_equal(mock.ok().syft_action_data, df.head(2))
+    assert store.get_slice(twin.id, hacker_key, slice(0, 2)).is_err()
+    res = store.get_slice(obj.id, hacker_key, slice(0, 2), twin_mode=TwinMode.MOCK)
+    assert res.is_err()
+
+    # the rows of a scalar are the scalar
+    scalar = ActionObject.from_obj(np.float64(1.5))
+    assert store.set(scalar.id, root_key, scalar).is_ok()
+    part = store.get_slice(scalar.id, root_key, slice(0, 10)).ok()
+    assert part.syft_action_data == 1.5
@@ -18,10 +18,13 @@ from syft.serde.serializable import serializable
 from syft.service.response import SyftSuccess
 from syft.store.dict_document_store import DictDocumentStore
 from syft.store.document_store import BaseUIDStoreStash
+from syft.store.document_store import InPredicate
 from syft.store.document_store import PartitionKey
 from syft.store.document_store import PartitionSettings
+from syft.store.document_store import PrefixPredicate
 from syft.store.document_store import QueryKey
 from syft.store.document_store import QueryKeys
+from syft.store.document_store import RangePredicate
 from syft.store.document_store import UIDPartitionKey
 from syft.types.syft_object import SyftObject
 from syft.types.uid import UID
@@ -447,3 +450,104 @@ def test_basestash_cannot_query_non_searchable(
     assert base_stash.query_all(
         root_verify_key, QueryKeys(qks=[qk, UIDPartitionKey.with_obj(obj.id)])
     ).is_err()
+
+
+def test_basestash_set_get_delete_many(
+    root_verify_key, base_stash: MockStash, mock_objects: List[MockObject]
+) -> None:
+    res = base_stash.set_many(root_verify_key, mock_objects)
+    assert res.is_ok()
+    assert [result.ok() for result in res.ok()] == mock_objects
+
+    uids = [obj.id for obj in mock_objects]
+    res = base_stash.get_many(root_verify_key, uids)
+    assert [result.ok() for result in res.ok()] == mock_objects
+
+    for obj in mock_objects:
+        obj.value += 1
+    res = base_stash.update_many(root_verify_key, mock_objects)
+    assert all(result.is_ok() for result in res.ok())
+
+    res = base_stash.delete_many_by_uid(root_verify_key, uids)
+    assert all(result.is_ok() for result in res.ok())
+    assert len(base_stash.get_all(root_verify_key).ok()) == 0
+
+
+def test_basestash_set_many_type_check(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    res = base_stash.set_many(root_verify_key, [mock_object, UID()])
+    assert res.is_err()
+    assert len(base_stash.get_all(root_verify_key).ok()) == 0
+
+
+def test_basestash_get_all_limit_offset(
+    root_verify_key, base_stash: MockStash, mock_objects: List[MockObject]
+) -> None:
+    for obj in mock_objects:
+        add_mock_object(root_verify_key, base_stash, obj)
+
+    res = base_stash.get_all(root_verify_key, limit=3, offset=2)
+    assert res.ok() == mock_objects[2:5]
+
+    by_importance = sorted(mock_objects, key=lambda obj: obj.importance)
+    res = base_stash.get_all(
+        root_verify_key, order_by=ImportancePartitionKey, limit=4, offset=4
+    )
+    assert [obj.importance for obj in res.ok()] == [
+        obj.importance for obj in by_importance[4:8]
+    ]
+
+    qk = DescPartitionKey.with_obj(mock_objects[0].desc)
+    res = base_stash.query_all(root_verify_key, qk, limit=1, offset=1)
+    assert res.ok() == []
+
+
+def test_basestash_get_page(
+    root_verify_key, base_stash: MockStash, mock_objects: List[MockObject]
+) -> None:
+    for obj in mock_objects:
+        add_mock_object(root_verify_key, base_stash, obj)
+
+    objs = []
+    cursor = None
+    for _ in range(4):
+        page = base_stash.get_page(root_verify_key, page_size=3, cursor=cursor).ok()
+        objs.extend(page.objs)
+        cursor = page.cursor
+    assert objs == mock_objects
+    assert cursor is None
+
+    assert base_stash.get_page(root_verify_key, 3, cursor="not a cursor").is_err()
+    assert base_stash.get_page(root_verify_key, 0).is_err()
+    assert base_stash.get_page(root_verify_key, -1).is_err()
+
+
+def test_basestash_query_predicates(
+    root_verify_key, base_stash: MockStash, mock_objects: List[MockObject]
+) -> None:
+    for obj in mock_objects:
+        add_mock_object(root_verify_key, base_stash, obj)
+
+    def ids(res) -> set:
+        return {obj.id for obj in res.ok()}
+
+    names = [obj.name for obj in mock_objects]
+    res = base_stash.find_all(root_verify_key, name=InPredicate(values=names[:3]))
+    assert ids(res) == {obj.id for obj in mock_objects[:3]}
+
+    res = base_stash.find_all(root_verify_key, importance=RangePredicate(gte=1, lt=3))
+    assert ids(res) == {obj.id for obj in mock_objects if 1 <= obj.importance < 3}
+
+    prefix = names[0][:2]
+    res = base_stash.find_all(root_verify_key, name=PrefixPredicate(prefix=prefix))
+    assert ids(res) == {obj.id for obj in mock_objects if obj.name.startswith(prefix)}
+
+    qks = QueryKeys.from_dict(
+        {"importance": RangePredicate(gte=0), "name": mock_objects[0].name}
+    )
+    assert ids(base_stash.query_all(root_verify_key, qks)) == {mock_objects[0].id}
+    # the unique name is looked up before the range is evaluated
+    steps = base_stash.explain(qks).ok().split("\n")
+    assert steps[0].startswith("1. unique key name ==")
+    assert steps[1].startswith("2. searchable key importance gte 0")
@@ -1,11 +1,15 @@
 # stdlib
+from threading import Barrier
 from threading import Thread
 
 # syft absolute
 from syft.store.dict_document_store import DictStorePartition
+from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKeys
 
 # relative
+from .store_fixtures_test import dict_document_store_fn
+from .store_fixtures_test import dict_store_partition_fn
 from .store_mocks_test import MockObjectType
 from .store_mocks_test import MockSyftObject
 
@@ -262,6 +266,46 @@ def test_dict_store_partition_set_multithreaded(
     assert stored_cnt == repeats * thread_cnt
 
 
+def test_dict_store_partition_concurrent_reads(root_verify_key) -> None:
+    partition = dict_store_partition_fn(
+        root_verify_key, locking_config_name="threading"
+    )
+    partition.init_store()
+    obj = MockSyftObject(data=1)
+    assert partition.set(root_verify_key, obj).is_ok()
+
+    # each read waits for the other one, they only finish if they run at once
+    barrier = Barrier(2, timeout=5)
+    get = partition._get
+
+    def _get(*args, **kwargs):
+        barrier.wait()
+        return get(*args, **kwargs)
+
+    partition._get = _get
+    results = []
+
+    def _read() -> None:
+        results.append(partition.get(root_verify_key, obj.id))
+
+    threads = [Thread(target=_read) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 2
+    assert all(result.is_ok() for result in results)
+    assert partition.lock.metrics["shared_acquisitions"] == 2
+
+    # the writes still wait for the reads
+    assert partition.lock.acquire_shared()
+    assert not partition.lock.acquire(blocking=False)
+    partition.lock.release_shared()
+    assert partition.lock.acquire(blocking=False)
+    partition.lock.release()
+
+
 def test_dict_store_partition_update_multithreaded(
     root_verify_key,
     dict_store_partition: DictStorePartition,
@@ -352,3 +396,26 @@ def test_dict_store_partition_set_delete_multithreaded(
         ).ok()
     )
     assert stored_cnt == 0
+
+
+def test_dict_document_store_snapshot_restore(root_verify_key) -> None:
+    store = dict_document_store_fn(root_verify_key)
+    settings = PartitionSettings(name="test", object_type=MockObjectType)
+    partition = store.partition(settings)
+
+    obj = MockSyftObject(data=1)
+    assert partition.set(root_verify_key, obj).is_ok()
+    snapshot = store.snapshot().ok()
+
+    # the writes after the snapshot, in place or not, don't change it
+    qk = partition.store_query_key(obj)
+    assert partition.update(root_verify_key, qk, MockSyftObject(data=2)).is_ok()
+    assert partition.set(root_verify_key, MockSyftObject(data=3)).is_ok()
+
+    fresh = dict_document_store_fn(root_verify_key)
+    assert fresh.restore(snapshot).is_ok()
+    restored = fresh.partition(settings).all(root_verify_key).ok()
+    assert [obj.data for obj in restored] == [1]
+
+    assert store.restore(snapshot).is_ok()
+    assert [obj.data for obj in partition.all(root_verify_key).ok()] == [1]
@@ -6,9 +6,15 @@ from threading import Thread
 import pytest
 
 # syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.action.action_permissions import ActionPermission
+from syft.service.user.user_roles import ServiceRole
 from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKeys
+from syft.store.document_store import locked_roles
 from syft.store.kv_document_store import KeyValueStorePartition
+from syft.types.uid import UID
 
 # relative
 from .store_mocks_test import MockObjectType
@@ -279,3 +285,138 @@ def test_kv_store_partition_set_delete_multithreaded(
     assert execution_err is None
     stored_cnt = len(kv_store_partition.all(root_verify_key).ok())
     assert stored_cnt == 0
+
+
+def test_kv_store_partition_set_many(
+    root_verify_key, kv_store_partition: KeyValueStorePartition
+) -> None:
+    objs = [MockSyftObject(data=i) for i in range(5)]
+
+    res = kv_store_partition.set_many(root_verify_key, objs + [objs[0]])
+    assert res.is_ok()
+    results = res.ok()
+    assert [result.ok() for result in results[:5]] == objs
+    # one result per object
+    assert results[5].is_err()
+    assert len(kv_store_partition.all(root_verify_key).ok()) == 5
+
+    res = kv_store_partition.set_many(root_verify_key, objs, ignore_duplicates=True)
+    assert all(result.is_ok() for result in res.ok())
+    assert len(kv_store_partition.all(root_verify_key).ok()) == 5
+
+
+def test_kv_store_partition_get_update_delete_many(
+    root_verify_key, kv_store_partition: KeyValueStorePartition
+) -> None:
+    objs = [MockSyftObject(data=i) for i in range(5)]
+    assert kv_store_partition.set_many(root_verify_key, objs).is_ok()
+
+    uids = [obj.id for obj in objs] + [UID()]
+    results = kv_store_partition.get_many(root_verify_key, uids).ok()
+    assert [result.ok() for result in results[:5]] == objs
+    assert results[5].is_err()
+
+    guest_key = SyftSigningKey.generate().verify_key
+    results = kv_store_partition.get_many(guest_key, uids).ok()
+    assert all(result.is_err() for result in results)
+
+    updated = [MockSyftObject(id=obj.id, data=obj.data + 10) for obj in objs]
+    res = kv_store_partition.update_many(root_verify_key, updated)
+    assert all(result.is_ok() for result in res.ok())
+    results = kv_store_partition.get_many(root_verify_key, uids[:5]).ok()
+    assert [result.ok().data for result in results] == [10, 11, 12, 13, 14]
+
+    qks = [kv_store_partition.store_query_key(obj) for obj in objs[:2]]
+    res = kv_store_partition.delete_many(root_verify_key, qks)
+    assert all(result.is_ok() for result in res.ok())
+    assert len(kv_store_partition.all(root_verify_key).ok()) == 3
+
+    res = kv_store_partition.delete_many(root_verify_key, qks)
+    assert all(result.is_err() for result in res.ok())
+
+
+def test_kv_store_partition_permission_index(
+    root_verify_key, kv_store_partition: KeyValueStorePartition
+) -> None:
+    user_key = SyftSigningKey.generate().verify_key
+    objs = [MockSyftObject(data=idx) for idx in range(3)]
+    for obj in objs:
+        assert kv_store_partition.set(root_verify_key, obj).is_ok()
+
+    def readable_ids() -> set:
+        return {obj.id for obj in kv_store_partition.all(user_key).ok()}
+
+    assert readable_ids() == set()
+
+    kv_store_partition.add_permissions(
+        [ActionObjectREAD(uid=obj.id, credentials=user_key) for obj in objs[:2]]
+    )
+    assert readable_ids() == {objs[0].id, objs[1].id}
+    kv_store_partition.remove_permissions(
+        [ActionObjectREAD(uid=objs[0].id, credentials=user_key)]
+    )
+    assert readable_ids() == {objs[1].id}
+
+    # a role grant applies to the users with the role or a higher one
+    kv_store_partition.add_role_permission(
+        [objs[2].id], ActionPermission.READ, ServiceRole.DATA_SCIENTIST
+    )
+    read = ActionObjectREAD(uid=objs[2].id, credentials=user_key)
+    assert not kv_store_partition.has_permission(read)
+
+    kv_store_partition.role_resolver = lambda key: ServiceRole.DATA_OWNER
+    assert kv_store_partition.has_permission(read)
+    assert readable_ids() == {objs[1].id, objs[2].id}
+
+    kv_store_partition.role_resolver = lambda key: ServiceRole.GUEST
+    assert not kv_store_partition.has_permission(read)
+
+    kv_store_partition.remove_role_permission(
+        [objs[2].id], ActionPermission.READ, ServiceRole.DATA_SCIENTIST
+    )
+    kv_store_partition.role_resolver = lambda key: ServiceRole.ADMIN
+    assert readable_ids() == {objs[1].id}
+
+
+def test_kv_store_partition_role_resolved_before_lock(
+    root_verify_key, kv_store_partition: KeyValueStorePartition
+) -> None:
+    user_key = SyftSigningKey.generate().verify_key
+    obj = MockSyftObject(data=1)
+    assert kv_store_partition.set(root_verify_key, obj).is_ok()
+    kv_store_partition.add_role_permission(
+        [obj.id], ActionPermission.READ, ServiceRole.DATA_SCIENTIST
+    )
+
+    # the roles of the locked operation running when the role is looked up
+    resolved = []
+
+    def role_resolver(key):
+        resolved.append(locked_roles())
+        return ServiceRole.DATA_OWNER
+
+    kv_store_partition.role_resolver = role_resolver
+    assert [o.id for o in kv_store_partition.all(user_key).ok()] == [obj.id]
+    qks = kv_store_partition.store_query_keys([obj])
+    assert kv_store_partition.get_all_from_store(user_key, qks).ok() == [obj]
+    # once per operation, before its lock is taken
+    assert resolved == [None, None]
+
+
+def test_kv_store_partition_permission_lookups_dont_write(
+    root_verify_key, kv_store_partition: KeyValueStorePartition
+) -> None:
+    user_key = SyftSigningKey.generate().verify_key
+    obj = MockSyftObject(data=1)
+    assert kv_store_partition.set(root_verify_key, obj).is_ok()
+    permissions = kv_store_partition.permissions
+    strings = set(permissions.uids.keys())
+
+    # denied lookups don't add empty entries to the reverse index
+    assert not kv_store_partition.has_permission(
+        ActionObjectREAD(uid=obj.id, credentials=user_key)
+    )
+    assert not permissions.has_role_grants()
+    read = ActionObjectREAD(uid=obj.id, credentials=user_key)
+    assert permissions.uids_with(read) == set()
+    assert set(permissions.uids.keys()) == strings
@@ -9,11 +9,18 @@ from joblib import delayed
 import pytest
 
 # syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.action.action_permissions import ActionObjectWRITE
+from syft.service.action.action_permissions import ActionPermission
 from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKeys
 from syft.store.mongo_client import MongoStoreClientConfig
 from syft.store.mongo_document_store import MongoStoreConfig
 from syft.store.mongo_document_store import MongoStorePartition
+from syft.store.mongo_document_store import PERMISSIONS_FIELD
+from syft.types.uid import UID
 
 # relative
 from .store_constants_test import generate_db_name
@@ -599,3 +606,151 @@ def test_mongo_store_partition_set_delete_joblib(
         ).ok()
     )
     assert stored_cnt == 0
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="pytest_mock_resources + docker issues on Windows"
+)
+def test_mongo_store_partition_set_get_delete_many(
+    root_verify_key, mongo_store_partition: MongoStorePartition
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    objs = [MockSyftObject(data=i) for i in range(5)]
+    res = mongo_store_partition.set_many(root_verify_key, objs + [objs[0]])
+    results = res.ok()
+    assert [result.ok() for result in results[:5]] == objs
+    # inserted unordered, a duplicate doesn't stop the batch
+    assert results[5].is_err()
+
+    res = mongo_store_partition.set_many(
+        root_verify_key, [objs[0]], ignore_duplicates=True
+    )
+    assert res.ok()[0].is_ok()
+
+    uids = [obj.id for obj in objs] + [UID()]
+    results = mongo_store_partition.get_many(root_verify_key, uids).ok()
+    assert [result.ok() for result in results[:5]] == objs
+    assert results[5].is_err()
+
+    updated = [MockSyftObject(id=obj.id, data=obj.data + 10) for obj in objs]
+    res = mongo_store_partition.update_many(root_verify_key, updated)
+    assert all(result.is_ok() for result in res.ok())
+
+    qks = [mongo_store_partition.store_query_key(obj) for obj in objs]
+    res = mongo_store_partition.delete_many(root_verify_key, qks)
+    assert all(result.is_ok() for result in res.ok())
+    assert len(mongo_store_partition.all(root_verify_key).ok()) == 0
+
+
+def test_mongo_store_partition_permission_filter(root_verify_key) -> None:
+    # won't connect, the filters are built without the server
+    mongo_config = MongoStoreClientConfig(connectTimeoutMS=1, timeoutMS=1)
+    store_config = MongoStoreConfig(client_config=mongo_config)
+    settings = PartitionSettings(name="test", object_type=MockObjectType)
+    store = MongoStorePartition(
+        root_verify_key, settings=settings, store_config=store_config
+    )
+    guest_verify_key = SyftSigningKey.generate().verify_key
+
+    assert store._permission_filter(root_verify_key, ActionPermission.READ) == {}
+    assert store._permission_filter(guest_verify_key, ActionPermission.READ) == {
+        PERMISSIONS_FIELD: {"$in": [f"{guest_verify_key.verify}_READ", "ALL_READ"]}
+    }
+    assert store._permission_filter(guest_verify_key, ActionPermission.WRITE) == {
+        PERMISSIONS_FIELD: {"$in": [f"{guest_verify_key.verify}_WRITE"]}
+    }
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="pytest_mock_resources + docker issues on Windows"
+)
+def test_mongo_store_partition_permissions(
+    root_verify_key, mongo_store_partition: MongoStorePartition
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    def ids(res):
+        return {obj.id for obj in res.ok()}
+
+    owner_verify_key = SyftSigningKey.generate().verify_key
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    owned, public = MockSyftObject(data=1), MockSyftObject(data=2)
+    mongo_store_partition.set(owner_verify_key, owned)
+    mongo_store_partition.set(
+        owner_verify_key,
+        public,
+        add_permissions=[
+            ActionObjectPermission(uid=public.id, permission=ActionPermission.ALL_READ)
+        ],
+    )
+
+    assert ids(mongo_store_partition.all(root_verify_key)) == {owned.id, public.id}
+    assert ids(mongo_store_partition.all(owner_verify_key)) == {owned.id, public.id}
+    assert ids(mongo_store_partition.all(guest_verify_key)) == {public.id}
+
+    results = mongo_store_partition.get_many(
+        guest_verify_key, [owned.id, public.id]
+    ).ok()
+    assert "denied" in results[0].err()
+    assert results[1].ok() == public
+
+    assert mongo_store_partition.has_permission(
+        ActionObjectWRITE(uid=owned.id, credentials=owner_verify_key)
+    )
+    assert not mongo_store_partition.has_permission(
+        ActionObjectWRITE(uid=public.id, credentials=guest_verify_key)
+    )
+    key = mongo_store_partition.store_query_key(public)
+    assert mongo_store_partition.delete(guest_verify_key, key).is_err()
+
+    read_permission = ActionObjectREAD(uid=owned.id, credentials=guest_verify_key)
+    mongo_store_partition.add_permission(read_permission)
+    assert ids(mongo_store_partition.all(guest_verify_key)) == {owned.id, public.id}
+
+    mongo_store_partition.remove_permission(read_permission)
+    assert ids(mongo_store_partition.all(guest_verify_key)) == {public.id}
+
+
+def test_mongo_store_partition_legacy_permissions(root_verify_key) -> None:
+    mongomock = pytest.importorskip("mongomock")
+    store_config = MongoStoreConfig(client_config=MongoStoreClientConfig())
+    settings = PartitionSettings(name="test", object_type=MockObjectType)
+    partition = MongoStorePartition(
+        root_verify_key, settings=settings, store_config=store_config
+    )
+    # mongomock doesn't support the syft codecs, the documents are plain ones
+    collection = mongomock.MongoClient()[generate_db_name()]["test"]
+    partition._collection = collection
+
+    # documents written before the permissions were stored, and one only
+    # readable by everyone, which is left as it is
+    owner_verify_key = SyftSigningKey.generate().verify_key
+    owned = [ActionObjectWRITE(uid=None, credentials=owner_verify_key)]
+    collection.insert_many(
+        [
+            {"_id": "legacy"},
+            {"_id": "public", PERMISSIONS_FIELD: [ActionPermission.ALL_READ.name]},
+            {"_id": "owned", PERMISSIONS_FIELD: [p.permission_string for p in owned]},
+        ]
+    )
+    assert partition._create_permissions_index().is_ok()
+
+    def permitted(credentials, permission) -> set:
+        permission_filter = partition._permission_filter(credentials, permission)
+        return {doc["_id"] for doc in collection.find(permission_filter)}
+
+    # they keep the access everyone had before, except ownership
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    assert permitted(guest_verify_key, ActionPermission.READ) == {"legacy", "public"}
+    assert permitted(guest_verify_key, ActionPermission.WRITE) == {"legacy"}
+    assert permitted(guest_verify_key, ActionPermission.EXECUTE) == {"legacy"}
+    assert permitted(guest_verify_key, ActionPermission.OWNER) == set()
+    assert permitted(owner_verify_key, ActionPermission.WRITE) == {"legacy", "owned"}
+
+    # the backfill runs on each start, it doesn't widen the access of documents
+    assert partition._create_permissions_index().is_ok()
+    public = collection.find_one({"_id": "public"})
+    assert public[PERMISSIONS_FIELD] == [ActionPermission.ALL_READ.name]
@@ -0,0 +1,81 @@
+# syft absolute
+from syft.store.object_cache import CacheConfig
+from syft.store.object_cache import ObjectCache
+from syft.store.object_cache import estimated_size
+from syft.types.uid import UID
+
+# relative
+from .store_mocks_test import MockSyftObject
+
+
+def test_object_cache_lru() -> None:
+    cache = ObjectCache(CacheConfig(max_objects=2))
+    objs = [MockSyftObject(data=i) for i in range(3)]
+
+    cache.put(objs[0].id, objs[0])
+    cache.put(objs[1].id, objs[1])
+    assert cache.get(objs[0].id) == objs[0]
+    # the least recently used object is evicted
+    cache.put(objs[2].id, objs[2])
+    assert cache.get(objs[1].id) is None
+    assert cache.get(objs[0].id) == objs[0]
+    assert cache.get(objs[2].id) == objs[2]
+
+    assert cache.metrics == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "invalidations": 0,
+        "objects": 2,
+        "bytes": estimated_size(objs[0]) + estimated_size(objs[2]),
+    }
+
+
+def test_object_cache_max_bytes() -> None:
+    small = MockSyftObject(data=1)
+    large = MockSyftObject(data="x" * 1000)
+    cache = ObjectCache(CacheConfig(max_bytes=estimated_size(large) + 1))
+
+    cache.put(small.id, small)
+    # the small object is evicted to make room for the large one
+    cache.put(large.id, large)
+    assert len(cache) == 1
+    assert cache.get(large.id) == large
+
+    cache = ObjectCache(CacheConfig(max_bytes=estimated_size(large) - 1))
+    cache.put(large.id, large)
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_object_cache_version_invalidate() -> None:
+    cache = ObjectCache(CacheConfig())
+    obj = MockSyftObject(data=1)
+
+    cache.put(obj.id, obj, version="a")
+    assert cache.get(obj.id, "a") == obj
+    # a cached object is only returned for the version it was read with
+    assert cache.get(obj.id, "b") is None
+
+    cache.invalidate([obj.id, UID()])
+    assert cache.get(obj.id, "a") is None
+    assert cache.metrics["invalidations"] == 1
+
+    cache.put(obj.id, obj)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_object_cache_copies() -> None:
+    cache = ObjectCache(CacheConfig())
+    obj = MockSyftObject(data=1)
+
+    cache.put(obj.id, obj)
+    obj.data = 2
+    cached = cache.get(obj.id)
+    assert cached.data == 1
+    # the readers get their own copies
+    cached.data = 3
+    assert cache.get(obj.id).data == 1
+    assert cache.get(obj.id) is not cache.get(obj.id)
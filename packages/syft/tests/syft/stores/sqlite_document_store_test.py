@@ -1,17 +1,37 @@
 # stdlib
+from pathlib import Path
 from threading import Thread
+from typing import List
+from typing import Optional
 from typing import Tuple
 
 # third party
 from joblib import Parallel
 from joblib import delayed
+import numpy as np
 import pytest
 
 # syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.serde.serializable import serializable
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.store.document_store import InPredicate
+from syft.store.document_store import PartitionKey
+from syft.store.document_store import PartitionSettings
+from syft.store.document_store import PrefixPredicate
 from syft.store.document_store import QueryKeys
+from syft.store.document_store import RangePredicate
+from syft.store.object_cache import CacheConfig
+from syft.store.sqlite_document_store import SQLiteBackingStore
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
 from syft.store.sqlite_document_store import SQLiteStorePartition
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
 
 # relative
+from .store_constants_test import generate_db_name
+from .store_fixtures_test import sqlite_document_store_fn
 from .store_fixtures_test import sqlite_store_partition_fn
 from .store_mocks_test import MockObjectType
 from .store_mocks_test import MockSyftObject
@@ -19,6 +39,53 @@ from .store_mocks_test import MockSyftObject
 REPEATS = 20
 
 
+@serializable()
+class MockIndexedObject(SyftObject):
+    __canonical_name__ = "MockIndexedObject"
+
+    email: str
+    name: str
+    linked: List[UID] = []
+
+    __attr_unique__ = ["email"]
+    __attr_searchable__ = ["name", "linked_ids"]
+
+    def linked_ids(self) -> List[UID]:
+        return self.linked
+
+
+EmailPartitionKey = PartitionKey(key="email", type_=str)
+NamePartitionKey = PartitionKey(key="name", type_=str)
+LinkedPartitionKey = PartitionKey(key="linked_ids", type_=List[UID])
+
+
+def indexed_partition(
+    root_verify_key,
+    sqlite_workspace: Tuple[Path, str],
+    cache_config: Optional[CacheConfig] = None,
+):
+    workspace, db_name = sqlite_workspace
+    store_config = SQLiteStoreConfig(
+        client_config=SQLiteStoreClientConfig(filename=db_name, path=workspace),
+        cache_config=cache_config,
+    )
+    settings = PartitionSettings(name="indexed", object_type=MockIndexedObject)
+    partition = SQLiteStorePartition(
+        root_verify_key, settings=settings, store_config=store_config
+    )
+    assert partition.init_store().is_ok()
+    return partition
+
+
+def find_ids(root_verify_key, partition, *qks) -> set:
+    res = partition.find_index_or_search_keys(
+        root_verify_key,
+        index_qks=QueryKeys(qks=[qk for qk in qks if qk.key == "email"]),
+        search_qks=QueryKeys(qks=[qk for qk in qks if qk.key != "email"]),
+    )
+    return {obj.id for obj in res.ok()}
+
+
 def test_sqlite_store_partition_sanity(
     sqlite_store_partition: SQLiteStorePartition,
 ) -> None:
@@ -523,3 +590,470 @@ def test_sqlite_store_partition_set_delete_joblib(
         ).ok()
     )
     assert stored_cnt == 0
+
+
+def test_sqlite_store_partition_lazy_fields(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    obj = MockSyftObject(data=np.random.rand(256, 256))
+    res = sqlite_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+    assert res.is_ok()
+
+    stored = sqlite_store_partition.all(root_verify_key).ok()[0]
+    # the payload is only decoded when it is accessed
+    assert "data" in stored._syft_lazy_fields
+    assert stored.id == obj.id
+    assert (stored.data == obj.data).all()
+    assert "data" not in stored._syft_lazy_fields
+
+
+def test_sqlite_store_partition_index_tables(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    linked = UID()
+    a = MockIndexedObject(email="a@openmined.org", name="x", linked=[linked])
+    b = MockIndexedObject(email="b@openmined.org", name="x")
+    for obj in [a, b]:
+        assert partition.set(root_verify_key, obj).is_ok()
+
+    duplicate = MockIndexedObject(email="a@openmined.org", name="y")
+    assert partition.set(root_verify_key, duplicate).is_err()
+
+    # the keys are rows (partition, key, value, uid) instead of a column blob
+    assert len(partition.unique_keys) == 4
+    # one row for each item of a list, none for an empty one
+    assert len(partition.searchable_keys) == 3
+    assert partition.unique_keys.find(EmailPartitionKey.with_obj(a)) == {a.id}
+
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("x")) == {
+        a.id,
+        b.id,
+    }
+    assert find_ids(
+        root_verify_key,
+        partition,
+        NamePartitionKey.with_obj("x"),
+        EmailPartitionKey.with_obj("b@openmined.org"),
+    ) == {b.id}
+    assert find_ids(
+        root_verify_key, partition, LinkedPartitionKey.with_obj([linked])
+    ) == {a.id}
+
+    res = partition.update(
+        root_verify_key,
+        partition.settings.store_key.with_obj(a),
+        MockIndexedObject(id=a.id, email="c@openmined.org", name="y"),
+    )
+    assert res.is_ok()
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("x")) == {
+        b.id
+    }
+    assert partition.unique_keys.find(EmailPartitionKey.with_obj(a)) == set()
+
+    assert partition.delete(
+        root_verify_key, partition.settings.store_key.with_obj(b)
+    ).is_ok()
+    assert len(partition.unique_keys) == 2
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("x")) == set()
+
+
+def test_sqlite_store_partition_index_tables_backfill(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    obj = MockIndexedObject(email="a@openmined.org", name="x")
+    assert partition.set(root_verify_key, obj).is_ok()
+
+    # a database written before the keys were stored in index tables
+    for index in [partition.unique_keys, partition.searchable_keys]:
+        index.remove(obj.id)
+
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("x")) == {
+        obj.id
+    }
+
+
+def test_sqlite_store_partition_wal(
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    db = sqlite_store_partition.data.db
+    assert db.execute("pragma journal_mode").fetchone()[0] == "wal"
+    # NORMAL
+    assert db.execute("pragma synchronous").fetchone()[0] == 1
+
+    # the tables of the partition are written with the same connection
+    assert sqlite_store_partition.unique_keys.db is db
+    assert sqlite_store_partition.permissions.db is db
+
+
+def test_sqlite_store_partition_upsert(
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    uid = UID()
+    sqlite_store_partition.data[uid] = MockSyftObject(data=1)
+    sqlite_store_partition.data[uid] = MockSyftObject(data=2)
+
+    assert len(sqlite_store_partition.data) == 1
+    assert sqlite_store_partition.data[uid].data == 2
+
+
+def test_sqlite_store_partition_transaction(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    a = MockIndexedObject(email="a@openmined.org", name="x")
+    b = MockIndexedObject(email="b@openmined.org", name="x")
+
+    with pytest.raises(RuntimeError):
+        with partition.transaction():
+            assert partition._set(root_verify_key, a).is_ok()
+            raise RuntimeError
+
+    # the object, its keys and its permissions are rolled back together
+    assert len(partition) == 0
+    assert len(partition.unique_keys) == 0
+    assert a.id not in partition.permissions
+
+    with partition.transaction():
+        assert partition._set(root_verify_key, a).is_ok()
+        assert partition._set(root_verify_key, b).is_ok()
+        # committed once, when the block exits
+        assert partition.data.db.in_transaction
+
+    assert not partition.data.db.in_transaction
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("x")) == {
+        a.id,
+        b.id,
+    }
+
+
+def test_sqlite_store_partition_set_many(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    objs = [
+        MockIndexedObject(email=f"{i}@openmined.org", name="x", linked=[UID()])
+        for i in range(10)
+    ]
+    duplicate = MockIndexedObject(email="0@openmined.org", name="y")
+
+    res = partition.set_many(root_verify_key, objs + [duplicate])
+    results = res.ok()
+    assert all(result.is_ok() for result in results[:10])
+    assert results[10].is_err()
+
+    # the objects are written with a single statement and commit
+    assert len(partition.data) == 10
+    results = partition.get_many(root_verify_key, [obj.id for obj in objs]).ok()
+    assert [result.ok() for result in results] == objs
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("x")) == {
+        obj.id for obj in objs
+    }
+
+
+def test_sqlite_store_partition_set_many_duplicate(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    a = MockIndexedObject(email="a@openmined.org", name="x")
+    duplicate = MockIndexedObject(email="a@openmined.org", name="y")
+    c = MockIndexedObject(email="c@openmined.org", name="x")
+
+    results = partition.set_many(root_verify_key, [a, duplicate, c]).ok()
+    assert [result.is_ok() for result in results] == [True, False, True]
+
+    # what was reported written is stored, with its keys and nothing else
+    assert {obj.id for obj in partition.all(root_verify_key).ok()} == {a.id, c.id}
+    assert len(partition.unique_keys) == 4
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("y")) == set()
+    assert duplicate.id not in partition.permissions
+
+
+def test_sqlite_store_partition_set_many_rollback(
+    root_verify_key, sqlite_workspace: Tuple[Path, str], monkeypatch
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    objs = [MockIndexedObject(email=f"{i}@openmined.org", name="x") for i in range(3)]
+
+    # the second object fails after its first keys were written
+    set_keys = partition._set_keys
+
+    def failing_set_keys(store_query_key, unique_query_keys, searchable_query_keys):
+        set_keys(store_query_key, unique_query_keys, searchable_query_keys)
+        if store_query_key.value == objs[1].id:
+            raise RuntimeError("disk full")
+
+    monkeypatch.setattr(partition, "_set_keys", failing_set_keys)
+    results = partition.set_many(root_verify_key, objs).ok()
+    assert [result.is_ok() for result in results] == [True, False, True]
+    assert {obj.id for obj in partition.all(root_verify_key).ok()} == {
+        objs[0].id,
+        objs[2].id,
+    }
+    assert partition.unique_keys.find(EmailPartitionKey.with_obj(objs[1])) == set()
+    assert len(partition.unique_keys) == 4
+
+
+def test_sqlite_store_partition_update_delete_many_rollback(
+    root_verify_key, sqlite_workspace: Tuple[Path, str], monkeypatch
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    objs = [MockIndexedObject(email=f"{i}@openmined.org", name="x") for i in range(3)]
+    assert partition.set_many(root_verify_key, objs).is_ok()
+    updated = [MockIndexedObject(id=obj.id, email=obj.email, name="y") for obj in objs]
+
+    # the second update fails after the old keys of the object were removed
+    set_data_and_keys = partition._set_data_and_keys
+
+    def failing_set_data_and_keys(store_query_key, **kwargs):
+        if store_query_key.value == objs[1].id:
+            raise RuntimeError("disk full")
+        return set_data_and_keys(store_query_key=store_query_key, **kwargs)
+
+    monkeypatch.setattr(partition, "_set_data_and_keys", failing_set_data_and_keys)
+    results = partition.update_many(root_verify_key, updated).ok()
+    assert [result.is_ok() for result in results] == [True, False, True]
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("y")) == {
+        objs[0].id,
+        objs[2].id,
+    }
+    # the failed update kept the object and its keys
+    assert find_ids(root_verify_key, partition, NamePartitionKey.with_obj("x")) == {
+        objs[1].id
+    }
+    assert partition.unique_keys.find(EmailPartitionKey.with_obj(objs[1])) == {
+        objs[1].id
+    }
+    monkeypatch.undo()
+
+    # the second delete fails after the object was removed
+    delete_search_keys_for = partition._delete_search_keys_for
+
+    def failing_delete_search_keys_for(obj):
+        if obj.id == objs[1].id:
+            raise RuntimeError("disk full")
+        return delete_search_keys_for(obj)
+
+    monkeypatch.setattr(
+        partition, "_delete_search_keys_for", failing_delete_search_keys_for
+    )
+    qks = [partition.settings.store_key.with_obj(obj) for obj in objs]
+    results = partition.delete_many(root_verify_key, qks).ok()
+    assert [result.is_ok() for result in results] == [True, False, True]
+    assert [obj.id for obj in partition.all(root_verify_key).ok()] == [objs[1].id]
+    assert partition.unique_keys.find(EmailPartitionKey.with_obj(objs[1])) == {
+        objs[1].id
+    }
+    assert partition.unique_keys.find(EmailPartitionKey.with_obj(objs[0])) == set()
+
+
+def test_sqlite_store_partition_all_limit_offset(
+    root_verify_key, sqlite_store_partition: SQLiteStorePartition
+) -> None:
+    objs = [MockSyftObject(data=i) for i in range(10)]
+    sqlite_store_partition.set_many(root_verify_key, objs)
+
+    loaded = []
+    get_many = sqlite_store_partition.data.get_many
+
+    def spy(keys):
+        loaded.extend(keys)
+        return get_many(keys)
+
+    sqlite_store_partition.data.get_many = spy
+    res = sqlite_store_partition.all(root_verify_key, limit=3, offset=5)
+    assert res.ok() == objs[5:8]
+    # only the objects of the page are read from the table
+    assert loaded == [obj.id for obj in objs[5:8]]
+
+    qks = sqlite_store_partition.store_query_keys(objs)
+    res = sqlite_store_partition.get_all_from_store(root_verify_key, qks, limit=2)
+    assert res.ok() == objs[:2]
+
+
+def test_sqlite_store_partition_all_order_by(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    objs = [
+        MockIndexedObject(email=f"{i}@openmined.org", name=f"name{9 - i}")
+        for i in range(10)
+    ]
+    partition.set_many(root_verify_key, objs)
+
+    loaded = []
+    get_many = partition.data.get_many
+
+    def spy(keys):
+        loaded.extend(keys)
+        return get_many(keys)
+
+    partition.data.get_many = spy
+    res = partition.all(root_verify_key, order_by=NamePartitionKey, limit=3, offset=2)
+    assert res.ok() == objs[::-1][2:5]
+    # the index table orders the page, only its objects are read
+    assert loaded == [obj.id for obj in objs[::-1][2:5]]
+
+    qks = QueryKeys(qks=[NamePartitionKey.with_obj(RangePredicate(lt="name5"))])
+    res = partition.find_index_or_search_keys(
+        root_verify_key, QueryKeys(qks=[]), qks, order_by=EmailPartitionKey, limit=2
+    )
+    assert res.ok() == objs[5:7]
+
+
+def test_sqlite_store_partition_query_plan(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace)
+    objs = [
+        MockIndexedObject(email=f"{i}@openmined.org", name=f"name{i % 3}")
+        for i in range(9)
+    ]
+    partition.set_many(root_verify_key, objs)
+
+    def matching(condition) -> set:
+        return {obj.id for i, obj in enumerate(objs) if condition(i)}
+
+    # the predicates are evaluated by the index tables
+    prefix = EmailPartitionKey.with_obj(PrefixPredicate(prefix="1@"))
+    assert find_ids(root_verify_key, partition, prefix) == {objs[1].id}
+    names = NamePartitionKey.with_obj(InPredicate(values=["name0", "name1"]))
+    assert find_ids(root_verify_key, partition, names) == matching(lambda i: i % 3 < 2)
+    names = NamePartitionKey.with_obj(RangePredicate(gt="name0", lte="name2"))
+    assert find_ids(root_verify_key, partition, names) == matching(lambda i: i % 3 > 0)
+
+    index_qks = QueryKeys(qks=[EmailPartitionKey.with_obj(PrefixPredicate(prefix=""))])
+    search_qks = QueryKeys(qks=[NamePartitionKey.with_obj("name0")])
+    plan = partition.plan(index_qks, search_qks)
+    # the most selective key is evaluated first
+    assert [(step.qk.key, step.estimate) for step in plan.steps] == [
+        ("name", 3),
+        ("email", 9),
+    ]
+    explain = partition.explain(index_qks, search_qks).ok()
+    assert explain.startswith("1. searchable key name == 'name0': ~3 objects")
+    assert find_ids(root_verify_key, partition, *index_qks.all, *search_qks.all) == (
+        matching(lambda i: i % 3 == 0)
+    )
+
+
+def test_sqlite_store_partition_cache(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    partition = indexed_partition(root_verify_key, sqlite_workspace, CacheConfig())
+    obj = MockIndexedObject(email="a@openmined.org", name="x")
+    partition.set(root_verify_key, obj)
+
+    loaded = []
+    get_many = partition.data.get_many
+
+    def spy(keys):
+        loaded.extend(keys)
+        return get_many(keys)
+
+    partition.data.get_many = spy
+    first = partition.get(root_verify_key, obj.id).ok()
+    # the other reads are served by the cache, without deserializing the object,
+    # from any thread
+    assert partition.get(root_verify_key, obj.id).ok() == first
+    thread = Thread(target=partition.all, args=(root_verify_key,))
+    thread.start()
+    thread.join()
+    assert partition.all(root_verify_key).ok() == [first]
+    assert loaded == [obj.id]
+    assert partition.cache.metrics["hits"] == 3
+
+    # the cached object is not changed by its readers
+    first.name = "changed"
+    assert partition.get(root_verify_key, obj.id).ok().name == "x"
+
+    # a write invalidates the cached object
+    qk = partition.store_query_key(obj)
+    partition.update(root_verify_key, qk, MockIndexedObject(email=obj.email, name="y"))
+    assert partition.get(root_verify_key, obj.id).ok().name == "y"
+    assert loaded == [obj.id, obj.id]
+
+    # so does a write from another connection to the database
+    other = indexed_partition(root_verify_key, sqlite_workspace)
+    update = MockIndexedObject(email=obj.email, name="z")
+    thread = Thread(target=other.update, args=(root_verify_key, qk, update))
+    thread.start()
+    thread.join()
+    assert partition.get(root_verify_key, obj.id).ok().name == "z"
+
+    partition.delete(root_verify_key, qk)
+    assert partition.get(root_verify_key, obj.id).is_err()
+    assert len(partition.cache) == 0
+
+
+def test_sqlite_document_store_snapshot_restore(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    settings = PartitionSettings(name="test", object_type=MockObjectType)
+    partition = store.partition(settings)
+    for idx in range(REPEATS):
+        assert partition.set(root_verify_key, MockSyftObject(data=idx)).is_ok()
+
+    def write() -> None:
+        for idx in range(REPEATS, 2 * REPEATS):
+            partition.set(root_verify_key, MockSyftObject(data=idx))
+
+    # the snapshot is taken while another connection keeps writing
+    thread = Thread(target=write)
+    thread.start()
+    res = store.snapshot()
+    thread.join()
+    assert res.is_ok()
+    snapshot = res.ok()
+
+    workspace, _ = sqlite_workspace
+    fresh = sqlite_document_store_fn(root_verify_key, (workspace, generate_db_name()))
+    assert fresh.restore(snapshot).is_ok()
+    restored = sorted(
+        obj.data for obj in fresh.partition(settings).all(root_verify_key).ok()
+    )
+    # the writes committed before the snapshot, in order
+    assert REPEATS <= len(restored) <= 2 * REPEATS
+    assert restored == list(range(len(restored)))
+
+    assert store.restore(snapshot).is_ok()
+    assert len(partition.all(root_verify_key).ok()) == len(restored)
+
+
+def test_sqlite_store_partition_permission_index(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    workspace, db_name = sqlite_workspace
+    store_config = SQLiteStoreConfig(
+        client_config=SQLiteStoreClientConfig(filename=db_name, path=workspace)
+    )
+    settings = PartitionSettings(name="test", object_type=MockObjectType)
+    user_key = SyftSigningKey.generate().verify_key
+
+    # the permissions of a database written before the index are imported
+    legacy_uid = UID()
+    legacy = SQLiteBackingStore("permissions", settings, store_config, ddtype=set)
+    legacy[legacy_uid] = {f"{user_key.verify}_READ"}
+
+    partition = SQLiteStorePartition(
+        root_verify_key, settings=settings, store_config=store_config
+    )
+    assert partition.has_permission(
+        ActionObjectREAD(uid=legacy_uid, credentials=user_key)
+    )
+
+    objs = [MockSyftObject(data=idx) for idx in range(REPEATS)]
+    assert all(res.is_ok() for res in partition.set_many(root_verify_key, objs).ok())
+    partition.add_permissions(
+        [ActionObjectREAD(uid=obj.id, credentials=user_key) for obj in objs[::2]]
+    )
+
+    readable = {obj.id for obj in partition.all(user_key).ok()}
+    assert readable == {obj.id for obj in objs[::2]}
+    assert partition.permissions.uids_with(
+        ActionObjectREAD(uid=None, credentials=user_key)
+    ) == readable | {legacy_uid}
@@ -1,5 +1,6 @@
 # stdlib
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -185,7 +186,9 @@ def test_userservice_get_all_success(
     mock_get_all_output = [guest_user, admin_user]
     expected_output = [x.to(UserView) for x in mock_get_all_output]
 
-    def mock_get_all(credentials: SyftVerifyKey) -> Ok:
+    def mock_get_all(
+        credentials: SyftVerifyKey, limit: Optional[int] = None, offset: int = 0
+    ) -> Ok:
         return Ok(mock_get_all_output)
 
     monkeypatch.setattr(user_service.stash, "get_all", mock_get_all)
@@ -202,7 +205,9 @@ def test_userservice_get_all_error(
 ) -> None:
     expected_output_msg = "No users exists"
 
-    def mock_get_all(credentials: SyftVerifyKey) -> Err:
+    def mock_get_all(
+        credentials: SyftVerifyKey, limit: Optional[int] = None, offset: int = 0
+    ) -> Err:
         return Err("")
 
     monkeypatch.setattr(user_service.stash, "get_all", mock_get_all)